@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Benchmark both deck generators on synthetic markdown corpora
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_REPEAT = 5
+DEFAULT_SEED = 1234
+
+# Executive deck variants: the slides built (None for all) and the factor
+# the default business data's yearly numbers are scaled by (None: as is)
+EXEC_VARIANTS = {
+    'full': (None, None),
+    'charts': (('add_business_model', 'add_roi_projections'), None),
+    'scaled-data': (None, 10),
+}
+
+WORDS = (
+    'account balance transfer payment ledger customer portfolio secure token '
+    'session deploy cluster latency cache request response schema migration '
+    'service gateway audit report goal budget currency exchange rate market '
+    'invest savings monitor alert container pipeline release rollback'
+).split()
+
+CODE_SAMPLES = {
+    'python': [
+        'def transfer(src, dst, amount):',
+        '    if amount <= 0:',
+        '        raise ValueError("amount must be positive")',
+        '    src.balance -= amount',
+        '    dst.balance += amount',
+        '    return {"from": src.id, "to": dst.id, "amount": amount}',
+    ],
+    'javascript': [
+        "const express = require('express');",
+        'const router = express.Router();',
+        "router.get('/accounts/:id', auth, async (req, res) => {",
+        '  const account = await Account.findByPk(req.params.id);',
+        '  res.json(account);',
+        '});',
+    ],
+    'bash': [
+        'docker build -t bankapp .',
+        'aws ecr get-login-password | docker login --username AWS',
+        'docker push "$ECR_REPO:latest"',
+        'aws ecs update-service --cluster bankapp --force-new-deployment',
+    ],
+}
+
+
+def _phrase(rng, low, high):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _bullet(rng):
+    """A bullet line with the occasional inline formatting"""
+    text = _phrase(rng, 3, 12)
+    style = rng.random()
+    if style < 0.2:
+        text = f"**{_phrase(rng, 1, 2)}** - {text}"
+    elif style < 0.3:
+        text = f"{text} `{rng.choice(WORDS)}()`"
+    elif style < 0.35:
+        text = f"[{_phrase(rng, 1, 3)}](https://example.com/{rng.choice(WORDS)}) {text}"
+    return text
+
+
+def synthetic_slide(rng, number):
+    """Markdown for one slide: mostly bullets, with code, tables and prose"""
+    lines = [f"## Slide {number}: {_phrase(rng, 2, 4).title()}", '']
+    kind = rng.random()
+    if kind < 0.6:
+        for i in range(rng.randint(3, 8)):
+            indent = '  ' if i and rng.random() < 0.25 else ''
+            lines.append(f"{indent}- {_bullet(rng)}")
+    elif kind < 0.8:
+        lang = rng.choice(sorted(CODE_SAMPLES))
+        sample = CODE_SAMPLES[lang]
+        lines.append(_phrase(rng, 4, 10).capitalize() + ':')
+        lines.append('')
+        lines.append(f"```{lang}")
+        lines.extend(sample[i % len(sample)] for i in range(rng.randint(4, 24)))
+        lines.append('```')
+    elif kind < 0.95:
+        cols = rng.randint(3, 5)
+        lines.append('| ' + ' | '.join(rng.choice(WORDS).title() for _ in range(cols)) + ' |')
+        lines.append('|' + '---|' * cols)
+        for _ in range(rng.randint(3, 10)):
+            lines.append('| ' + ' | '.join(_phrase(rng, 1, 4) for _ in range(cols)) + ' |')
+    else:
+        for _ in range(rng.randint(1, 3)):
+            lines.append(_phrase(rng, 20, 50).capitalize() + '.')
+            lines.append('')
+    return '\n'.join(lines)
+
+
+def synthetic_deck(slide_count, seed=DEFAULT_SEED):
+    """Markdown text for a deck of slide_count slides, the same for a given seed"""
+    rng = random.Random(f"{seed}:{slide_count}")
+    slides = [synthetic_slide(rng, i + 1) for i in range(slide_count)]
+    return '# Synthetic Deck\n\n---\n\n' + '\n\n---\n\n'.join(slides) + '\n'
+
+
+def reset_peak_rss():
+    """Reset the kernel's peak RSS counter where supported (Linux 4.0+)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+@contextlib.contextmanager
+def phase(results, name):
+    """Time a phase and record its wall time and peak RSS"""
+    per_phase = reset_peak_rss()
+    start = time.perf_counter()
+    yield
+    results[f"{name}_s"] = round(time.perf_counter() - start, 6)
+    # Without a resettable counter this is the process peak so far
+    results[f"{name}_peak_rss_mb"] = round(peak_rss_mb(), 1)
+    results[f"{name}_peak_rss_reset"] = per_phase
+
+
+def bench_markdown(slide_count, seed):
+    """Parse, build and save one synthetic deck (runs in a fresh process)"""
+    from convert_to_ppt import build_presentation, parse_markdown, save_presentation
+
+    results = {'case': 'markdown', 'slides': slide_count, 'seed': seed}
+    with tempfile.TemporaryDirectory() as tmp:
+        md_file = os.path.join(tmp, 'deck.md')
+        with open(md_file, 'w', encoding='utf-8') as f:
+            f.write(synthetic_deck(slide_count, seed))
+        out_file = os.path.join(tmp, 'deck.pptx')
+        results['input_bytes'] = os.path.getsize(md_file)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            with phase(results, 'parse'):
+                slides = parse_markdown(md_file)
+            with phase(results, 'build'):
+                prs = build_presentation(slides)
+            with phase(results, 'save'):
+                save_presentation(prs, out_file)
+        results['output_slides'] = len(prs.slides)
+        results['output_bytes'] = os.path.getsize(out_file)
+    return results
+
+
+def bench_direct(slide_count, seed):
+    """Stream one synthetic deck through the direct writer (runs in a fresh process)
+
+    Parsing, building and saving are interleaved slide by slide, so they
+    are timed as one 'stream' phase.
+    """
+    from convert_to_ppt import MarkdownSlides, write_direct
+
+    results = {'case': 'markdown-direct', 'slides': slide_count, 'seed': seed}
+    with tempfile.TemporaryDirectory() as tmp:
+        md_file = os.path.join(tmp, 'deck.md')
+        with open(md_file, 'w', encoding='utf-8') as f:
+            f.write(synthetic_deck(slide_count, seed))
+        out_file = os.path.join(tmp, 'deck.pptx')
+        results['input_bytes'] = os.path.getsize(md_file)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            with phase(results, 'stream'):
+                results['output_slides'] = write_direct(MarkdownSlides(md_file), out_file)
+        results['output_bytes'] = os.path.getsize(out_file)
+    return results
+
+
+def scaled_business_data(factor):
+    """The default business data with users, revenue and costs scaled by factor"""
+    from business_data import load_business_data
+
+    data = load_business_data()
+    for year in data['projections']:
+        for field in ('users', 'revenue', 'costs'):
+            year[field] *= factor
+    return data
+
+
+def bench_exec(variant, run):
+    """Build and save one EXEC_VARIANTS variant of the executive deck (runs in a fresh process)"""
+    from create_exec_ppt import build_exec_presentation
+
+    only, scale = EXEC_VARIANTS[variant]
+    results = {'case': 'exec', 'variant': variant, 'run': run}
+    with tempfile.TemporaryDirectory() as tmp:
+        out_file = os.path.join(tmp, 'exec.pptx')
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            data = None if scale is None else scaled_business_data(scale)
+            with phase(results, 'build'):
+                prs = build_exec_presentation(only=only, data=data)
+            with phase(results, 'save'):
+                prs.save(out_file)
+        results['output_slides'] = len(prs.slides)
+        results['output_bytes'] = os.path.getsize(out_file)
+    return results
+
+
+def _start_cold(cache_dir):
+    """Pool initializer: point the slide cache and template snapshots at cache_dir"""
+    os.environ['PPTX_CACHE_DIR'] = cache_dir
+
+
+def run_isolated(func, *args):
+    """Run a benchmark in a fresh interpreter so RSS and caches start cold
+
+    The interpreter gets an empty cache directory of its own, so it
+    compiles the template rather than loading a snapshot an earlier run
+    left behind.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            ctx.Pool(1, _start_cold, (cache_dir,)) as pool:
+        return pool.apply(func, args)
+
+
+def environment():
+    """Metadata identifying the machine and revision a run was made on"""
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    try:
+        import pptx
+        pptx_version = pptx.__version__
+    except ImportError:
+        pptx_version = None
+    return {
+        'revision': revision,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'python_pptx': pptx_version,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def summarize_exec(variant, runs):
+    """Median and best times over one exec-deck variant's repeats"""
+    summary = {'case': 'exec-summary', 'variant': variant, 'runs': len(runs)}
+    for name in ('build_s', 'save_s'):
+        values = [r[name] for r in runs]
+        summary[f"median_{name}"] = round(statistics.median(values), 6)
+        summary[f"min_{name}"] = min(values)
+    summary['max_peak_rss_mb'] = max(r['save_peak_rss_mb'] for r in runs)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated synthetic deck sizes in slides '
+                             f"(default: {','.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"Executive deck runs per variant (default: {DEFAULT_REPEAT}; "
+                             "0 skips it)")
+    parser.add_argument('--variants', default=','.join(EXEC_VARIANTS),
+                        help='Comma-separated executive deck variants '
+                             f"(default: {','.join(EXEC_VARIANTS)})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"Seed for the synthetic corpus (default: {DEFAULT_SEED})")
+    parser.add_argument('-o', '--output',
+                        help='Write JSON results to this file (default: stdout)')
+    parser.add_argument('--backend', choices=('pptx', 'direct', 'both'), default='both',
+                        help='Markdown backend(s) to benchmark (default: %(default)s)')
+    parser.add_argument('--dump-deck', type=int, metavar='SLIDES',
+                        help='Print a synthetic deck of this size as markdown and exit')
+    args = parser.parse_args(argv)
+
+    if args.dump_deck is not None:
+        sys.stdout.write(synthetic_deck(args.dump_deck, args.seed))
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    variants = [v.strip() for v in args.variants.split(',') if v.strip()]
+    unknown = [v for v in variants if v not in EXEC_VARIANTS]
+    if unknown:
+        parser.error(f"unknown variant {unknown[0]!r} (choose from {', '.join(EXEC_VARIANTS)})")
+    report = {'environment': environment(), 'results': []}
+
+    for size in sizes:
+        if args.backend in ('pptx', 'both'):
+            print(f"⏱️  Markdown deck, {size} slides...", file=sys.stderr)
+            result = run_isolated(bench_markdown, size, args.seed)
+            report['results'].append(result)
+            print(f"   parse {result['parse_s']:.3f}s  build {result['build_s']:.3f}s  "
+                  f"save {result['save_s']:.3f}s  peak {result['save_peak_rss_mb']:.0f} MiB",
+                  file=sys.stderr)
+        if args.backend in ('direct', 'both'):
+            print(f"⏱️  Markdown deck, {size} slides, direct writer...", file=sys.stderr)
+            result = run_isolated(bench_direct, size, args.seed)
+            report['results'].append(result)
+            print(f"   stream {result['stream_s']:.3f}s  peak {result['stream_peak_rss_mb']:.0f} MiB",
+                  file=sys.stderr)
+
+    for variant in variants if args.repeat > 0 else ():
+        print(f"⏱️  Executive deck, {variant}, {args.repeat} runs...", file=sys.stderr)
+        runs = [run_isolated(bench_exec, variant, run) for run in range(args.repeat)]
+        summary = summarize_exec(variant, runs)
+        report['results'].extend(runs)
+        report['results'].append(summary)
+        print(f"   build {summary['median_build_s']:.3f}s  save {summary['median_save_s']:.3f}s "
+              f"(median)  peak {summary['max_peak_rss_mb']:.0f} MiB", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+        print(f"✅ Results written to: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
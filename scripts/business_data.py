@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Business-case numbers for the executive deck, from a JSON or CSV file
+
+The revenue mix, yearly projections, unit economics and the investment
+live in a data file; the business model and ROI slides chart them, so
+updating the numbers means editing data, not code. Money is in millions
+of rand.
+
+JSON holds the sections directly (see exec_business.json). CSV is one
+value per row, with the columns section, label, field and value. The
+label names the record within a list section and is blank in the others:
+
+    section,label,field,value
+    revenue_streams,Transaction Fees,share,60
+    revenue_streams,Transaction Fees,description,R2-R5 per transaction
+    projections,Year 1,revenue,4.8
+    investment,,amount,15
+"""
+
+import csv
+import importlib.util
+import json
+import os
+from collections import namedtuple
+from itertools import accumulate
+
+# NumPy is optional; without it the series are worked out in plain
+# Python, in the same order of operations, so the numbers match.
+HAVE_NUMPY = importlib.util.find_spec('numpy') is not None
+
+EXEC_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'exec_business.json')
+
+# Sections that are lists of records, with the field their CSV label fills
+LIST_SECTIONS = {'revenue_streams': 'name', 'projections': 'year'}
+
+# The fields each section must have; all but TEXT_FIELDS are numbers
+FIELDS = {
+    'revenue_streams': ('name', 'share'),
+    'projections': ('year', 'users', 'revenue', 'costs'),
+    'unit_economics': ('break_even_month', 'cac', 'ltv'),
+    'investment': ('amount', 'stake', 'valuation', 'years'),
+}
+# Fields a section may have: a revenue stream's description, and an IRR
+# (in %) to quote as published rather than work out from the investment
+OPTIONAL_FIELDS = {'revenue_streams': ('description',), 'investment': ('irr',)}
+TEXT_FIELDS = {'name', 'year', 'description'}
+# Numbers that divide others, so must be above zero; the rest must not be negative
+POSITIVE_FIELDS = {'revenue', 'cac', 'amount', 'years'}
+# Decimal places the derived series keep, dropping float noise such as 2.5999999999999996
+DIGITS = 6
+
+# Yearly series; growth is None for the first year
+Projection = namedtuple('Projection', 'years users revenue costs profit margin growth '
+                                      'cumulative_profit')
+# What the investment returns: a multiple of the money in, and its annual rate
+Returns = namedtuple('Returns', 'multiple irr valuation years')
+
+
+def _number(text, where):
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"{where}: not a number: {text!r}") from None
+
+
+def _read_csv(f, path):
+    """The sections of a section,label,field,value CSV, shaped as the JSON is"""
+    data = {}
+    records = {}
+    for n, row in enumerate(csv.DictReader(f), 2):
+        where = f"{path}, line {n}"
+        try:
+            section, label, field, value = (row[k].strip() for k in
+                                            ('section', 'label', 'field', 'value'))
+        except (KeyError, AttributeError):
+            raise ValueError(f"{where}: expected the columns section, label, field, value") \
+                from None
+        if section in LIST_SECTIONS:
+            if not label:
+                raise ValueError(f"{where}: {section} rows need a label")
+            key = (section, label)
+            if key not in records:
+                records[key] = {LIST_SECTIONS[section]: label}
+                data.setdefault(section, []).append(records[key])
+            record = records[key]
+        else:
+            record = data.setdefault(section, {})
+        record[field] = value if field in TEXT_FIELDS else _number(value, where)
+    return data
+
+
+def _check(data, path):
+    """Raise ValueError unless data has every section and field FIELDS lists
+
+    Numbers are made floats, so JSON and CSV data chart the same.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected an object of sections, not {type(data).__name__}")
+    for section, fields in FIELDS.items():
+        if section not in data:
+            raise ValueError(f"{path}: no {section} section")
+        is_list = section in LIST_SECTIONS
+        records = data[section] if is_list else [data[section]]
+        if is_list and not isinstance(records, list):
+            raise ValueError(f"{path}: {section} is not a list")
+        if is_list and not records:
+            raise ValueError(f"{path}: {section} is empty")
+        for n, record in enumerate(records, 1):
+            where = f"{section} entry {n}" if is_list else section
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}: {where} is not an object: {record!r}")
+            for field in fields + OPTIONAL_FIELDS.get(section, ()):
+                if field not in record:
+                    if field not in fields:
+                        continue
+                    raise ValueError(f"{path}: {where} has no {field}")
+                value = record[field]
+                if field in TEXT_FIELDS:
+                    if not isinstance(value, str):
+                        raise ValueError(f"{path}: {where} {field} is not text: {value!r}")
+                    continue
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"{path}: {where} {field} is not a number: {value!r}")
+                if field in POSITIVE_FIELDS and not value > 0:
+                    raise ValueError(f"{path}: {where} {field} must be above zero: {value!r}")
+                if not value >= 0:
+                    raise ValueError(f"{path}: {where} {field} must not be negative: {value!r}")
+                record[field] = float(value)
+
+
+def load_business_data(path=EXEC_DATA):
+    """The sections of a .json or .csv business data file, as plain dicts and lists
+
+    Raises OSError if it cannot be read and ValueError if a section or
+    field is missing or malformed.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            data = _read_csv(f, path)
+        else:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}: {e}") from None
+    _check(data, path)
+    return data
+
+
+def _rounded(projection):
+    """projection with every number rounded to DIGITS places"""
+    years, *series = projection
+    return Projection(years, *(tuple(None if v is None else round(v, DIGITS) for v in values)
+                               for values in series))
+
+
+def returns(data):
+    """The Returns on data's investment: its stake (in %) of the target valuation
+
+    The IRR is the multiple's annual rate, unless the investment quotes one.
+    """
+    investment = data['investment']
+    multiple = investment['stake'] / 100 * investment['valuation'] / investment['amount']
+    if 'irr' in investment:
+        irr = investment['irr'] / 100
+    else:
+        irr = multiple ** (1 / investment['years']) - 1
+    return Returns(multiple, irr, investment['valuation'], investment['years'])
+
+
+def project(data):
+    """The Projection of data's yearly numbers, with profit, margin and growth in %"""
+    rows = data['projections']
+    years = tuple(p['year'] for p in rows)
+    if HAVE_NUMPY:
+        import numpy as np
+
+        users, revenue, costs = (np.array([p[k] for p in rows], dtype=float)
+                                 for k in ('users', 'revenue', 'costs'))
+        profit = revenue - costs
+        margin = profit / revenue * 100
+        growth = (revenue[1:] / revenue[:-1] - 1) * 100
+        cumulative = np.cumsum(profit)
+        return _rounded(Projection(years, users.tolist(), revenue.tolist(), costs.tolist(),
+                                   profit.tolist(), margin.tolist(), [None] + growth.tolist(),
+                                   cumulative.tolist()))
+
+    users, revenue, costs = (tuple(p[k] for p in rows)
+                             for k in ('users', 'revenue', 'costs'))
+    profit = tuple(r - c for r, c in zip(revenue, costs))
+    return _rounded(Projection(
+        years, users, revenue, costs, profit,
+        tuple(p / r * 100 for p, r in zip(profit, revenue)),
+        (None,) + tuple((b / a - 1) * 100 for a, b in zip(revenue, revenue[1:])),
+        tuple(accumulate(profit)),
+    ))
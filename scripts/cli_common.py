@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Helpers the deck command lines share: slide ranges and atomic output
+"""
+
+import os
+import tempfile
+
+
+def parse_slide_ranges(text):
+    """Slide numbers from '3-7,27' (1-based, in the order given)"""
+    numbers = []
+    for item in text.split(','):
+        first, _, last = item.strip().partition('-')
+        if not first.isdigit() or (last and not last.isdigit()):
+            raise ValueError(f"bad slide range {item.strip()!r}")
+        first = int(first)
+        last = int(last) if last else first
+        if first < 1 or last < first:
+            raise ValueError(f"bad slide range {item.strip()!r}")
+        numbers.extend(range(first, last + 1))
+    return numbers
+
+
+def write_atomic(output_file, write):
+    """Run write(f) against a path atomically (write then rename) or a file-like object"""
+    if not isinstance(output_file, str):
+        write(output_file)
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_file) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Syntax highlighting of fenced code blocks as coloured python-pptx runs
+"""
+
+import copy
+import importlib.util
+from functools import lru_cache
+
+from ooxml_writer import xml_text
+
+# Highlighting is optional; without Pygments code renders in one colour.
+# It is only imported once a deck has a code block with a language tag.
+HAVE_PYGMENTS = importlib.util.find_spec('pygments') is not None
+
+STYLE_NAME = 'friendly'  # Light-background Pygments style
+CODE_FONT = 'Courier New'
+
+
+def settings():
+    """Highlighting options that affect rendered output (for cache keys)"""
+    return (STYLE_NAME, HAVE_PYGMENTS)
+
+
+@lru_cache(maxsize=64)
+def _lexer(lang):
+    """Cached lexer for a fence language tag, or None for plain text"""
+    if not HAVE_PYGMENTS or not lang:
+        return None
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(lang, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _token_style(ttype, default_color):
+    """(colour, bold, italic) for a Pygments token type in STYLE_NAME"""
+    from pygments.styles import get_style_by_name
+
+    style_class = get_style_by_name(STYLE_NAME)
+    while not style_class.styles_token(ttype) and ttype.parent is not None:
+        ttype = ttype.parent  # Lexer-specific subtypes fall back to their parent
+    style = style_class.style_for_token(ttype)
+    return (style['color'] or default_color, bool(style['bold']), bool(style['italic']))
+
+
+@lru_cache(maxsize=1024)
+def _rpr_xml(color, bold, italic, size_pt, decls=''):
+    """Serialized a:rPr for one run style"""
+    return (
+        f'<a:rPr{decls} lang="en-US" sz="{size_pt * 100}" b="{int(bold)}" i="{int(italic)}">'
+        f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+        f'<a:latin typeface="{CODE_FONT}"/>'
+        f'</a:rPr>'
+    )
+
+
+@lru_cache(maxsize=1024)
+def _rpr_prototype(color, bold, italic, size_pt):
+    """Pre-built a:rPr element for one run style, cloned for every run"""
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+
+    return parse_xml(_rpr_xml(color, bold, italic, size_pt, ' ' + nsdecls('a')))
+
+
+def highlight_lines(code, lang, default_color):
+    """Split code into lines of (text, style) runs, merging same-style tokens"""
+    lexer = _lexer(lang)
+    plain = (default_color, False, False)
+    if lexer is None:
+        return [[(line, plain)] if line else [] for line in code.split('\n')]
+
+    lines = [[]]
+    for ttype, value in lexer.get_tokens(code):
+        style = _token_style(ttype, default_color)
+        for i, part in enumerate(value.split('\n')):
+            if i:
+                lines.append([])
+            if not part:
+                continue
+            line = lines[-1]
+            # Whitespace looks the same in any colour, so it never starts a run
+            if line and (line[-1][1] == style or part.isspace()):
+                line[-1] = (line[-1][0] + part, line[-1][1])
+            else:
+                line.append((part, style))
+    return lines
+
+
+def add_code_runs(paragraph, code, lang, size_pt, default_color):
+    """Fill a paragraph with highlighted code, one line break per source line
+
+    Runs are appended as pre-styled XML, skipping the per-run font proxies.
+    """
+    p = paragraph._p
+    for i, line in enumerate(highlight_lines(code, lang, default_color)):
+        if i:
+            p.add_br()
+        for text, (color, bold, italic) in line:
+            r = p.add_r()
+            r.insert(0, copy.deepcopy(_rpr_prototype(color, bold, italic, size_pt)))
+            r.text = text  # Escapes control characters as _xHHHH_, as _Run.text does
+
+
+@lru_cache(maxsize=256)
+def code_runs_xml(code, lang, size_pt, default_color):
+    """The runs and line breaks add_code_runs would append, as an XML string"""
+    parts = []
+    for i, line in enumerate(highlight_lines(code, lang, default_color)):
+        if i:
+            parts.append('<a:br/>')
+        for text, (color, bold, italic) in line:
+            parts.append(f'<a:r>{_rpr_xml(color, bold, italic, size_pt)}'
+                         f'<a:t>{xml_text(text)}</a:t></a:r>')
+    return ''.join(parts)
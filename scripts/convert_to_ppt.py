@@ -3,166 +3,1423 @@
 Convert Markdown presentation to PowerPoint
 """
 
-import re
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
-
-def parse_markdown(md_file):
-    """Parse markdown file and extract slides"""
-    with open(md_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+import argparse
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import string
+import sys
+import time
+from collections import namedtuple
+from functools import lru_cache
 
-    # Split by slide separator (---) with any whitespace
-    slides_content = re.split(r'\n\s*---\s*\n', content)
+import code_highlight
+from cli_common import parse_slide_ranges, write_atomic
+from code_highlight import CODE_FONT, add_code_runs, code_runs_xml
+from deck_profile import NO_PROFILER, Profiler, save_profiled
+from html_preview import PAGE_TAIL, Theme, page_head, slide_html
+from ooxml_writer import (DirectDeck, SlideLinks, SlideRecorder, base_package, copy_list_style,
+                          paragraph_xml, reproducible_date_time, run_xml, save_canonical,
+                          textbox_xml)
+from parallel_render import batches, graft_slides, map_ordered, slide_fragments
+from ppt_template import load_template
+from slide_cache import DEFAULT_CACHE_DIR, SlideCache
+from slide_images import IMAGE_DPI, ImagePipeline
+from slide_ir import (Bullet, CodeBlock, Deck, Heading, Image, Paragraph, Run, Slide, Table,
+                      style_key)
+from slide_tables import (add_table, column_widths, parse_alignments, row_height, split_row,
+                          table_xml)
+from text_metrics import EMU_PER_PT, LINE_SPACING, PARAGRAPH_SPACING, count_lines, text_height
 
-    slides = []
-    for slide_content in slides_content:
-        slide_content = slide_content.strip()
-        # Skip empty slides and header
-        if not slide_content or slide_content.startswith('# BankApp - Technical Presentation'):
-            continue
+# Bump when rendering changes so cached slides are not reused
+RENDER_VERSION = 10
 
-        slides.append(slide_content)
+SLIDE_WIDTH = 9144000   # 10in in EMU, as pptx.util.Inches(10)
+SLIDE_HEIGHT = 6858000  # 7.5in
+SLIDE_LAYOUT = 'Title and Content'
 
-    return slides
+# Define colors (hex RGB, as RGBColor.from_string takes them)
+TITLE_COLOR = '0284C7'   # Blue
+TEXT_COLOR = '374151'    # Dark gray
+ACCENT_COLOR = '10B981'  # Green
+CODE_COLOR = '586E75'
+HTML_THEME = Theme(TITLE_COLOR, TEXT_COLOR, ACCENT_COLOR, CODE_COLOR)
 
-def parse_slide_content(content):
-    """Parse individual slide content"""
-    lines = content.split('\n')
-    title = ""
-    body_lines = []
-    code_blocks = []
+TITLE_SIZE = 40
+BODY_SIZE = 16
+CODE_SIZE = 12
+
+# What to do with content that does not fit on a slide
+OVERFLOW_MODES = ('paginate', 'notes')
+BACKENDS = ('pptx', 'direct', 'html')  # python-pptx object model, ooxml_writer, or a preview
+OUTPUT_EXTENSIONS = {'pptx': '.pptx', 'direct': '.pptx', 'html': '.html'}
+
+# python-pptx default body insets and bullet indents, used when the
+# template's master does not define them
+TEXT_INSET_X = 91440
+TEXT_INSET_Y = 45720
+DEFAULT_LEVEL_MARGINS = (342900, 742950, 1143000, 1600200, 2057400)
+
+# Usable area of the body placeholder in points, with the text width left
+# at each bullet level
+BodyGeometry = namedtuple('BodyGeometry', 'left top width height level_widths')
+
+# Text below the body placeholder in a box of its own: a code block, or the
+# text after one. top and height are in points, of the text inside the box.
+FlowBox = namedtuple('FlowBox', 'top height blocks')
 
-    in_code_block = False
+BULLET_MARKERS = ('- ', '* ', '+ ')
+
+# Blocks drawn as their own shapes below the body text; each ends its page
+FLOAT_KINDS = ('table', 'image')
+
+# An image needs at least this share of the body height to go on a page
+IMAGE_MIN_FRACTION = 0.4
+
+
+def tokenize_lines(lines, base_dir=None):
+    """Tokenize markdown lines into slide events in a single pass
+
+    Yields slide_ir blocks, with None marking a slide separator (---).
+    Code fences keep their lines verbatim (minus the fence indentation) so
+    ASCII diagrams survive; bullet depth comes from the leading
+    indentation. Relative image paths are resolved against base_dir.
+    """
+    fence = None
+    fence_indent = 0
+    code_lang = ''
     code_lines = []
+    table_lines = []
 
-    for line in lines:
-        line = line.strip()
+    for raw in lines:
+        line = raw.rstrip('\r\n').expandtabs(4)
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip(' '))
 
-        # Handle code blocks
-        if line.startswith('```'):
-            if in_code_block:
-                code_blocks.append('\n'.join(code_lines))
+        # Inside a fenced code block everything is literal until the fence closes
+        if fence is not None:
+            if stripped.startswith(fence) and not stripped.strip('`~'):
+                yield CodeBlock('\n'.join(code_lines), code_lang)
+                fence = None
                 code_lines = []
-                in_code_block = False
             else:
-                in_code_block = True
+                code_lines.append(line[min(fence_indent, indent):] if stripped else '')
+            continue
+
+        # Consecutive pipe rows are collected and emitted as one table
+        if stripped.startswith('|'):
+            table_lines.append(stripped)
+            continue
+        if table_lines:
+            yield from table_blocks(table_lines)
+            table_lines = []
+
+        if not stripped:
+            continue
+
+        if stripped.startswith('```') or stripped.startswith('~~~'):
+            fence = stripped[:3]
+            fence_indent = indent
+            code_lang = stripped[3:].strip().split(' ')[0]
+            continue
+
+        # Slide separator
+        if stripped == '---':
+            yield None
+            continue
+
+        if stripped.startswith('#'):
+            level = len(stripped) - len(stripped.lstrip('#'))
+            text = stripped[level:].strip()
+            if level == 1 or not text:
+                continue  # Document title, not a slide
+            yield Heading(text)
+            continue
+
+        # An image on a line of its own: ![alt](path "optional title")
+        if stripped.startswith('![') and stripped.endswith(')') and '](' in stripped:
+            alt, _, src = stripped[2:-1].partition('](')
+            src = src.split(' "')[0].strip()
+            if '://' in src:
+                yield Paragraph(f"[{alt or src}]({src})")
+            else:
+                yield Image(os.path.join(base_dir or '', src), alt)
+            continue
+
+        if stripped.startswith(BULLET_MARKERS):
+            yield Bullet(stripped[2:].strip(), indent // 2)
+        else:
+            yield Paragraph(stripped)
+
+    if table_lines:
+        yield from table_blocks(table_lines)
+
+    # Unterminated fence: keep what we have rather than dropping it
+    if fence is not None:
+        yield CodeBlock('\n'.join(code_lines), code_lang)
+
+
+def table_blocks(lines):
+    """Turn collected pipe rows into a table block, or paragraphs if they aren't one"""
+    alignments = parse_alignments(lines[1]) if len(lines) > 1 else None
+    if alignments is None:
+        for line in lines:
+            yield Paragraph(line)
+        return
+
+    header = split_row(lines[0])
+    cols = len(header)
+    rows = [tuple(header)]
+    for line in lines[2:]:
+        cells = split_row(line)[:cols]
+        rows.append(tuple(cells + [''] * (cols - len(cells))))
+    yield Table(tuple(rows), alignments[:cols].ljust(cols, 'l'))
+
+
+def iter_slides(lines, base_dir=None):
+    """Group tokenized lines into Slides, skipping untitled ones
+
+    The first heading after each separator is the slide title.
+    """
+    title = None
+    blocks = []
+    for block in tokenize_lines(lines, base_dir):
+        if block is None:
+            if title:
+                yield Slide(title, blocks)
+            title = None
+            blocks = []
+        elif block.kind == 'heading' and title is None:
+            title = block.text
+        else:
+            blocks.append(block)
+    if title:
+        yield Slide(title, blocks)
+
+
+def parse_markdown(md_file, profiler=NO_PROFILER):
+    """Parse markdown file into a Deck"""
+    with profiler.phase('read'):
+        with open(md_file, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    with profiler.phase('tokenize'):
+        return Deck(iter_slides(lines, os.path.dirname(os.path.abspath(md_file))))
+
+
+class MarkdownSlides:
+    """The slides of a markdown file, parsed lazily on each iteration"""
+
+    def __init__(self, md_file, profiler=NO_PROFILER):
+        self.md_file = md_file
+        self.profiler = profiler
+
+    def __iter__(self):
+        with open(self.md_file, 'r', encoding='utf-8') as f:
+            slides = iter_slides(f, os.path.dirname(os.path.abspath(self.md_file)))
+            while True:
+                with self.profiler.phase('tokenize'):
+                    slide = next(slides, None)
+                if slide is None:
+                    return
+                yield slide
+
+
+def slide_offsets(f):
+    """Byte ranges (start, end) of the titled slides in a markdown file opened in binary
+
+    Applies tokenize_lines' rules for code fences, separators and headings
+    to each line without tokenizing anything else, so the text of range n
+    parses (with iter_slides) to the nth slide of the whole file.
+    """
+    offsets = []
+    start = offset = 0
+    titled = False
+    fence = None
+    for raw in f:
+        line_start = offset
+        offset += len(raw)
+        stripped = raw.decode('utf-8').strip()
+
+        if fence is not None:
+            if stripped.startswith(fence) and not stripped.strip('`~'):
+                fence = None
+        elif stripped.startswith('|'):
             continue
+        elif stripped.startswith('```') or stripped.startswith('~~~'):
+            fence = stripped[:3]
+        elif stripped == '---':
+            if titled:
+                offsets.append((start, line_start))
+            start = offset
+            titled = False
+        elif not titled and stripped.startswith('#'):
+            level = len(stripped) - len(stripped.lstrip('#'))
+            titled = level != 1 and bool(stripped[level:].strip())
+    if titled:
+        offsets.append((start, offset))
+    return offsets
+
+
+class NoSuchSlide(ValueError):
+    """A selected slide number is past the end of the deck"""
+
+
+class MarkdownDeck:
+    """Random access to the slides of a markdown file
+
+    Opening one only indexes where each slide starts and ends (see
+    slide_offsets); a slide is read and tokenized when it is asked for,
+    so rendering a few slides of a big deck skips parsing the rest.
+    numbers picks slides (1-based, in the order given, as parsed by
+    cli_common.parse_slide_ranges); iteration yields just those, afresh
+    each time, and len() counts them.
+    """
+
+    def __init__(self, md_file, numbers=None, profiler=NO_PROFILER):
+        self.md_file = md_file
+        self.base_dir = os.path.dirname(os.path.abspath(md_file))
+        self.profiler = profiler
+        with profiler.phase('index'):
+            with open(md_file, 'rb') as f:
+                self.offsets = slide_offsets(f)
+        if numbers is None:
+            numbers = range(1, len(self.offsets) + 1)
+        bad = [n for n in numbers if not 1 <= n <= len(self.offsets)]
+        if bad:
+            raise NoSuchSlide(f"{md_file} has {len(self.offsets)} slides, not {bad[0]}")
+        self.numbers = list(numbers)
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def __iter__(self):
+        with open(self.md_file, 'rb') as f:
+            for number in self.numbers:
+                yield self._read(f, number)
+
+    def slide(self, number):
+        """Slide number (1-based) of the whole file"""
+        with open(self.md_file, 'rb') as f:
+            return self._read(f, number)
+
+    def _read(self, f, number):
+        start, end = self.offsets[number - 1]
+        with self.profiler.phase('read'):
+            f.seek(start)
+            text = f.read(end - start).decode('utf-8')
+        with self.profiler.phase('tokenize'):
+            return next(iter_slides(io.StringIO(text), self.base_dir))
+
 
-        if in_code_block:
-            code_lines.append(line)
+def parse_slide_content(content):
+    """Parse individual slide content into a Slide"""
+    for slide in iter_slides(content.split('\n')):
+        return slide
+    return Slide('')
+
+
+@lru_cache(maxsize=8192)
+def parse_inline(text, link=None):
+    """Split a line into styled runs (bold, italic, code, links) in one scan
+
+    Delimiter searches only move forward and failed searches are
+    remembered, so unbalanced markers cannot cause backtracking. Emphasis
+    closes only with the character it opened with (* or _), and an
+    underscore inside a word stays literal; a marker that is never closed
+    is put back as literal text. A code span closes with a backtick run as
+    long as the one that opened it. Backslashes escape ASCII punctuation
+    only. Results are cached, since pagination, layout and rendering all
+    ask for the same lines.
+    """
+    runs = []
+    buf = []
+    bold = italic = False
+    bold_at = italic_at = (0, '')  # (runs index, marker) where emphasis opened
+    next_ticks = {}  # Backtick run length -> start of the next run that long, or None
+    next_bracket = next_paren = 0
+    n = len(text)
+    i = 0
+
+    def flush():
+        if buf:
+            runs.append(Run(''.join(buf), style_key(bold, italic), link))
+            buf.clear()
+
+    while i < n:
+        ch = text[i]
+
+        if ch == '\\' and i + 1 < n and text[i + 1] in string.punctuation:
+            buf.append(text[i + 1])
+            i += 2
             continue
 
-        # Extract title (## or ###)
-        if line.startswith('## '):
-            title = line[3:].strip()
-        elif line.startswith('### '):
-            if not title:
-                title = line[4:].strip()
+        if ch == '*' or ch == '_':
+            marker = ch * 2 if text.startswith(ch * 2, i) else ch
+            is_bold = len(marker) == 2
+            closing = bold if is_bold else italic
+            opened_with = (bold_at if is_bold else italic_at)[1]
+            before = text[i - 1] if i else ' '
+            after = text[i + len(marker)] if i + len(marker) < n else ' '
+            # Openers must touch the following word, closers the preceding one
+            # and the marker they close; underscores inside words (snake_case)
+            # stay literal
+            if (before.isspace() or opened_with != marker if closing else after.isspace()) or \
+                    (ch == '_' and (after if closing else before).isalnum()):
+                buf.append(marker)
+            elif closing and not buf and (bold_at if is_bold else italic_at)[0] == len(runs):
+                # Nothing between the markers, so they are not emphasis
+                buf.append(marker * 2)
+                if is_bold:
+                    bold = False
+                else:
+                    italic = False
             else:
-                body_lines.append(line)
-        elif line and not line.startswith('#'):
-            body_lines.append(line)
+                flush()
+                if is_bold:
+                    bold = not bold
+                    bold_at = (len(runs), marker)
+                else:
+                    italic = not italic
+                    italic_at = (len(runs), marker)
+            i += len(marker)
+            continue
+
+        if ch == '`':
+            end = i + 1
+            while end < n and text[end] == '`':
+                end += 1
+            ticks = end - i
+            close = next_ticks.get(ticks, end)
+            if close is not None and close < end:
+                close = end
+            while close is not None:
+                close = text.find('`' * ticks, close)
+                if close < 0:
+                    close = None
+                    break
+                run_end = close + ticks
+                while run_end < n and text[run_end] == '`':
+                    run_end += 1
+                if run_end - close == ticks:
+                    break
+                close = run_end
+            next_ticks[ticks] = close
+            if close is None:
+                buf.append(text[i:end])
+                i = end
+                continue
+            code = text[end:close]
+            # One space either side lets a span start or end with a backtick
+            if len(code) > 2 and code[0] == ' ' == code[-1] and code.strip(' '):
+                code = code[1:-1]
+            flush()
+            runs.append(Run(code, style_key(bold, italic, True), link))
+            i = close + ticks
+            continue
+
+        if ch == '[' and link is None:
+            if next_bracket is not None and next_bracket <= i:
+                next_bracket = text.find(']', i + 1)
+                if next_bracket < 0:
+                    next_bracket = None
+            close = next_bracket
+            if close is not None and text.startswith('(', close + 1):
+                if next_paren is not None and next_paren <= close:
+                    next_paren = text.find(')', close + 2)
+                    if next_paren < 0:
+                        next_paren = None
+                if next_paren is not None:
+                    flush()
+                    for run in parse_inline(text[i + 1:close], text[close + 2:next_paren]):
+                        runs.append(run.replace(style=style_key(run.bold or bold, run.italic or italic,
+                                                                run.code)))
+                    i = next_paren + 1
+                    continue
+
+        buf.append(ch)
+        i += 1
+
+    flush()
+
+    # Unclosed emphasis: restore the marker and drop the style it opened
+    opened = [(bold_at, 'bold')] if bold else []
+    if italic:
+        opened.append((italic_at, 'italic'))
+    for (start, marker), field in sorted(opened, reverse=True):
+        for j in range(start, len(runs)):
+            run = runs[j]
+            runs[j] = run.replace(style=style_key(run.bold and field != 'bold',
+                                                  run.italic and field != 'italic', run.code))
+        runs.insert(start, Run(marker, '', link))
+
+    return tuple(runs)
 
-    return title, body_lines, code_blocks
 
 def clean_markdown(text):
     """Remove markdown formatting"""
-    # Remove bold
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-    # Remove italic
-    text = re.sub(r'\*(.*?)\*', r'\1', text)
-    # Remove inline code
-    text = re.sub(r'`(.*?)`', r'\1', text)
-    # Remove links but keep text
-    text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', text)
-    return text
-
-def create_presentation(slides_data, output_file):
-    """Create PowerPoint presentation"""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-
-    # Define colors
-    TITLE_COLOR = RGBColor(2, 132, 199)  # Blue
-    TEXT_COLOR = RGBColor(55, 65, 81)    # Dark gray
-    ACCENT_COLOR = RGBColor(16, 185, 129) # Green
-
-    for slide_content in slides_data:
-        title, body_lines, code_blocks = parse_slide_content(slide_content)
-
-        if not title:
+    return ''.join(run.text for run in parse_inline(text))
+
+
+def add_runs(paragraph, runs):
+    """Append styled runs to a python-pptx paragraph"""
+    for run in runs:
+        r = paragraph.add_run()
+        r.text = run.text
+        if run.bold:
+            r.font.bold = True
+        if run.italic:
+            r.font.italic = True
+        if run.code:
+            r.font.name = CODE_FONT
+        if run.link:
+            r.hyperlink.address = run.link
+
+
+def body_geometry(snapshot, layout_name):
+    """Usable area of a template layout's body placeholder as a BodyGeometry"""
+    box, master_margins = snapshot.layout_bodies[layout_name]
+    if box is None:
+        raise ValueError(f"Template layout '{layout_name}' has no body placeholder")
+    left, top, width, height = box
+    margins = [default if margin is None else margin
+               for margin, default in zip(master_margins, DEFAULT_LEVEL_MARGINS)]
+
+    inner_width = width - 2 * TEXT_INSET_X
+    return BodyGeometry(
+        (left + TEXT_INSET_X) / EMU_PER_PT,
+        (top + TEXT_INSET_Y) / EMU_PER_PT,
+        inner_width / EMU_PER_PT,
+        (height - 2 * TEXT_INSET_Y) / EMU_PER_PT,
+        tuple((inner_width - m) / EMU_PER_PT for m in margins),
+    )
+
+
+@lru_cache(maxsize=8192)
+def block_height(block, geometry):
+    """Estimated rendered height of a block in points"""
+    widths = geometry.level_widths
+    width = widths[min(block.depth, len(widths) - 1)]
+    if block.kind == 'image':
+        return geometry.height * IMAGE_MIN_FRACTION
+    if block.kind == 'table':
+        col_widths = column_widths(block.rows, geometry.width)
+        return sum(row_height(row, col_widths, bold=(r == 0)) for r, row in enumerate(block.rows))
+    if block.kind == 'code':
+        return text_height(block.code, CODE_SIZE, width, monospace=True)
+    return text_height(clean_markdown(block.text), BODY_SIZE, width,
+                       bold=block.kind == 'heading')
+
+
+def split_code(block, width, room):
+    """Split a code block into the lines that fit in room points and the rest"""
+    lines = block.code.split('\n')
+    used = CODE_SIZE * PARAGRAPH_SPACING
+    for i, line in enumerate(lines):
+        used += count_lines(line, CODE_SIZE, width, monospace=True) * CODE_SIZE * LINE_SPACING
+        if used > room:
+            break
+    else:
+        return block, None
+    if i == 0:
+        return None, block
+    return (block.replace(code='\n'.join(lines[:i])),
+            block.replace(code='\n'.join(lines[i:])))
+
+
+def split_table(block, geometry, room):
+    """Split a table into the rows that fit in room points and the rest
+
+    Both parts keep the header row. A table with no body rows cannot be
+    split, so all of it is the rest.
+    """
+    col_widths = column_widths(block.rows, geometry.width)
+    header, body = block.rows[0], block.rows[1:]
+    if not body:
+        return None, block
+    used = row_height(header, col_widths, bold=True)
+    for i, row in enumerate(body):
+        used += row_height(row, col_widths)
+        if used > room:
+            break
+    else:
+        return block, None
+    if i == 0:
+        return None, block
+    return (block.replace(rows=(header,) + body[:i]),
+            block.replace(rows=(header,) + body[i:]))
+
+
+def split_text(block, geometry, room):
+    """Split a bullet or paragraph into the words that fit in room points and the rest
+
+    Both parts keep the block's kind and depth. Splits never fall inside
+    inline markup, so a block whose words are all in one span cannot be
+    split and all of it is the rest.
+    """
+    width = geometry.level_widths[min(block.depth, len(geometry.level_widths) - 1)]
+    words = block.text.split(' ')
+    clean = clean_markdown(block.text)
+
+    def fits(n):
+        return text_height(clean_markdown(' '.join(words[:n])), BODY_SIZE, width) <= room
+
+    if fits(len(words)):
+        return block, None
+    # Most words that fit (the height only grows with words), then back off out of any span
+    lo, hi = 0, len(words)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        lo, hi = (mid, hi) if fits(mid) else (lo, mid)
+    for n in range(lo, 0, -1):
+        head, rest = ' '.join(words[:n]), ' '.join(words[n:])
+        if clean_markdown(head) + ' ' + clean_markdown(rest) == clean:
+            return block.replace(text=head), block.replace(text=rest)
+    return None, block
+
+
+def split_block(block, geometry, room):
+    """Split a block into the part that fits in room points and the rest
+
+    Returns (None, block) if no part fits and (block, None) if all of it
+    does. Headings and images are never split.
+    """
+    if block.kind == 'table':
+        return split_table(block, geometry, room)
+    if block.kind == 'code':
+        return split_code(block, geometry.level_widths[0], room)
+    if block.kind in ('bullet', 'paragraph'):
+        return split_text(block, geometry, room)
+    return None, block
+
+
+def paginate(slide, geometry, overflow='paginate'):
+    """Split a slide whose content would overflow the body placeholder
+
+    Returns the list of Slides it becomes. In 'paginate' mode
+    overflow goes onto numbered continuation slides; in 'notes' mode it
+    goes into the first slide's speaker notes. Tables and images are
+    placed below the text on their page, so nothing follows them on the
+    same slide. A block too tall for a page of its own is split across
+    pages (see split_block).
+    """
+    height = geometry.height
+    pages = [[]]
+    used = 0
+    pending = list(reversed(slide.blocks))
+    while pending:
+        block = pending.pop()
+        h = block_height(block, geometry)
+        after_table = bool(pages[-1]) and pages[-1][-1].kind in FLOAT_KINDS
+        if (used + h <= height and not after_table) or not pages[-1]:
+            if used + h > height:
+                # Too tall even for a page of its own: the rest goes on the next pages
+                head, rest = split_block(block, geometry, height - used)
+                if head is not None:
+                    block = head
+                    if rest is not None:
+                        pending.append(rest)
+            pages[-1].append(block)
+            used += h
             continue
 
-        # Add slide
-        slide_layout = prs.slide_layouts[1]  # Title and Content layout
-        slide = prs.slides.add_slide(slide_layout)
-
-        # Set title
-        title_shape = slide.shapes.title
-        title_shape.text = clean_markdown(title)
-        title_shape.text_frame.paragraphs[0].font.size = Pt(40)
-        title_shape.text_frame.paragraphs[0].font.bold = True
-        title_shape.text_frame.paragraphs[0].font.color.rgb = TITLE_COLOR
-
-        # Add body content
-        if len(slide.shapes) > 1:
-            body_shape = slide.shapes[1]
-            text_frame = body_shape.text_frame
-            text_frame.clear()
-
-            # Add body lines
-            for i, line in enumerate(body_lines[:15]):  # Limit to 15 lines per slide
-                if not line.strip():
-                    continue
+        # Tables and code fill the rest of the page; text moves on whole if it can
+        if block.kind in ('table', 'code') and not after_table:
+            head, rest = split_block(block, geometry, height - used)
+            if head is not None:
+                pages[-1].append(head)
+                if rest is not None:
+                    pending.append(rest)
+                pages.append([])
+                used = 0
+                continue
 
-                cleaned_line = clean_markdown(line)
+        # Start a new page, keeping a trailing heading with its content
+        carried = [pages[-1].pop()] if len(pages[-1]) > 1 and pages[-1][-1].kind == 'heading' else []
+        pages.append(carried)
+        used = sum(block_height(b, geometry) for b in carried)
+        pending.append(block)
 
-                if i == 0:
-                    p = text_frame.paragraphs[0]
-                else:
-                    p = text_frame.add_paragraph()
-
-                # Check if it's a bullet point
-                if line.startswith('- ') or line.startswith('* ') or line.startswith('✅') or line.startswith('⏳'):
-                    p.text = cleaned_line.lstrip('- *')
-                    p.level = 0
-                elif line.startswith('  - ') or line.startswith('  * '):
-                    p.text = cleaned_line.lstrip('- *')
-                    p.level = 1
+    title = slide.title
+    if len(pages) == 1:
+        return [Slide(title, pages[0])]
+    if overflow == 'notes':
+        overflow_blocks = [b for page in pages[1:] for b in page]
+        return [Slide(title, pages[0], notes_text(overflow_blocks))]
+    return [Slide(f"{title} ({i}/{len(pages)})", page) for i, page in enumerate(pages, 1)]
+
+
+def notes_text(blocks):
+    """Plain-text rendering of blocks for speaker notes"""
+    lines = []
+    for block in blocks:
+        if block.kind == 'code':
+            lines.append(block.code)
+        elif block.kind == 'table':
+            lines.extend(' | '.join(clean_markdown(cell) for cell in row) for row in block.rows)
+        elif block.kind == 'image':
+            lines.append(f"[image: {block.alt or os.path.basename(block.path)}]")
+        elif block.kind == 'bullet':
+            lines.append('  ' * block.depth + '• ' + clean_markdown(block.text))
+        else:
+            lines.append(clean_markdown(block.text))
+    return '\n'.join(lines)
+
+
+def float_box(geometry, text_blocks):
+    """(top, height) in points of the area left below a page's text"""
+    used = sum(block_height(b, geometry) for b in text_blocks)
+    return geometry.top + used, max(geometry.height - used, 0)
+
+
+def flow_layout(geometry, text_blocks):
+    """Split a page's text into the body placeholder's blocks and FlowBoxes
+
+    The body holds the text up to the first code block. Each code block
+    then gets a box of its own, in the code font and without bullets,
+    and the text between and after them goes in boxes styled like the
+    body. The boxes stack down from the body text at the heights
+    block_height gives, as paginate counted them.
+    """
+    body = []
+    boxes = []
+    top = geometry.top
+    for block in text_blocks:
+        height = block_height(block, geometry)
+        if block.kind == 'code' or (boxes and boxes[-1].blocks[0].kind == 'code'):
+            boxes.append(FlowBox(top, height, (block,)))
+        elif boxes:
+            boxes[-1] = FlowBox(boxes[-1].top, boxes[-1].height + height,
+                                boxes[-1].blocks + (block,))
+        else:
+            body.append(block)
+        top += height
+    return body, boxes
+
+
+def flow_box_emu(geometry, box):
+    """(left, top, width, height) in EMU of a FlowBox's text box
+
+    The box's default insets put its text where the body's would be.
+    """
+    return (round(geometry.left * EMU_PER_PT) - TEXT_INSET_X,
+            round(box.top * EMU_PER_PT) - TEXT_INSET_Y,
+            round(geometry.width * EMU_PER_PT) + 2 * TEXT_INSET_X,
+            round(box.height * EMU_PER_PT) + 2 * TEXT_INSET_Y)
+
+
+def add_paragraphs(text_frame, blocks, inline):
+    """Fill a cleared text frame with body text blocks, a paragraph each"""
+    from pptx.dml.color import RGBColor
+    from pptx.util import Pt
+
+    for i, block in enumerate(blocks):
+        p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+        add_runs(p, inline(block.text))
+        p.level = min(block.depth, 4)
+        p.font.size = Pt(BODY_SIZE)
+        p.font.color.rgb = RGBColor.from_string(TEXT_COLOR)
+        if block.kind == 'heading':
+            p.font.bold = True
+
+
+def add_flow_box(slide, layout, geometry, box, inline):
+    """Add a FlowBox as a text box"""
+    from pptx.dml.color import RGBColor
+    from pptx.util import Pt
+
+    shape = slide.shapes.add_textbox(*flow_box_emu(geometry, box))
+    text_frame = shape.text_frame
+    text_frame.word_wrap = True
+    code = box.blocks[0]
+    if code.kind == 'code':
+        # Paragraph font first: a:pPr must come before the runs and line breaks
+        p = text_frame.paragraphs[0]
+        p.font.size = Pt(CODE_SIZE)
+        p.font.name = CODE_FONT
+        p.font.color.rgb = RGBColor.from_string(CODE_COLOR)
+        add_code_runs(p, code.code, code.lang, CODE_SIZE, CODE_COLOR)
+    else:
+        copy_list_style(text_frame._txBody, layout)
+        add_paragraphs(text_frame, box.blocks, inline)
+    return shape
+
+
+def add_image(slide, block, future, geometry, top, height):
+    """Place a prepared image, fitted and centred in the box below the text"""
+    from pptx.util import Pt
+
+    try:
+        data, px_width, px_height = future.result()
+        # Never upscale past the image's size at IMAGE_DPI
+        natural_w = px_width / IMAGE_DPI * 72
+        natural_h = px_height / IMAGE_DPI * 72
+        scale = min(1, geometry.width / natural_w, height / natural_h)
+        width, img_height = natural_w * scale, natural_h * scale
+        left = geometry.left + (geometry.width - width) / 2
+        picture = slide.shapes.add_picture(io.BytesIO(data), Pt(left), Pt(top), Pt(width),
+                                           Pt(img_height))
+    except Exception as e:
+        print(f"⚠️  Image {block.path}: {e}", file=sys.stderr)
+        box = slide.shapes.add_textbox(Pt(geometry.left), Pt(top), Pt(geometry.width), Pt(BODY_SIZE * 2))
+        box.text_frame.text = f"🖼 {block.alt or os.path.basename(block.path)} (missing)"
+        return
+
+    if block.alt:
+        picture._element._nvXxPr.cNvPr.set('descr', block.alt)
+
+
+def render_slide(prs, layout, geometry, page, images=None, profiler=NO_PROFILER):
+    """Render one paginated Slide into the presentation
+
+    images maps each image block to its ImagePipeline future.
+    """
+    from pptx.dml.color import RGBColor
+    from pptx.util import Pt
+
+    inline = profiler.wrap('inline format', parse_inline)
+    slide = prs.slides.add_slide(layout)
+
+    # Set title
+    title_shape = slide.shapes.title
+    title_shape.text = clean_markdown(page.title)
+    title_shape.text_frame.paragraphs[0].font.size = Pt(TITLE_SIZE)
+    title_shape.text_frame.paragraphs[0].font.bold = True
+    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor.from_string(TITLE_COLOR)
+
+    # Code blocks, and the text after them, go in boxes of their own
+    text_blocks = [b for b in page.blocks if b.kind not in FLOAT_KINDS]
+    body_blocks, boxes = flow_layout(geometry, text_blocks)
+    for box in boxes:
+        add_flow_box(slide, layout, geometry, box, inline)
+
+    # Tables and images are shapes placed below the text (paginate keeps them last)
+    float_top, float_height = float_box(geometry, text_blocks)
+    for block in page.blocks:
+        if block.kind == 'table':
+            add_table(slide, block.rows, block.alignments, geometry.left, float_top,
+                      geometry.width, inline)
+        elif block.kind == 'image':
+            add_image(slide, block, images[block], geometry, float_top, float_height)
+
+    # Add body content
+    body_shape = next((ph for ph in slide.placeholders if ph.placeholder_format.idx == 1), None)
+    if body_shape is not None and not body_blocks:
+        # Nothing before the first code block or table: drop the empty placeholder and its prompt
+        body_shape._element.getparent().remove(body_shape._element)
+    elif body_shape is not None:
+        text_frame = body_shape.text_frame
+        text_frame.clear()
+        add_paragraphs(text_frame, body_blocks, inline)
+
+    if page.notes:
+        slide.notes_slide.notes_text_frame.text = page.notes
+
+    return slide
+
+
+def runs_xml(runs, links):
+    """The runs add_runs would append, as an XML string"""
+    return ''.join(
+        run_xml(run.text, run.bold, run.italic, CODE_FONT if run.code else None,
+                links.rid(run.link) if run.link else None)
+        for run in runs
+    )
+
+
+def body_paragraph_xml(block, inline, links):
+    """The paragraph add_paragraphs would write for a body text block, as an XML string"""
+    return paragraph_xml(runs_xml(inline(block.text), links), level=min(block.depth, 4),
+                         size_pt=BODY_SIZE, color=TEXT_COLOR, bold=block.kind == 'heading')
+
+
+def render_slide_xml(deck, geometry, page, inline=parse_inline):
+    """Render one paginated Slide onto a DirectDeck
+
+    Produces the same slide XML as render_slide, for slides without
+    images or speaker notes.
+    """
+    links = SlideLinks()
+    title_text = clean_markdown(page.title)
+    title_xml = paragraph_xml(run_xml(title_text) if title_text else '',
+                              size_pt=TITLE_SIZE, color=TITLE_COLOR, bold=True)
+
+    text_blocks = [b for b in page.blocks if b.kind not in FLOAT_KINDS]
+    body_blocks, boxes = flow_layout(geometry, text_blocks)
+    shapes = []
+    shape_id = deck.float_shape_id
+    for box in boxes:
+        code = box.blocks[0]
+        if code.kind == 'code':
+            content = paragraph_xml(code_runs_xml(code.code, code.lang, CODE_SIZE, CODE_COLOR),
+                                    size_pt=CODE_SIZE, color=CODE_COLOR, font=CODE_FONT)
+            list_style = '<a:lstStyle/>'
+        else:
+            content = ''.join(body_paragraph_xml(b, inline, links) for b in box.blocks)
+            list_style = deck.body_list_style
+        shapes.append(textbox_xml(shape_id, *flow_box_emu(geometry, box), content, list_style))
+        shape_id += 1
+
+    float_top, _ = float_box(geometry, text_blocks)
+    for block in page.blocks:
+        if block.kind == 'table':
+            shapes.append(table_xml(shape_id, block.rows, block.alignments, geometry.left,
+                                    float_top, geometry.width, inline, links))
+            shape_id += 1
+
+    body_xml = ''.join(body_paragraph_xml(b, inline, links) for b in body_blocks) \
+        if body_blocks else None
+    deck.add_slide(title_xml, body_xml, ''.join(shapes), links)
+
+
+def render_settings(template):
+    """Everything besides the slide source that affects rendered output"""
+    return (
+        RENDER_VERSION, template.digest, SLIDE_LAYOUT,
+        TITLE_COLOR, TEXT_COLOR, ACCENT_COLOR, CODE_COLOR,
+        code_highlight.settings(),
+    )
+
+
+def save_presentation(prs, output_file, profiler=NO_PROFILER, date_time=None):
+    """Save to a path atomically (write then rename) or to a file-like object
+
+    With a date_time the deck is saved reproducibly: canonical member
+    order, every member stamped with date_time.
+    """
+    if date_time is not None:
+        write_atomic(output_file, lambda f: save_canonical(prs, f, date_time, profiler))
+    elif profiler.enabled:
+        write_atomic(output_file, lambda f: save_profiled(prs, f, profiler))
+    else:
+        write_atomic(output_file, prs.save)
+
+
+def paginate_all(slides_data, geometry, overflow):
+    """Every output page of a deck, as Slides"""
+    return [page for slide in slides_data for page in paginate(slide, geometry, overflow)]
+
+
+def build_presentation(slides_data, cache=None, template=None, overflow='paginate',
+                       profiler=NO_PROFILER):
+    """Build the presentation for parsed slides in memory
+
+    With a SlideCache, slides whose source and render settings are
+    unchanged are copied from the cache instead of being rebuilt. template
+    is an optional .pptx/.potx path; it is compiled once per process and
+    kept in the cache's directory, if it has one. overflow is one of
+    OVERFLOW_MODES.
+    """
+    cache_dir = cache.cache_dir if cache is not None else None
+    with profiler.phase('template'):
+        snapshot = load_template(template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], cache_dir)
+        prs = snapshot.new_presentation()
+        layout = prs.slide_layouts[snapshot.layout_index(SLIDE_LAYOUT)]
+        settings = render_settings(snapshot)
+        geometry = body_geometry(snapshot, SLIDE_LAYOUT)
+
+    with profiler.phase('paginate'):
+        pages = paginate_all(slides_data, geometry, overflow)
+
+    with ImagePipeline() as pipeline:
+        # Start decoding and downscaling every image before building slides
+        images = {}
+        for page in pages:
+            text_blocks = [b for b in page.blocks if b.kind not in FLOAT_KINDS]
+            _, height = float_box(geometry, text_blocks)
+            for block in page.blocks:
+                if block.kind == 'image':
+                    images[block] = pipeline.submit(block.path, geometry.width, height)
+
+        for page in pages:
+            with profiler.item('slide', page.title), profiler.phase('shape build'):
+                # Slides with pictures hold package-internal image relationships
+                # that the slide cache cannot carry over, so they always render
+                if cache is None or any(b.kind == 'image' for b in page.blocks):
+                    render_slide(prs, layout, geometry, page, images, profiler)
+                    continue
+
+                key = cache.key(settings, page)
+                entry = cache.load(key)
+                if entry is not None:
+                    cache.apply(prs.slides.add_slide(layout), entry)
                 else:
-                    p.text = cleaned_line
-                    p.level = 0
+                    cache.store(key, render_slide(prs, layout, geometry, page, profiler=profiler))
+    return prs
 
-                p.font.size = Pt(16)
-                p.font.color.rgb = TEXT_COLOR
 
-            # Add code blocks if any
-            for code_block in code_blocks[:2]:  # Limit to 2 code blocks per slide
-                p = text_frame.add_paragraph()
-                p.text = code_block[:500]  # Limit code length
-                p.font.size = Pt(12)
-                p.font.name = 'Courier New'
-                p.font.color.rgb = RGBColor(88, 110, 117)
-                p.level = 0
+@lru_cache(maxsize=None)
+def _worker_cache(cache_dir):
+    """One SlideCache per worker process, so the directory is scanned once"""
+    return SlideCache(cache_dir)
 
-    # Save presentation
-    prs.save(output_file)
-    print(f"✅ PowerPoint presentation created: {output_file}")
 
-if __name__ == '__main__':
-    import sys
+def _render_batch(slides_data, cache_dir, template, overflow):
+    """Worker side of build_parallel: (SlideFragments, cache hits, cache misses)"""
+    cache = _worker_cache(cache_dir) if cache_dir else None
+    hits, misses = (cache.hits, cache.misses) if cache else (0, 0)
+    prs = build_presentation(slides_data, cache, template, overflow)
+    if cache is None:
+        return slide_fragments(prs), 0, 0
+    return slide_fragments(prs), cache.hits - hits, cache.misses - misses
+
+
+def build_parallel(slides_data, jobs, cache=None, template=None, overflow='paginate',
+                   profiler=NO_PROFILER):
+    """build_presentation with the slides rendered by jobs worker processes
+
+    Source slides go out in batches; each comes back as slide fragments
+    that are merged into the deck in order, so the result is the deck
+    build_presentation makes. Workers share the slide cache's directory
+    (a memory-only cache is not shared) and report their hits and misses.
+    """
+    cache_dir = cache.cache_dir if cache is not None else None
+    with profiler.phase('template'):
+        snapshot = load_template(template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], cache_dir)
+        prs = snapshot.new_presentation()
+
+    tasks = ((batch, cache_dir, template, overflow) for batch in batches(slides_data))
+    for fragments, hits, misses in map_ordered(_render_batch, tasks, jobs):
+        with profiler.phase('merge'):
+            graft_slides(prs, fragments)
+        if cache is not None:
+            cache.hits += hits
+            cache.misses += misses
+    return prs
+
+
+class NeedsObjectModel(Exception):
+    """A slide uses something only the python-pptx backend renders"""
+
+
+def render_direct(slides_data, deck, geometry, overflow, inline=parse_inline,
+                  profiler=NO_PROFILER):
+    """Paginate and render Slides onto a DirectDeck (or a SlideRecorder)"""
+    for slide in slides_data:
+        with profiler.phase('paginate'):
+            pages = paginate(slide, geometry, overflow)
+        for page in pages:
+            if page.notes or any(b.kind == 'image' for b in page.blocks):
+                raise NeedsObjectModel(f"'{page.title}' has images or speaker notes")
+            with profiler.item('slide', page.title), profiler.phase('shape build'):
+                render_slide_xml(deck, geometry, page, inline)
+
+
+def _record_batch(slides_data, template, overflow, cache_dir):
+    """Worker side of write_direct's parallel mode: add_slide arguments to replay"""
+    snapshot = load_template(template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], cache_dir)
+    base = base_package(snapshot, SLIDE_LAYOUT)
+    recorder = SlideRecorder(base.float_shape_id, base.body_list_style)
+    render_direct(slides_data, recorder, body_geometry(snapshot, SLIDE_LAYOUT), overflow)
+    return recorder.slides
+
+
+def write_direct(slides_data, output_file, template=None, overflow='paginate',
+                 profiler=NO_PROFILER, date_time=None, jobs=1, cache_dir=None):
+    """Stream a deck through the direct OOXML writer; returns the number of slides
+
+    slides_data may be any iterable of Slides, including a lazy
+    MarkdownSlides, so no more than one source slide is held at a time.
+    date_time stamps every zip member (None: now). With jobs > 1, worker
+    processes render batches of slides and the zip is written here in
+    order; the source is then read ahead of the writing. The compiled
+    template is kept in cache_dir (None: for this process only).
+    Raises NeedsObjectModel, leaving no output file behind, if a slide has
+    images or speaker notes.
+    """
+    with profiler.phase('template'):
+        snapshot = load_template(template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], cache_dir)
+        geometry = body_geometry(snapshot, SLIDE_LAYOUT)
+    inline = profiler.wrap('inline format', parse_inline)
 
-    md_file = 'docs/BankApp_Presentation.md'
-    output_file = 'docs/BankApp_Presentation.pptx'
+    def write(f):
+        with DirectDeck(snapshot, SLIDE_LAYOUT, f, profiler, date_time) as deck:
+            if jobs == 1:
+                render_direct(slides_data, deck, geometry, overflow, inline, profiler)
+                return len(deck)
+            tasks = ((batch, template, overflow, cache_dir) for batch in batches(slides_data))
+            for recorded in map_ordered(_record_batch, tasks, jobs):
+                for args in recorded:
+                    deck.add_slide(*args)
+        return len(deck)
 
-    print(f"📄 Reading: {md_file}")
-    slides = parse_markdown(md_file)
-    print(f"📊 Found {len(slides)} slides")
+    counts = []
+    write_atomic(output_file, lambda f: counts.append(write(f)))
+    return counts[0]
 
-    print(f"🎨 Creating PowerPoint presentation...")
-    create_presentation(slides, output_file)
-    print(f"✅ Done! Presentation saved to: {output_file}")
+
+def write_html(slides_data, output_file, title='Deck preview', profiler=NO_PROFILER):
+    """Write a static HTML preview of a deck; returns the number of slides
+
+    Slides are rendered straight from the parsed source, one card each,
+    with no template, pagination or python-pptx, so a preview takes a
+    fraction of the time the .pptx does. Like write_direct, slides_data
+    may be a lazy MarkdownSlides.
+    """
+    inline = profiler.wrap('inline format', parse_inline)
+
+    def write(f):
+        f.write(page_head(title, HTML_THEME).encode())
+        count = 0
+        for slide in slides_data:
+            count += 1
+            with profiler.item('slide', slide.title), profiler.phase('html render'):
+                f.write(slide_html(slide, count, inline, HTML_THEME).encode())
+        f.write(PAGE_TAIL.encode())
+        return count
+
+    counts = []
+    write_atomic(output_file, lambda f: counts.append(write(f)))
+    return counts[0]
+
+
+def create_presentation(slides_data, output_file, cache=None, template=None, overflow='paginate',
+                        backend='pptx', profiler=NO_PROFILER, reproducible=False, slide_jobs=1):
+    """Create PowerPoint presentation
+
+    See build_presentation for the options; backend is one of BACKENDS
+    (the slide cache's slides only apply to 'pptx', though every backend
+    keeps the compiled template in its directory; 'html' writes a preview
+    instead, ignoring template and overflow). slides_data must be
+    re-iterable for the direct backend to fall back to python-pptx.
+    A reproducible deck is byte-identical for identical inputs, whichever
+    .pptx backend wrote it (see reproducible_date_time). slide_jobs > 1
+    renders the slides in that many worker processes (see build_parallel);
+    the deck is the same either way.
+    Returns the number of slides written.
+    """
+    if backend == 'html':
+        title = 'Deck preview'
+        if isinstance(output_file, str):
+            title = os.path.splitext(os.path.basename(output_file))[0]
+        count = write_html(slides_data, output_file, title, profiler)
+        if isinstance(output_file, str):
+            print(f"✅ HTML preview created: {output_file}")
+        return count
+
+    date_time = reproducible_date_time() if reproducible else None
+    count = None
+    if backend == 'direct':
+        try:
+            count = write_direct(slides_data, output_file, template, overflow, profiler, date_time,
+                                 slide_jobs, cache.cache_dir if cache is not None else None)
+        except NeedsObjectModel:
+            print("ℹ️  Images and speaker notes need the python-pptx backend; using it instead")
+            if not isinstance(output_file, str):
+                output_file.seek(0)
+                output_file.truncate()
+
+    if count is None:
+        if slide_jobs > 1:
+            prs = build_parallel(slides_data, slide_jobs, cache, template, overflow, profiler)
+        else:
+            prs = build_presentation(slides_data, cache, template, overflow, profiler)
+
+        # Save presentation
+        save_presentation(prs, output_file, profiler, date_time)
+        if cache is not None:
+            print(f"♻️  Slide cache: {cache.hits} reused, {cache.misses} rendered")
+        count = len(prs.slides)
+
+    if isinstance(output_file, str):
+        print(f"✅ PowerPoint presentation created: {output_file}")
+    return count
+
+
+def is_deck(md_file):
+    """Check whether a markdown file is deck-style (has a --- slide separator)"""
+    with open(md_file, 'r', encoding='utf-8') as f:
+        return any(block is None for block in tokenize_lines(f))
+
+
+def expand_inputs(patterns):
+    """Resolve CLI inputs to markdown paths
+
+    Literal files are always converted; directories and glob patterns only
+    contribute deck-style markdown files.
+    """
+    paths = []
+    for pattern in patterns:
+        if pattern == '-' or os.path.isfile(pattern):
+            paths.append(pattern)
+            continue
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '**', '*.md')
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if not path.endswith('.md') or not os.path.isfile(path):
+                continue
+            try:
+                if is_deck(path):
+                    paths.append(path)
+            except (OSError, UnicodeDecodeError):
+                paths.append(path)  # Let the conversion report the error
+
+    # Keep the first occurrence of each file
+    seen = set()
+    return [p for p in paths if not (p in seen or seen.add(p))]
+
+
+def output_path_for(md_file, output_dir, base_dir, extension='.pptx'):
+    """Map an input path to its output file, mirroring the tree under base_dir"""
+    stem = os.path.splitext(md_file)[0] + extension
+    if output_dir is None:
+        return stem
+    return os.path.join(output_dir, os.path.relpath(stem, base_dir))
+
+
+def convert_file(md_file, output_file, cache_dir=None, cache=None, slide_numbers=None,
+                 **options):
+    """Convert one markdown deck; returns the number of slides written
+
+    options are passed through to create_presentation. The direct and
+    html backends stream the file instead of parsing it up front.
+    slide_numbers limits the deck to those source slides (1-based, in that
+    order); only they are read and tokenized, through a MarkdownDeck.
+    """
+    profiler = options.get('profiler', NO_PROFILER)
+    if slide_numbers is not None:
+        slides = MarkdownDeck(md_file, slide_numbers, profiler)
+    elif options.get('backend') in ('direct', 'html'):
+        slides = MarkdownSlides(md_file, profiler)
+    else:
+        slides = parse_markdown(md_file, profiler)
+    if cache is None and cache_dir:
+        cache = SlideCache(cache_dir)
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    return create_presentation(slides, output_file, cache=cache, **options)
+
+
+def _convert_job(job):
+    """Process-pool entry point: never raises, so one bad deck can't stop the batch"""
+    md_file, output_file, cache_dir, options = job
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = convert_file(md_file, output_file, cache_dir, **options)
+        return md_file, output_file, count, None
+    except Exception as e:
+        return md_file, output_file, 0, f"{type(e).__name__}: {e}"
+
+
+def convert_stdin(cache_dir=None, slide_numbers=None, **options):
+    """Convert markdown from stdin and write the deck (or preview) to stdout
+
+    stdin cannot be indexed, so with slide_numbers the whole input is
+    parsed and then the slides are picked.
+    """
+    profiler = options.get('profiler', NO_PROFILER)
+    # Keep progress messages off stdout, which carries the binary deck
+    with contextlib.redirect_stdout(sys.stderr):
+        with profiler.phase('read'):
+            lines = sys.stdin.readlines()
+        with profiler.phase('tokenize'):
+            slides = Deck(iter_slides(lines, os.getcwd()))
+        print(f"📊 Found {len(slides)} slides")
+        if slide_numbers is not None:
+            bad = [n for n in slide_numbers if not 1 <= n <= len(slides)]
+            if bad:
+                raise NoSuchSlide(f"stdin has {len(slides)} slides, not {bad[0]}")
+            slides = Deck(slides.slides[n - 1] for n in slide_numbers)
+        buffer = io.BytesIO()
+        cache = SlideCache(cache_dir) if cache_dir else None
+        create_presentation(slides, buffer, cache=cache, **options)
+    sys.stdout.buffer.write(buffer.getvalue())
+    sys.stdout.flush()
+
+
+def watch(jobs, cache, options, interval=0.1, settle=0.2):
+    """Poll input mtimes and rebuild each deck once its changes settle
+
+    Keeps the interpreter, python-pptx and an in-memory slide cache warm, so
+    a rebuild only renders the slides whose source changed. Runs until
+    interrupted.
+    """
+    stamps = {}
+    outputs = dict(jobs)
+    pending = dict.fromkeys(outputs, 0.0)  # Build everything once
+    print(f"👀 Watching {len(jobs)} file(s), Ctrl+C to stop")
+
+    try:
+        while True:
+            now = time.monotonic()
+            for md_file in outputs:
+                try:
+                    st = os.stat(md_file)
+                except OSError:
+                    continue  # Editors may briefly remove the file on save
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamps.get(md_file, stamp) != stamp:
+                    pending[md_file] = now
+                stamps[md_file] = stamp
+
+            for md_file, changed_at in list(pending.items()):
+                if now - changed_at < settle:
+                    continue
+                del pending[md_file]
+                started = time.perf_counter()
+                hits, misses = cache.hits, cache.misses
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        count = convert_file(md_file, outputs[md_file], cache=cache, **options)
+                except Exception as e:
+                    print(f"❌ {md_file}: {type(e).__name__}: {e}", file=sys.stderr)
+                    continue
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"🔄 {outputs[md_file]}: {count} slides in {elapsed:.0f} ms "
+                      f"({cache.misses - misses} rendered, {cache.hits - hits} reused)")
+
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    return 0
+
+
+def write_profile(profiler, json_file, top, stream=None):
+    """Write a profile report as JSON and print its summary table"""
+    profiler.write_json(json_file)
+    print(f"\n⏱️  Profile (tracemalloc on, so times run slow):", file=stream)
+    print(profiler.table(top), file=stream)
+    print(f"📈 Profile written to: {json_file}", file=stream)
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('inputs', nargs='*', default=['docs/BankApp_Presentation.md'],
+                        help="markdown files, directories or glob patterns ('-' for stdin to stdout)")
+    parser.add_argument('-o', '--output-dir',
+                        help='write decks here instead of next to each input')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='convert this many files in parallel (default: 1)')
+    parser.add_argument('--slide-jobs', type=int, default=1, metavar='N',
+                        help="render each deck's slides in N worker processes (default: 1)")
+    parser.add_argument('--max-decks-per-worker', type=int, default=20,
+                        help='recycle each worker process after this many decks (default: 20)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help='slide cache directory (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='render every slide from scratch')
+    parser.add_argument('-t', '--template',
+                        help='.pptx/.potx design template to build decks from')
+    parser.add_argument('--overflow', choices=OVERFLOW_MODES, default='paginate',
+                        help='put content that does not fit on continuation slides or '
+                             'in speaker notes (default: %(default)s)')
+    parser.add_argument('--backend', choices=BACKENDS, default='pptx',
+                        help="'direct' writes slide XML without python-pptx's object model; "
+                             "much faster on big decks, but images and speaker notes fall "
+                             "back to 'pptx'. 'html' writes a static .html preview "
+                             "instead of a deck (default: %(default)s)")
+    parser.add_argument('--reproducible', action='store_true',
+                        default=bool(os.environ.get('SOURCE_DATE_EPOCH')),
+                        help='write byte-identical decks for identical inputs, dated '
+                             'SOURCE_DATE_EPOCH or 1980-01-01 (default: on when '
+                             'SOURCE_DATE_EPOCH is set)')
+    parser.add_argument('--slides', metavar='RANGES',
+                        help="build only these source slides, e.g. '3-7,27' (1-based, in the "
+                             "order given); the rest of the markdown is not parsed")
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help='rebuild decks whenever their markdown changes')
+    parser.add_argument('--profile', metavar='JSON',
+                        help='profile each phase and slide; write the report here and '
+                             'print the slowest slides')
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help='slides to list in the profile table (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    slide_numbers = None
+    if args.slides:
+        try:
+            slide_numbers = parse_slide_ranges(args.slides)
+        except ValueError as e:
+            parser.error(f'--slides: {e}')
+    if args.jobs < 1 or args.max_decks_per_worker < 1 or args.slide_jobs < 1:
+        parser.error('--jobs, --slide-jobs and --max-decks-per-worker must be at least 1')
+    if args.jobs > 1 and args.slide_jobs > 1:
+        parser.error('--jobs and --slide-jobs cannot be combined')  # Pool workers can't fork pools
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    options = {'template': args.template, 'overflow': args.overflow, 'backend': args.backend,
+               'reproducible': args.reproducible, 'slide_jobs': args.slide_jobs,
+               'slide_numbers': slide_numbers}
+    if args.template:
+        # Compile and validate once up front rather than failing every deck
+        try:
+            load_template(args.template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], cache_dir)
+        except Exception as e:
+            print(f"❌ Template {args.template}: {e}", file=sys.stderr)
+            return 2
+    inputs = expand_inputs(args.inputs)
+    if not inputs:
+        print("❌ No markdown decks matched", file=sys.stderr)
+        return 2
+
+    if args.profile and (len(inputs) > 1 or args.watch or args.jobs > 1):
+        parser.error('--profile works on a single deck without --watch or --jobs')
+
+    if '-' in inputs:
+        if len(inputs) > 1 or args.watch:
+            parser.error("'-' cannot be combined with other inputs or --watch")
+        with Profiler(enabled=bool(args.profile)) as profiler:
+            try:
+                convert_stdin(cache_dir, profiler=profiler, **options)
+            except NoSuchSlide as e:
+                print(f"❌ {e}", file=sys.stderr)
+                return 1
+        if args.profile:
+            write_profile(profiler, args.profile, args.profile_top, sys.stderr)
+        return 0
+
+    base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in inputs])
+    jobs = [
+        (md_file, output_path_for(os.path.abspath(md_file), args.output_dir, base_dir,
+                                  OUTPUT_EXTENSIONS[args.backend]))
+        for md_file in inputs
+    ]
+
+    if args.watch:
+        # --no-cache still keeps slides in memory between rebuilds
+        return watch(jobs, SlideCache(cache_dir), options)
+
+    if len(jobs) == 1 and args.jobs == 1:
+        # Single deck: keep the familiar progress output
+        md_file, output_file = jobs[0]
+        print(f"📄 Reading: {md_file}")
+        with Profiler(enabled=bool(args.profile)) as profiler:
+            try:
+                count = convert_file(md_file, output_file, cache_dir, profiler=profiler, **options)
+            except NoSuchSlide as e:
+                print(f"❌ {e}", file=sys.stderr)
+                return 1
+        print(f"✅ Done! {count} slides saved to: {output_file}")
+        if args.profile:
+            write_profile(profiler, args.profile, args.profile_top)
+        return 0
+
+    print(f"🎨 Converting {len(jobs)} decks with {args.jobs} job(s)...")
+    tasks = [(md_file, output_file, cache_dir, options) for md_file, output_file in jobs]
+    if args.jobs == 1:
+        results = map(_convert_job, tasks)
+    else:
+        pool = multiprocessing.Pool(args.jobs, maxtasksperchild=args.max_decks_per_worker)
+        results = pool.imap_unordered(_convert_job, tasks)
+
+    failed = 0
+    try:
+        for md_file, output_file, count, error in results:
+            if error:
+                failed += 1
+                print(f"❌ {md_file}: {error}", file=sys.stderr)
+            else:
+                print(f"  ✓ {md_file} → {output_file} ({count} slides)")
+    finally:
+        if args.jobs > 1:
+            pool.close()
+            pool.join()
+
+    print(f"✅ Converted {len(jobs) - failed}/{len(jobs)} decks")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
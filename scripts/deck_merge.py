@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Merge .pptx decks at the zip-member level, without re-rendering
+
+    python scripts/deck_merge.py -o combined.pptx exec.pptx tech.pptx
+    python scripts/deck_merge.py -o excerpt.pptx exec.pptx tech.pptx:3-7,27
+
+The first deck is the base; slides of the others are appended after its
+own. Parts that need no change (slides, notes, media, layouts) have
+their compressed bytes copied across unchanged, so merging big decks
+never inflates them or parses their XML. Only relationship files, the
+presentation part and [Content_Types].xml are written anew, plus the
+master of a template the base deck does not already have (its layout
+ids must be renumbered).
+"""
+
+import argparse
+import os
+import posixpath
+import re
+import struct
+import sys
+import zipfile
+import zlib
+
+from cli_common import parse_slide_ranges, write_atomic
+from ooxml_writer import (RT_NOTES_MASTER, RT_OFFICE_DOCUMENT, RT_SLIDE, RT_SLIDE_LAYOUT,
+                          RT_SLIDE_MASTER, RT_THEME, TYPES_NS, XML_HEADER, read_rels, rels_member,
+                          rels_xml, reproducible_date_time, resolve_target, xml_attr, zip_info)
+
+P_NS = 'http://schemas.openxmlformats.org/presentationml/2006/main'
+R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'  # r:id
+FIRST_SLIDE_ID = 256          # Slide ids start here
+FIRST_MASTER_ID = 2147483648  # Master and layout ids share a space from 2^31
+CHUNK_SIZE = 1 << 20          # Bytes of a copied member read at a time
+ZIP32_LIMIT = 0xFFFFFFFF      # Largest size or offset a zip without zip64 holds
+
+# Zip records (APPNOTE.TXT 4.3.7, 4.3.12 and 4.3.16); when reading a local
+# header only its signature and the name and extra field lengths matter
+_LOCAL_HEADER_LENGTHS = struct.Struct('<4s22xHH')
+_LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+_CENTRAL_HEADER = struct.Struct('<4sHHHHHHIIIHHHHHII')
+_END_RECORD = struct.Struct('<4sHHHHIIH')
+_NUMBERED = re.compile(r'\d*(\.\w+)$')
+_LAYOUT_ID = re.compile(rb'(<p:sldLayoutId\b[^>]*?\bid=")(\d+)(")')
+
+
+def _p(tag):
+    return f'{{{P_NS}}}{tag}'
+
+
+class SourceDeck:
+    """A .pptx opened for reading, member by member"""
+
+    def __init__(self, path):
+        from lxml import etree
+
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        self._file = open(path, 'rb')  # For raw reads, apart from the zip's own handle
+        self.infos = {info.filename: info for info in self.zip.infolist()}
+        self._rels = {}
+
+        types = etree.fromstring(self.get('[Content_Types].xml'))
+        self.defaults = {el.get('Extension').lower(): el.get('ContentType')
+                         for el in types if el.tag == f'{{{TYPES_NS}}}Default'}
+        self.overrides = {el.get('PartName'): el.get('ContentType')
+                          for el in types if el.tag == f'{{{TYPES_NS}}}Override'}
+
+        self.presentation = next(resolve_target('', target)
+                                 for _, reltype, target, _ in self.rels('')
+                                 if reltype == RT_OFFICE_DOCUMENT)
+        self.element = etree.fromstring(self.get(self.presentation))
+        targets = {rid: resolve_target(self.presentation, target)
+                   for rid, _, target, _ in self.rels(self.presentation)}
+        sldIdLst = self.element.find(_p('sldIdLst'))
+        self.slides = [targets[el.get(R_ID)] for el in (sldIdLst if sldIdLst is not None else ())]
+        size = self.element.find(_p('sldSz'))
+        self.size = (size.get('cx'), size.get('cy')) if size is not None else None
+
+    def get(self, name):
+        """A member's bytes, or None"""
+        return self.zip.read(name) if name in self.infos else None
+
+    def rels(self, partname):
+        """(rId, type, target, external) tuples of a part, in file order"""
+        if partname not in self._rels:
+            self._rels[partname] = read_rels(self, partname)
+        return self._rels[partname]
+
+    def related(self, partname, reltype):
+        """Member names a part relates to with reltype"""
+        return [resolve_target(partname, target) for _, rt, target, external in self.rels(partname)
+                if rt == reltype and not external]
+
+    def content_type(self, name):
+        ext = posixpath.splitext(name)[1][1:].lower()
+        return self.overrides.get('/' + name) or self.defaults.get(ext)
+
+    def raw(self, name):
+        """A member's bytes as stored in the zip, still compressed, in chunks"""
+        info = self.infos[name]
+        if info.flag_bits & 0x1:
+            raise ValueError(f"{self.path}: {name} is encrypted")
+        self._file.seek(info.header_offset)
+        signature, name_length, extra_length = _LOCAL_HEADER_LENGTHS.unpack(
+            self._file.read(_LOCAL_HEADER_LENGTHS.size))
+        if signature != b'PK\x03\x04':
+            raise zipfile.BadZipFile(f"{self.path}: bad local header for {name}")
+        self._file.seek(name_length + extra_length, os.SEEK_CUR)
+        left = info.compress_size
+        while left:
+            chunk = self._file.read(min(left, CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"{self.path}: {name} is truncated")
+            left -= len(chunk)
+            yield chunk
+
+    def close(self):
+        self.zip.close()
+        self._file.close()
+
+
+class RawZip:
+    """A zip written from members that are already compressed
+
+    zipfile only adds members it compresses itself, which would inflate
+    and deflate every copied member again. Here their bytes go straight
+    through, with the CRC and sizes of the source's central directory.
+    There is no zip64: no deck comes near 4 GiB.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.offset = 0
+        self.central = []
+
+    def _write(self, data):
+        self.f.write(data)
+        self.offset += len(data)
+
+    def add(self, info, chunks):
+        """Add a member from a ZipInfo, with its CRC and sizes, and its compressed chunks"""
+        if max(info.compress_size, info.file_size, self.offset) > ZIP32_LIMIT:
+            raise ValueError(f"{info.filename}: too big for a zip without zip64")
+        name = info.filename.encode('utf-8')
+        # Keep the deflate level bits; the sizes are known, so no data descriptor
+        flags = info.flag_bits & 0x6 | (0 if info.filename.isascii() else 0x800)
+        year, month, day, hour, minute, second = info.date_time
+        fields = (max(info.extract_version, 20), flags, info.compress_type,
+                  hour << 11 | minute << 5 | second // 2, (year - 1980) << 9 | month << 5 | day,
+                  info.CRC, info.compress_size, info.file_size, len(name))
+        self.central.append(_CENTRAL_HEADER.pack(b'PK\x01\x02', 3 << 8 | 20, *fields, 0, 0, 0, 0,
+                                                 info.external_attr, self.offset) + name)
+        self._write(_LOCAL_HEADER.pack(b'PK\x03\x04', *fields, 0) + name)
+        for chunk in chunks:
+            self._write(chunk)
+
+    def add_bytes(self, name, data, date_time=None):
+        """Add a member from its uncompressed bytes, deflated as ZipFile.writestr would"""
+        info = zip_info(name, date_time)
+        deflate = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        compressed = deflate.compress(data) + deflate.flush()
+        info.CRC, info.file_size, info.compress_size = zlib.crc32(data), len(data), len(compressed)
+        self.add(info, (compressed,))
+
+    def add_member(self, name, deck, member, date_time=None):
+        """Add a member of a SourceDeck as name, its compressed bytes unchanged"""
+        info = deck.infos[member]
+        out = zipfile.ZipInfo(name, date_time=date_time or info.date_time)
+        out.compress_type = info.compress_type
+        out.flag_bits = info.flag_bits
+        out.extract_version = info.extract_version
+        out.CRC, out.file_size, out.compress_size = info.CRC, info.file_size, info.compress_size
+        out.external_attr = 0o600 << 16
+        self.add(out, deck.raw(member))
+
+    def close(self):
+        """Write the central directory"""
+        if len(self.central) > 0xFFFF:
+            raise ValueError("too many members for a zip without zip64")
+        start = self.offset
+        for entry in self.central:
+            self._write(entry)
+        self._write(_END_RECORD.pack(b'PK\x05\x06', 0, 0, len(self.central), len(self.central),
+                                     self.offset - start, start, 0))
+
+
+class DeckMerger:
+    """One deck built from a base deck plus slides imported from others
+
+    Slide layouts are matched to the base's (or earlier imports') when
+    the layout, its master and the master's theme are byte-identical, so
+    decks built from the same template share one master. Other masters
+    come across with all their layouts. Identical media is stored once,
+    and there is only ever one notes master.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.sources = {}  # Output member -> (SourceDeck, member) or bytes
+        self.overrides = dict(base.overrides)
+        self.defaults = dict(base.defaults)
+        self.element = base.element
+        self.presentation = base.presentation
+        self.presentation_rels = list(base.rels(base.presentation))
+        self._imported = {}  # (id(SourceDeck), member) -> output member
+        self._decks = []  # Keeps imported decks alive, so their ids stay unique
+        self._numbers = {}
+        self._stems = set()  # Output names without extension: image3.png takes image3.jpg too
+        self._media = {}  # (CRC, size) -> output members
+        self._layouts = []  # (output layout, SourceDeck, layout) for matching
+        self._signatures = {}
+        self._notes_master = next(iter(base.related(base.presentation, RT_NOTES_MASTER)), None)
+        self._next_master_id = None
+        self._last_rid = max((int(rid[3:]) for rid, _, _, _ in self.presentation_rels
+                              if rid.startswith('rId') and rid[3:].isdigit()), default=0)
+        self._last_slide_id = max((int(el.get('id')) for el in self.element.iter(_p('sldId'))),
+                                  default=FIRST_SLIDE_ID - 1)
+
+        skip = {base.presentation, rels_member(base.presentation), '[Content_Types].xml'}
+        for name in base.infos:
+            if name not in skip and not name.endswith('/'):
+                self.sources[name] = (base, name)
+                self._stems.add(posixpath.splitext(name)[0])
+                self._imported[id(base), name] = name
+        for master in base.related(base.presentation, RT_SLIDE_MASTER):
+            for layout in base.related(master, RT_SLIDE_LAYOUT):
+                self._layouts.append((layout, base, layout))
+        for name in base.infos:
+            if name.startswith('ppt/media/'):
+                info = base.infos[name]
+                self._media.setdefault((info.CRC, info.file_size), []).append(name)
+
+    def __len__(self):
+        sldIdLst = self.element.find(_p('sldIdLst'))
+        return 0 if sldIdLst is None else len(sldIdLst)
+
+    def import_slides(self, deck, numbers=None):
+        """Append slides of a SourceDeck (1-based numbers, default all); returns how many"""
+        if numbers is None:
+            slides = list(deck.slides)
+        else:
+            bad = [n for n in numbers if not 1 <= n <= len(deck.slides)]
+            if bad:
+                raise ValueError(f"{deck.path} has {len(deck.slides)} slides, not {bad[0]}")
+            slides = [deck.slides[n - 1] for n in numbers]
+        self._decks.append(deck)
+        count = len(self)
+
+        # Name every slide first, so links between imported slides resolve
+        for slide in slides:
+            if (id(deck), slide) not in self._imported:
+                self._imported[id(deck), slide] = self._free_name(slide)
+        for slide in slides:
+            name = self._imported[id(deck), slide]
+            if self.sources[name] is not None:
+                continue  # The same slide listed twice is imported once
+            self._copy(deck, slide, name)
+            self._add_slide(name)
+        return len(self) - count
+
+    def _free_name(self, member):
+        """member's name with the lowest number no output member has yet"""
+        template = _NUMBERED.sub(r'%d\1', member.replace('%', '%%'))
+        stem = posixpath.splitext(template)[0]
+        number = self._numbers.get(stem, 1)
+        while stem % number in self._stems:
+            number += 1
+        self._numbers[stem] = number + 1
+        self._stems.add(stem % number)
+        self.sources[template % number] = None  # Reserved
+        return template % number
+
+    def _copy(self, deck, member, name, blob=None):
+        """Copy a part (and its relationships, remapped) to name"""
+        self.sources[name] = blob if blob is not None else (deck, member)
+        content_type = deck.content_type(member)
+        ext = posixpath.splitext(name)[1][1:].lower()
+        if self.defaults.get(ext) == content_type:
+            pass
+        elif ext not in self.defaults and deck.defaults.get(ext) == content_type:
+            self.defaults[ext] = content_type
+        else:
+            self.overrides['/' + name] = content_type
+
+        rels = []
+        for rid, reltype, target, external in deck.rels(member):
+            if not external:
+                target = posixpath.relpath(self._target(deck, resolve_target(member, target), reltype),
+                                           posixpath.dirname(name))
+            rels.append((rid, reltype, target, external))
+        if rels:
+            self.sources[rels_member(name)] = rels_xml(rels)
+
+    def _target(self, deck, member, reltype):
+        """The output member a relationship from an imported part points to"""
+        key = (id(deck), member)
+        if key in self._imported:
+            return self._imported[key]
+        if reltype == RT_SLIDE:
+            raise ValueError(f"{deck.path}: a slide links to {member}, which is not imported")
+        if reltype == RT_SLIDE_LAYOUT:
+            return self._layout(deck, member)
+        if reltype == RT_SLIDE_MASTER:
+            return self._master(deck, member)
+        if reltype == RT_NOTES_MASTER and self._notes_master is not None:
+            self._imported[key] = self._notes_master
+            return self._notes_master
+
+        name = self._duplicate_media(deck, member)
+        if name is None:
+            name = self._free_name(member)
+            self._imported[key] = name
+            self._copy(deck, member, name)
+            if member.startswith('ppt/media/'):
+                info = deck.infos[member]
+                self._media.setdefault((info.CRC, info.file_size), []).append(name)
+        self._imported[key] = name
+        if reltype == RT_NOTES_MASTER:
+            self._notes_master = name
+            self._relate(RT_NOTES_MASTER, name)
+        return name
+
+    def _duplicate_media(self, deck, member):
+        """An output member with the same bytes as a media part, or None"""
+        if not member.startswith('ppt/media/'):
+            return None
+        info = deck.infos[member]
+        data = deck.get(member)
+        for name in self._media.get((info.CRC, info.file_size), ()):
+            other, other_member = self.sources[name]
+            if other.get(other_member) == data and \
+                    posixpath.splitext(name)[1] == posixpath.splitext(member)[1]:
+                return name
+        return None
+
+    def _layout(self, deck, layout):
+        """The output layout for a source layout, importing its master if need be"""
+        signature = self._signature(deck, layout)
+        for name, other, other_layout in self._layouts:
+            if self._signature(other, other_layout) == signature:
+                self._imported[id(deck), layout] = name
+                return name
+        self._master(deck, deck.related(layout, RT_SLIDE_MASTER)[0])
+        return self._imported[id(deck), layout]
+
+    def _signature(self, deck, layout):
+        """What makes two layouts interchangeable: their bytes, master and theme"""
+        key = (id(deck), layout)
+        if key not in self._signatures:
+            master = deck.related(layout, RT_SLIDE_MASTER)[0]
+            themes = [deck.get(theme) for theme in deck.related(master, RT_THEME)]
+            self._signatures[key] = (deck.get(layout), deck.get(rels_member(layout)),
+                                     deck.get(master), themes)
+        return self._signatures[key]
+
+    def _master(self, deck, master):
+        """Import a master with all its layouts; its layout ids are renumbered"""
+        key = (id(deck), master)
+        if key in self._imported:
+            return self._imported[key]
+        name = self._free_name(master)
+        self._imported[key] = name
+        layouts = deck.related(master, RT_SLIDE_LAYOUT)
+        for layout in layouts:
+            self._imported[id(deck), layout] = self._free_name(layout)
+
+        blob = _LAYOUT_ID.sub(lambda m: m.group(1) + str(self._master_id()).encode() + m.group(3),
+                              deck.get(master))
+        self._copy(deck, master, name, blob)
+        for layout in layouts:
+            layout_name = self._imported[id(deck), layout]
+            self._copy(deck, layout, layout_name)
+            self._layouts.append((layout_name, deck, layout))
+
+        from lxml import etree
+
+        rid = self._relate(RT_SLIDE_MASTER, name)
+        master_list = self.element.find(_p('sldMasterIdLst'))
+        etree.SubElement(master_list, _p('sldMasterId'), {'id': str(self._master_id()), R_ID: rid})
+        return name
+
+    def _master_id(self):
+        """A master or layout id no other master or layout uses"""
+        if self._next_master_id is None:
+            used = [int(el.get('id')) for el in self.element.iter(_p('sldMasterId'))]
+            for master in self.base.related(self.base.presentation, RT_SLIDE_MASTER):
+                used.extend(int(m.group(2)) for m in _LAYOUT_ID.finditer(self.base.get(master)))
+            self._next_master_id = max(used, default=FIRST_MASTER_ID - 1) + 1
+        self._next_master_id += 1
+        return self._next_master_id - 1
+
+    def _relate(self, reltype, name):
+        """Add a presentation relationship; returns its rId"""
+        self._last_rid += 1
+        rid = f'rId{self._last_rid}'
+        target = posixpath.relpath(name, posixpath.dirname(self.presentation))
+        self.presentation_rels.append((rid, reltype, target, False))
+        return rid
+
+    def _add_slide(self, name):
+        from lxml import etree
+
+        rid = self._relate(RT_SLIDE, name)
+        sldIdLst = self.element.find(_p('sldIdLst'))
+        if sldIdLst is None:
+            # After the master lists, where the schema puts it
+            anchor = [el for el in self.element
+                      if el.tag in (_p('sldMasterIdLst'), _p('notesMasterIdLst'),
+                                    _p('handoutMasterIdLst'))]
+            sldIdLst = etree.Element(_p('sldIdLst'))
+            if anchor:
+                anchor[-1].addnext(sldIdLst)
+            else:
+                self.element.insert(0, sldIdLst)
+        self._last_slide_id += 1
+        etree.SubElement(sldIdLst, _p('sldId'), {'id': str(self._last_slide_id), R_ID: rid})
+
+    def _content_types(self):
+        items = [f'<Default Extension="{ext}" ContentType="{ct}"/>'
+                 for ext, ct in sorted(self.defaults.items())]
+        items.extend(f'<Override PartName="{xml_attr(name)}" ContentType="{ct}"/>'
+                     for name, ct in sorted(self.overrides.items()))
+        return f'{XML_HEADER}<Types xmlns="{TYPES_NS}">{"".join(items)}</Types>'.encode()
+
+    def write(self, output_file, date_time=None):
+        """Write the merged deck to a path or file-like object"""
+        from lxml import etree
+
+        if isinstance(output_file, str):
+            with open(output_file, 'wb') as f:
+                return self.write(f, date_time)
+
+        presentation = etree.tostring(self.element, encoding='UTF-8', standalone=True)
+        generated = {
+            self.presentation: presentation,
+            rels_member(self.presentation): rels_xml(self.presentation_rels),
+            '[Content_Types].xml': self._content_types(),
+        }
+        zf = RawZip(output_file)
+        for name, source in list(self.sources.items()) + list(generated.items()):
+            if isinstance(source, bytes):
+                zf.add_bytes(name, source, date_time)
+            else:
+                zf.add_member(name, *source, date_time)
+        zf.close()
+
+
+def merge_decks(inputs, output_file, date_time=None):
+    """Merge decks into output_file; returns the number of slides
+
+    inputs are (path, slide numbers or None for all) pairs; the first
+    deck's template, slide size and properties are kept.
+    """
+    if inputs[0][1] is not None:
+        raise ValueError('the base deck is kept whole; list it again to pick its slides')
+    decks = []
+    try:
+        for path, _ in inputs:
+            decks.append(SourceDeck(path))
+        base = decks[0]
+        merger = DeckMerger(base)
+        for deck, (path, numbers) in zip(decks[1:], inputs[1:]):
+            if deck.size != base.size:
+                print(f"⚠️  {path}: slide size differs from the base deck's; "
+                      "its slides keep their positions", file=sys.stderr)
+            merger.import_slides(deck, numbers)
+        merger.write(output_file, date_time)
+        return len(merger)
+    finally:
+        for deck in decks:
+            deck.close()
+
+
+def parse_input(text):
+    """'deck.pptx' or 'deck.pptx:3-7,27' as (path, slide numbers or None)"""
+    path, sep, ranges = text.rpartition(':')
+    if sep and path and re.fullmatch(r'[\d,\s-]+', ranges):
+        return path, parse_slide_ranges(ranges)
+    return text, None
+
+
+def main(argv=None):
+    """Command line entry point; returns the process exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('base', help='deck whose template and slide size the result keeps')
+    parser.add_argument('decks', nargs='+',
+                        help="decks to append, each optionally with slides, e.g. 'tech.pptx:3-7,27'")
+    parser.add_argument('-o', '--output', required=True, help='merged .pptx to write')
+    parser.add_argument('--reproducible', action='store_true',
+                        default=bool(os.environ.get('SOURCE_DATE_EPOCH')),
+                        help='date every member SOURCE_DATE_EPOCH or 1980-01-01 (default: on '
+                             'when SOURCE_DATE_EPOCH is set)')
+    args = parser.parse_args(argv)
+
+    try:
+        inputs = [(args.base, None)] + [parse_input(deck) for deck in args.decks]
+        date_time = reproducible_date_time() if args.reproducible else None
+        counts = []
+        write_atomic(args.output, lambda f: counts.append(merge_decks(inputs, f, date_time)))
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(f"✅ Merged {len(inputs)} decks ({counts[0]} slides) into: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
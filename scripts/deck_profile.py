@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Per-phase and per-slide profiling for the deck generators
+"""
+
+import contextlib
+import json
+import time
+import tracemalloc
+import zipfile
+
+_NULL = contextlib.nullcontext()
+
+
+class _Frame:
+    """Bookkeeping for one open phase or item"""
+
+    __slots__ = ('is_phase', 'wall', 'cpu', 'memory', 'child_wall', 'child_cpu', 'child_peak')
+
+    def __init__(self, is_phase):
+        self.is_phase = is_phase
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.memory = tracemalloc.get_traced_memory()[0]
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.child_peak = 0
+
+
+class Profiler:
+    """Records wall time, CPU time and tracemalloc peak per phase and per item
+
+    Phases (read, tokenize, shape build, ...) are exclusive: time spent in
+    a nested phase is counted there and not in the enclosing one. Items
+    (one slide or one add_* function) are inclusive of every phase inside
+    them. Peaks are the most traced memory above the level at entry.
+    tracemalloc slows Python down severalfold, so compare profiles with
+    each other rather than with normal runs. A disabled profiler costs
+    next to nothing, so code can always pass one around.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.phases = {}  # name -> [calls, wall, cpu, peak], in first-use order
+        self.items = []
+        self.total = None
+        self._stack = []
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._stack.append(_Frame(is_phase=False))
+        return self
+
+    def __exit__(self, *exc):
+        if not self.enabled:
+            return
+        frame = self._stack.pop()
+        self.total = self._measure(frame)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def phase(self, name):
+        """Context manager timing one pass through a named phase"""
+        if not self.enabled or not self._stack:
+            return _NULL
+        return self._section(name, None)
+
+    def item(self, kind, name):
+        """Context manager timing one slide or builder function"""
+        if not self.enabled or not self._stack:
+            return _NULL
+        return self._section(name, kind)
+
+    def wrap(self, name, func):
+        """func, run inside phase name on every call"""
+        if not self.enabled:
+            return func
+
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def _measure(self, frame):
+        """(wall, cpu, peak) of a frame that is being closed"""
+        wall = time.perf_counter() - frame.wall
+        cpu = time.process_time() - frame.cpu
+        peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+        return wall, cpu, max(peak - frame.memory, 0)
+
+    @contextlib.contextmanager
+    def _section(self, name, kind):
+        # Keep the enclosing frame's peak so far before resetting the counter
+        parent = self._stack[-1]
+        parent.child_peak = max(parent.child_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+        frame = _Frame(is_phase=kind is None)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            absolute_peak = max(tracemalloc.get_traced_memory()[1], frame.child_peak)
+            wall, cpu, peak = self._measure(frame)
+            parent.child_peak = max(parent.child_peak, absolute_peak)
+
+            if kind is None:
+                enclosing = next((f for f in reversed(self._stack) if f.is_phase), None)
+                if enclosing is not None:
+                    enclosing.child_wall += wall
+                    enclosing.child_cpu += cpu
+                stats = self.phases.setdefault(name, [0, 0.0, 0.0, 0])
+                stats[0] += 1
+                stats[1] += wall - frame.child_wall
+                stats[2] += cpu - frame.child_cpu
+                stats[3] = max(stats[3], peak)
+            else:
+                self.items.append({'kind': kind, 'name': name, 'wall_s': wall,
+                                   'cpu_s': cpu, 'peak_kib': peak / 1024})
+
+    def report(self):
+        """The profile as a JSON-serializable dict"""
+        wall, cpu, peak = self.total or (0.0, 0.0, 0)
+        return {
+            'total': {'wall_s': round(wall, 6), 'cpu_s': round(cpu, 6),
+                      'peak_kib': round(peak / 1024, 1)},
+            'phases': [
+                {'name': name, 'calls': calls, 'wall_s': round(w, 6), 'cpu_s': round(c, 6),
+                 'peak_kib': round(p / 1024, 1)}
+                for name, (calls, w, c, p) in self.phases.items()
+            ],
+            'items': [
+                dict(item, wall_s=round(item['wall_s'], 6), cpu_s=round(item['cpu_s'], 6),
+                     peak_kib=round(item['peak_kib'], 1))
+                for item in self.items
+            ],
+        }
+
+    def table(self, top=10):
+        """Phases, then the top items by wall time, as a text table"""
+        report = self.report()
+        lines = [f"{'Phase':<16} {'Calls':>7} {'Wall s':>9} {'CPU s':>9} {'Peak KiB':>10}"]
+        for p in report['phases']:
+            lines.append(f"{p['name']:<16} {p['calls']:>7} {p['wall_s']:>9.3f} "
+                         f"{p['cpu_s']:>9.3f} {p['peak_kib']:>10.0f}")
+        total = report['total']
+        lines.append(f"{'total':<16} {'':>7} {total['wall_s']:>9.3f} "
+                     f"{total['cpu_s']:>9.3f} {total['peak_kib']:>10.0f}")
+
+        items = sorted(report['items'], key=lambda item: item['wall_s'], reverse=True)
+        if items:
+            kind = items[0]['kind']
+            lines.append('')
+            lines.append(f"Top {min(top, len(items))} of {len(items)} by wall time")
+            lines.append(f"{'Wall s':>9} {'CPU s':>9} {'Peak KiB':>10}  {kind}")
+            for item in items[:top]:
+                lines.append(f"{item['wall_s']:>9.3f} {item['cpu_s']:>9.3f} "
+                             f"{item['peak_kib']:>10.0f}  {item['name']}")
+        return '\n'.join(lines)
+
+    def write_json(self, path):
+        """Write the report to path as JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+            f.write('\n')
+
+
+def save_profiled(prs, output_file, profiler):
+    """Save like Presentation.save, timing XML serialization and zip writing apart
+
+    Parts are written in the same order as python-pptx's PackageWriter,
+    but every part is serialized before the archive is opened.
+    """
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    from pptx.opc.serialized import _ContentTypesItem
+
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    with profiler.phase('xml serialize'):
+        members = [
+            (CONTENT_TYPES_URI, serialize_part_xml(_ContentTypesItem.xml_for(parts))),
+            (PACKAGE_URI.rels_uri, package._rels.xml),
+        ]
+        for part in parts:
+            members.append((part.partname, part.blob))
+            if part._rels:
+                members.append((part.partname.rels_uri, part.rels.xml))
+
+    with profiler.phase('zip write'):
+        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as zf:
+            for pack_uri, blob in members:
+                zf.writestr(pack_uri.membername, blob)
+
+
+NO_PROFILER = Profiler(enabled=False)
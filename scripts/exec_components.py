@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Infographic components for the executive deck
+
+Each component draws one data record (a MetricCard, a revenue stream, a
+roadmap phase...) on a slide in the deck's house style, so a slide
+builder is its data plus a loop. Positions and sizes are in inches and
+colours are hex strings. Text is styled through TextStyles: each is
+compiled once into the paragraph XML python-pptx would write for it, and
+a paragraph is a copy of that rather than a round of font, colour and
+alignment proxy lookups per box.
+"""
+
+import copy
+from collections import namedtuple
+from functools import lru_cache
+
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+# Color scheme
+PRIMARY_BLUE = '0284C7'
+DARK_BLUE = '0369A1'
+ACCENT_GREEN = '10B981'
+ACCENT_ORANGE = 'FB923C'
+DARK_GRAY = '1F2937'
+LIGHT_GRAY = '9CA3AF'
+WHITE = 'FFFFFF'
+BG_LIGHT = 'F8FAFC'
+
+# Paragraph alignments, as OOXML writes them (None: left, the default)
+CENTER = 'ctr'
+RIGHT = 'r'
+
+# size and space_after are in points
+TextStyle = namedtuple('TextStyle', 'size bold color align space_after',
+                       defaults=(False, None, None, None))
+
+SLIDE_TITLE = TextStyle(44, True, PRIMARY_BLUE)
+SECTION_TITLE = TextStyle(24, True, DARK_GRAY)
+
+# Chart series colours, in series (or doughnut slice) order
+SERIES_COLORS = (ACCENT_GREEN, PRIMARY_BLUE, ACCENT_ORANGE, DARK_BLUE, LIGHT_GRAY)
+CHART_FONT_SIZE = 12
+MONEY_FORMAT = '"R "0.0"M"'  # Amounts are in millions of rand
+
+# How a MetricCard is laid out: value over label over caption, the last
+# two inset from the card's sides; *_top are offsets from the card's top
+CardLayout = namedtuple('CardLayout', 'width height value label caption inset wrap '
+                                      'label_top label_height caption_top caption_height shadow')
+
+MARKET_CARD = CardLayout(2.8, 1.5, TextStyle(40, True, WHITE, CENTER),
+                         TextStyle(14, True, WHITE, CENTER), TextStyle(11, False, WHITE, CENTER),
+                         0.1, True, 0.8, 0.4, 1.2, 0.3, True)
+ROI_CARD = CardLayout(3.8, 1.4, TextStyle(48, True, WHITE, CENTER),
+                      TextStyle(16, True, WHITE, CENTER), TextStyle(14, False, WHITE, CENTER),
+                      0, False, 0.8, 0.3, 1.1, 0.25, False)
+
+Allocation = namedtuple('Allocation', 'category amount share detail color')
+Phase = namedtuple('Phase', 'label title items color')
+StackColumn = namedtuple('StackColumn', 'title icon items color')
+Feature = namedtuple('Feature', 'icon title detail')
+SecurityLayer = namedtuple('SecurityLayer', 'title detail color')
+Status = namedtuple('Status', 'status detail color')
+Segment = namedtuple('Segment', 'title detail')
+ExitOption = namedtuple('ExitOption', 'title detail timeline target color')
+
+
+def _a(tag):
+    return f'{{{A_NS}}}{tag}'
+
+
+@lru_cache(maxsize=None)
+def _paragraph(style):
+    """An a:p in style with one empty run, which paragraphs are copied from"""
+    from lxml import etree
+
+    p = etree.Element(_a('p'), nsmap={'a': A_NS})
+    pPr = etree.SubElement(p, _a('pPr'))
+    if style.align:
+        pPr.set('algn', style.align)
+    if style.space_after is not None:
+        spacing = etree.SubElement(pPr, _a('spcAft'))
+        etree.SubElement(spacing, _a('spcPts'), val=str(round(style.space_after * 100)))
+    rPr = etree.SubElement(pPr, _a('defRPr'), sz=str(round(style.size * 100)))
+    if style.bold:
+        rPr.set('b', '1')
+    if style.color:
+        fill = etree.SubElement(rPr, _a('solidFill'))
+        etree.SubElement(fill, _a('srgbClr'), val=style.color)
+    etree.SubElement(etree.SubElement(p, _a('r')), _a('t'))
+    return p
+
+
+def paragraph(style, text):
+    """A new a:p element holding text in style"""
+    p = copy.deepcopy(_paragraph(style))
+    run = p[1]
+    if text:
+        run[0].text = text
+    else:
+        p.remove(run)
+    return p
+
+
+def add_text(slide, left, top, width, height, text, style, wrap=False, first=None):
+    """A text box with a paragraph per line of text in style (the first in first, if given)"""
+    from pptx.util import Inches
+
+    box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
+    txBody = box.text_frame._txBody
+    if wrap:
+        txBody.bodyPr.set('wrap', 'square')
+    for p in txBody.findall(_a('p')):
+        txBody.remove(p)
+    for i, line in enumerate(text.split('\n')):
+        txBody.append(paragraph(first if i == 0 and first else style, line))
+    return box
+
+
+def add_panel(slide, left, top, width, height, fill, line=None, line_width=None, shadow=True):
+    """A filled rounded rectangle, outlined in line line_width points wide, or borderless"""
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.util import Inches, Pt
+
+    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top),
+                                   Inches(width), Inches(height))
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = RGBColor.from_string(fill)
+    if line is None:
+        shape.line.fill.background()
+    else:
+        shape.line.color.rgb = RGBColor.from_string(line)
+        shape.line.width = Pt(line_width)
+    if not shadow:
+        shape.shadow.inherit = False
+    return shape
+
+
+def add_background(slide, prs, color):
+    """A borderless rectangle over the whole slide"""
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = RGBColor.from_string(color)
+    shape.line.fill.background()
+    return shape
+
+
+def add_title(slide, text):
+    """The slide title, across the top"""
+    return add_text(slide, 0.5, 0.3, 12.333, 0.8, text, SLIDE_TITLE)
+
+
+def add_section_title(slide, left, top, width, text, style=SECTION_TITLE):
+    """A heading over a group of components"""
+    return add_text(slide, left, top, width, 0.4, text, style)
+
+
+def stat_tile(slide, card, left, top, width=2.8, height=1.2):
+    """A MetricCard as a tile with its label over its value (no caption)"""
+    add_panel(slide, left, top, width, height, card.color, shadow=False)
+    add_text(slide, left, top + 0.2, width, 0.4, card.label, TextStyle(16, True, WHITE, CENTER))
+    add_text(slide, left, top + 0.6, width, 0.5, card.value, TextStyle(14, False, WHITE, CENTER))
+
+
+def metric_card(slide, card, left, top, layout=MARKET_CARD):
+    """A MetricCard as a tile with its value over its label and caption"""
+    inset = layout.inset
+    add_panel(slide, left, top, layout.width, layout.height, card.color, shadow=layout.shadow)
+    add_text(slide, left, top + 0.2, layout.width, 0.6, card.value, layout.value)
+    add_text(slide, left + inset, top + layout.label_top, layout.width - 2 * inset,
+             layout.label_height, card.label, layout.label, layout.wrap)
+    add_text(slide, left + inset, top + layout.caption_top, layout.width - 2 * inset,
+             layout.caption_height, card.caption, layout.caption, layout.wrap)
+
+
+def allocation_bar(slide, allocation, top, width=12.333):
+    """An Allocation as a bar filled to its share, with its category, detail and share
+
+    Text that sits on a fill wider than a fifth of the bar is white.
+    """
+    percent = float(allocation.share.strip('%'))
+    add_panel(slide, 0.5, top, width, 0.55, BG_LIGHT)
+    add_panel(slide, 0.5, top, width * (percent / 100), 0.55, allocation.color)
+    add_text(slide, 0.7, top + 0.08, 3, 0.4, f"{allocation.category} - {allocation.amount}",
+             TextStyle(16, True, WHITE if percent > 20 else DARK_GRAY))
+    add_text(slide, 4, top + 0.12, 5, 0.3, allocation.detail,
+             TextStyle(13, False, DARK_GRAY if percent < 20 else WHITE), wrap=True)
+    add_text(slide, 11.5, top + 0.08, 1, 0.4, allocation.share,
+             TextStyle(18, True, DARK_GRAY, RIGHT))
+
+
+def phase_column(slide, phase, left, width=3.8):
+    """A roadmap Phase as an outlined column: label, title, then its items"""
+    add_panel(slide, left, 1.5, width, 4.5, BG_LIGHT, line=phase.color, line_width=4)
+    add_text(slide, left + 0.2, 1.7, width - 0.4, 0.5, phase.label,
+             TextStyle(22, True, phase.color, CENTER))
+    add_text(slide, left + 0.2, 2.3, width - 0.4, 0.6, phase.title,
+             TextStyle(18, True, DARK_GRAY, CENTER), wrap=True)
+    add_text(slide, left + 0.3, 3.1, width - 0.6, 2.7, '\n'.join(phase.items),
+             TextStyle(15, False, DARK_GRAY, space_after=12))
+
+
+def stack_column(slide, column, left, width=3.8):
+    """A StackColumn as an outlined column: icon, title, then its items bulleted"""
+    add_panel(slide, left, 1.5, width, 5, BG_LIGHT, line=column.color, line_width=3)
+    add_text(slide, left + 0.2, 1.7, width - 0.4, 0.8, column.icon,
+             TextStyle(48, align=CENTER))
+    add_text(slide, left + 0.2, 2.6, width - 0.4, 0.5, column.title,
+             TextStyle(24, True, column.color, CENTER))
+    add_text(slide, left + 0.3, 3.3, width - 0.6, 3, '\n'.join(f"• {item}" for item in column.items),
+             TextStyle(16, False, DARK_GRAY, space_after=10))
+
+
+def feature_tile(slide, feature, left, top, color, width=3.8, height=1.6):
+    """A Feature as a tile of color: icon and title side by side, detail below"""
+    add_panel(slide, left, top, width, height, color)
+    add_text(slide, left + 0.2, top + 0.1, 0.6, 0.5, feature.icon, TextStyle(32))
+    add_text(slide, left + 0.9, top + 0.15, width - 1.1, 0.4, feature.title,
+             TextStyle(20, True, WHITE))
+    add_text(slide, left + 0.2, top + 0.7, width - 0.4, 0.8, feature.detail,
+             TextStyle(13, False, WHITE), wrap=True)
+
+
+def layer_tile(slide, layer, left, top, width=3.8, height=1.8):
+    """A SecurityLayer as a coloured tile: title over detail, centred"""
+    add_panel(slide, left, top, width, height, layer.color, shadow=False)
+    add_text(slide, left + 0.2, top + 0.2, width - 0.4, 0.4, layer.title,
+             TextStyle(20, True, WHITE, CENTER))
+    add_text(slide, left + 0.2, top + 0.7, width - 0.4, 1, layer.detail,
+             TextStyle(14, False, WHITE, CENTER), wrap=True)
+
+
+def status_row(slide, status, top):
+    """A Status as a coloured row: status on the left, detail on the right"""
+    add_panel(slide, 1, top, 11.333, 0.9, status.color)
+    add_text(slide, 1.3, top + 0.15, 6, 0.6, status.status, TextStyle(24, True, WHITE))
+    add_text(slide, 7.5, top + 0.2, 4.5, 0.5, status.detail, TextStyle(18, False, WHITE, RIGHT))
+
+
+def segment_row(slide, segment, top):
+    """A market Segment as an outlined row: title, then detail"""
+    add_panel(slide, 0.5, top, 12.333, 0.6, BG_LIGHT, line=PRIMARY_BLUE, line_width=2)
+    add_text(slide, 0.7, top + 0.05, 3, 0.3, segment.title, TextStyle(16, True, PRIMARY_BLUE))
+    add_text(slide, 3.8, top + 0.1, 8.5, 0.4, segment.detail, TextStyle(14, False, DARK_GRAY),
+             wrap=True)
+
+
+def exit_row(slide, option, top):
+    """An ExitOption as an outlined row: title over detail, then timeline and target"""
+    add_panel(slide, 0.5, top, 12.333, 0.85, BG_LIGHT, line=option.color, line_width=3)
+    add_text(slide, 0.7, top + 0.08, 4, 0.35, option.title, TextStyle(20, True, option.color))
+    add_text(slide, 0.7, top + 0.45, 6.5, 0.3, option.detail, TextStyle(14, False, DARK_GRAY),
+             wrap=True)
+    add_text(slide, 7.5, top + 0.15, 2, 0.3, f"⏱ {option.timeline}",
+             TextStyle(15, True, DARK_GRAY))
+    add_text(slide, 9.8, top + 0.15, 2.7, 0.3, option.target,
+             TextStyle(16, True, ACCENT_GREEN, RIGHT))
+
+
+def add_chart(slide, chart_type, left, top, width, height, categories, series,
+              number_format='General', legend=None, colors=SERIES_COLORS, workbook=False):
+    """A native chart of series, (name, values) pairs over categories
+
+    Its numbers are cached in the chart part, not drawn as shapes. legend
+    is an XL_LEGEND_POSITION, or None for no legend. Unless workbook is
+    set the embedded spreadsheet PowerPoint edits chart data in is left
+    out: it costs some 5 KB a chart, is stamped with the time it was
+    written, and the numbers belong in the data file anyway.
+    """
+    from pptx.chart.data import CategoryChartData
+    from pptx.chart.plot import LinePlot
+    from pptx.dml.color import RGBColor
+    from pptx.util import Inches, Pt
+
+    chart_data = CategoryChartData(number_format=number_format)
+    chart_data.categories = categories
+    for name, values in series:
+        chart_data.add_series(name, values)
+    frame = slide.shapes.add_chart(chart_type, Inches(left), Inches(top), Inches(width),
+                                   Inches(height), chart_data)
+    chart = frame.chart
+    external = chart._chartSpace.externalData
+    if not workbook and external is not None:
+        chart._chartSpace._remove_externalData()
+        frame.chart_part.drop_rel(external.rId)
+    chart.font.size = Pt(CHART_FONT_SIZE)
+    chart.font.color.rgb = RGBColor.from_string(DARK_GRAY)
+    chart.has_legend = legend is not None
+    if legend is not None:
+        chart.legend.position = legend
+        chart.legend.include_in_layout = False
+    plot = chart.plots[0]
+    for plot_series, color in zip(plot.series, colors):
+        if isinstance(plot, LinePlot):
+            plot_series.format.line.color.rgb = RGBColor.from_string(color)
+            plot_series.smooth = False
+        else:
+            plot_series.format.fill.solid()
+            plot_series.format.fill.fore_color.rgb = RGBColor.from_string(color)
+    return chart
+
+
+def revenue_mix_chart(slide, streams, left, top, width, height):
+    """A doughnut of revenue streams' shares (in %), labelled with their percentages
+
+    The chart is square, with a legend of the streams' names and
+    descriptions in the rest of the width.
+    """
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE
+
+    size = min(height, width * 0.4)
+    chart = add_chart(slide, XL_CHART_TYPE.DOUGHNUT, left, top + (height - size) / 2, size, size,
+                      [s['name'] for s in streams],
+                      [('Share', [s['share'] / 100 for s in streams])], '0%', colors=())
+    plot = chart.plots[0]
+    plot.vary_by_categories = True
+    colors = SERIES_COLORS * len(streams)
+    for point, color in zip(plot.series[0].points, colors):
+        point.format.fill.solid()
+        point.format.fill.fore_color.rgb = RGBColor.from_string(color)
+    plot.has_data_labels = True
+    labels = plot.data_labels
+    labels.number_format = '0%'
+    labels.number_format_is_linked = False
+    labels.font.bold = True
+    labels.font.color.rgb = RGBColor.from_string(WHITE)
+
+    pitch = min(0.65, height / len(streams))
+    legend_top = top + (height - pitch * len(streams)) / 2
+    for i, (stream, color) in enumerate(zip(streams, colors)):
+        legend_entry(slide, stream, color, left + size + 0.2, legend_top + i * pitch,
+                     width - size - 0.2)
+    return chart
+
+
+def legend_entry(slide, stream, color, left, top, width):
+    """A revenue stream's swatch of color beside its name, over its description if any"""
+    add_panel(slide, left, top + 0.07, 0.18, 0.18, color, shadow=False)
+    add_text(slide, left + 0.3, top, width - 0.3, 0.3, stream['name'],
+             TextStyle(13, True, DARK_GRAY))
+    if stream.get('description'):
+        add_text(slide, left + 0.3, top + 0.27, width - 0.3, 0.3, stream['description'],
+                 TextStyle(11, False, DARK_GRAY))
+
+
+def projection_chart(slide, projection, left, top, width, height):
+    """Costs and profit stacked into each year's revenue, for a Projection
+
+    A loss would stack into a bar shorter than the costs, so if any year
+    makes one, revenue and costs stand side by side instead.
+    """
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+
+    if any(profit < 0 for profit in projection.profit):
+        chart_type = XL_CHART_TYPE.COLUMN_CLUSTERED
+        series = [('Revenue', projection.revenue), ('Costs', projection.costs)]
+        colors = (PRIMARY_BLUE, LIGHT_GRAY)
+    else:
+        chart_type = XL_CHART_TYPE.COLUMN_STACKED
+        series = [('Costs', projection.costs), ('Profit', projection.profit)]
+        colors = (LIGHT_GRAY, ACCENT_GREEN)
+    chart = add_chart(slide, chart_type, left, top, width, height,
+                      [f"{year}\n{users / 1000:,.0f}K users"
+                       for year, users in zip(projection.years, projection.users)],
+                      series, MONEY_FORMAT, XL_LEGEND_POSITION.BOTTOM, colors)
+    chart.plots[0].gap_width = 60
+    chart.value_axis.tick_labels.number_format = '"R "0"M"'
+    chart.value_axis.tick_labels.number_format_is_linked = False
+    return chart
+
+
+def payback_chart(slide, projection, investment, left, top, width, height):
+    """A line of a Projection's cumulative profit against the money invested"""
+    from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+
+    chart = add_chart(slide, XL_CHART_TYPE.LINE_MARKERS, left, top, width, height,
+                      projection.years,
+                      [('Cumulative profit', projection.cumulative_profit),
+                       ('Investment', [investment] * len(projection.years))],
+                      MONEY_FORMAT, XL_LEGEND_POSITION.BOTTOM, (ACCENT_GREEN, ACCENT_ORANGE))
+    chart.value_axis.tick_labels.number_format = '"R "0"M"'
+    chart.value_axis.tick_labels.number_format_is_linked = False
+    return chart
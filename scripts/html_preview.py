@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Static HTML preview of a parsed deck, for review without an office suite
+"""
+
+import base64
+import io
+import mimetypes
+import os
+from collections import namedtuple
+from html import escape
+
+from code_highlight import CODE_FONT, highlight_lines
+
+# Theme colours as hex RGB strings ('0284C7'), like the deck generators use
+Theme = namedtuple('Theme', 'title text accent code')
+
+# Link schemes a preview may open; anything else (javascript:, data:) is
+# shown as plain text
+SAFE_SCHEMES = ('http', 'https', 'mailto')
+
+_ALIGN = {'l': 'left', 'c': 'center', 'r': 'right'}
+
+STYLESHEET = """
+body { margin: 0; padding: 18pt; background: #E5E7EB; color: #%(text)s;
+       font: 16pt/1.2 Calibri, Carlito, "Segoe UI", Arial, sans-serif; }
+.slide { position: relative; box-sizing: border-box; width: 10in; min-height: 7.5in;
+         margin: 0 auto 18pt; padding: 0.3in 0.5in; background: #FFFFFF;
+         box-shadow: 0 1px 4px rgba(0, 0, 0, 0.2); }
+.slide > h2 { margin: 0 0 18pt; color: #%(title)s; font-size: 40pt; line-height: 1.1; }
+.number { position: absolute; right: 12pt; bottom: 9pt; color: #%(accent)s; font-size: 9pt; }
+h3 { margin: 9pt 0 3pt; font-size: 16pt; }
+p { margin: 0 0 6pt; }
+ul { margin: 0 0 6pt; padding: 0; list-style: none; }
+li { position: relative; margin: 0 0 6pt; padding-left: 27pt; }
+li::before { content: "\\2022"; position: absolute; left: 9pt; color: #%(accent)s; }
+li.d1 { margin-left: 31.5pt; } li.d2 { margin-left: 63pt; }
+li.d3 { margin-left: 99pt; } li.d4 { margin-left: 135pt; }
+a { color: #%(accent)s; }
+code, pre { font-family: "%(code_font)s", monospace; }
+pre { margin: 0 0 6pt; padding: 6pt 9pt; color: #%(code)s; background: #F8FAFC;
+      border-left: 3pt solid #%(accent)s; font-size: 12pt; line-height: 1.2;
+      white-space: pre-wrap; }
+table { margin: 6pt 0; border-collapse: collapse; font-size: 12pt; width: 100%%; }
+th, td { padding: 3.6pt 7.2pt; border: 1px solid #CBD5E1; }
+th { color: #FFFFFF; background: #%(accent)s; }
+tr:nth-child(even) td { background: #F1F5F9; }
+figure { margin: 6pt 0; text-align: center; }
+img { max-width: 100%%; max-height: 5in; }
+figcaption, .missing { color: #6B7280; font-size: 12pt; }
+.notes { margin-top: 12pt; padding-top: 6pt; border-top: 1px dashed #CBD5E1;
+         color: #6B7280; font-size: 12pt; white-space: pre-wrap; }
+"""
+
+
+def link_target(url):
+    """url if a preview may link to it, else None"""
+    scheme, sep, _ = url.partition(':')
+    if not sep or '/' in scheme or scheme.lower() in SAFE_SCHEMES:
+        return url
+    return None
+
+
+def runs_html(runs):
+    """Inline runs as HTML"""
+    parts = []
+    for run in runs:
+        text = escape(run.text, quote=False)
+        if run.code:
+            text = f'<code>{text}</code>'
+        if run.italic:
+            text = f'<em>{text}</em>'
+        if run.bold:
+            text = f'<strong>{text}</strong>'
+        href = run.link and link_target(run.link)
+        if href:
+            text = f'<a href="{escape(href)}">{text}</a>'
+        parts.append(text)
+    return ''.join(parts)
+
+
+def code_html(code, lang, default_color):
+    """A highlighted code block, coloured like code_highlight's runs"""
+    spans = {}
+
+    def span(style):
+        color, bold, italic = style
+        if style not in spans:
+            css = f'color:#{color}' + (';font-weight:bold' if bold else '') + \
+                  (';font-style:italic' if italic else '')
+            spans[style] = f'<span style="{css}">'
+        return spans[style]
+
+    plain = (default_color, False, False)
+    lines = []
+    for line in highlight_lines(code, lang, default_color):
+        lines.append(''.join(
+            escape(text, quote=False) if style == plain
+            else f'{span(style)}{escape(text, quote=False)}</span>'
+            for text, style in line
+        ))
+    return '<pre>' + '\n'.join(lines) + '</pre>'
+
+
+def table_html(rows, alignments, inline):
+    """A pipe table, header row first"""
+    def cells(row, tag):
+        out = []
+        for c, text in enumerate(row):
+            align = _ALIGN.get(alignments[c:c + 1])
+            attr = f' style="text-align:{align}"' if align and align != 'left' else ''
+            out.append(f'<{tag}{attr}>{runs_html(inline(text))}</{tag}>')
+        return ''.join(out)
+
+    head, *body = rows
+    return (f'<table><thead><tr>{cells(head, "th")}</tr></thead><tbody>' +
+            ''.join(f'<tr>{cells(row, "td")}</tr>' for row in body) + '</tbody></table>')
+
+
+def _image_data(path):
+    """The bytes and MIME type of an image file, or None if it is not one
+
+    Only files named as an image/* type that Pillow can open are read, so
+    a path in the markdown cannot pull other files into the page.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    mime = mimetypes.guess_type(path)[0]
+    if not mime or not mime.startswith('image/'):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        with Image.open(io.BytesIO(data)) as image:
+            image.verify()
+    except (OSError, UnidentifiedImageError, SyntaxError, ValueError):
+        return None
+    return data, mime
+
+
+def image_html(path, alt):
+    """An image embedded as a data: URI, so the preview is one file"""
+    image = _image_data(path)
+    if image is None:
+        return f'<p class="missing">🖼 {escape(alt or os.path.basename(path))} (missing)</p>'
+    data, mime = image
+    src = f'data:{mime};base64,{base64.b64encode(data).decode("ascii")}'
+    caption = f'<figcaption>{escape(alt)}</figcaption>' if alt else ''
+    return f'<figure><img src="{src}" alt="{escape(alt)}">{caption}</figure>'
+
+
+def slide_html(slide, number, inline, theme):
+    """One source slide as a <section>
+
+    Slides are not paginated: content that would spill onto continuation
+    slides in the .pptx stays on its slide's card.
+    """
+    title = escape(''.join(run.text for run in inline(slide.title)), quote=False)
+    parts = [f'<section class="slide" id="slide-{number}"><h2>{title}</h2>']
+    in_list = False
+    for block in slide.blocks:
+        if (block.kind == 'bullet') != in_list:
+            parts.append('<ul>' if not in_list else '</ul>')
+            in_list = not in_list
+        if block.kind == 'bullet':
+            depth = min(block.depth, 4)
+            parts.append(f'<li class="d{depth}">' if depth else '<li>')
+            parts.append(runs_html(inline(block.text)) + '</li>')
+        elif block.kind == 'heading':
+            parts.append(f'<h3>{runs_html(inline(block.text))}</h3>')
+        elif block.kind == 'paragraph':
+            parts.append(f'<p>{runs_html(inline(block.text))}</p>')
+        elif block.kind == 'code':
+            parts.append(code_html(block.code, block.lang, theme.code))
+        elif block.kind == 'table':
+            parts.append(table_html(block.rows, block.alignments, inline))
+        elif block.kind == 'image':
+            parts.append(image_html(block.path, block.alt))
+    if in_list:
+        parts.append('</ul>')
+    if slide.notes:
+        parts.append(f'<aside class="notes">{escape(slide.notes, quote=False)}</aside>')
+    parts.append(f'<span class="number">{number}</span></section>\n')
+    return ''.join(parts)
+
+
+def page_head(title, theme):
+    """Everything before the first slide"""
+    css = STYLESHEET % dict(theme._asdict(), code_font=CODE_FONT)
+    return ('<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f'<title>{escape(title)}</title><style>{css}</style></head><body>\n')
+
+
+PAGE_TAIL = '</body></html>\n'
@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Direct OOXML writer: python-pptx compatible decks without the object model
+"""
+
+import heapq
+import io
+import os
+import posixpath
+import re
+import time
+import zipfile
+
+from deck_profile import NO_PROFILER
+
+XML_HEADER = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+TYPES_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+SLIDE_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.slide+xml'
+
+# Relationship types, as in pptx.opc.constants.RELATIONSHIP_TYPE
+_RT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+RT_OFFICE_DOCUMENT = _RT + 'officeDocument'
+RT_SLIDE = _RT + 'slide'
+RT_SLIDE_LAYOUT = _RT + 'slideLayout'
+RT_HYPERLINK = _RT + 'hyperlink'
+RT_SLIDE_MASTER = _RT + 'slideMaster'
+RT_NOTES_SLIDE = _RT + 'notesSlide'
+RT_NOTES_MASTER = _RT + 'notesMaster'
+RT_THEME = _RT + 'theme'
+
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)  # The earliest timestamp a zip member can hold
+
+_CTRL_CHARS = re.compile(r'[\x00-\x08\x0B-\x1F]')
+_ATTR_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'}
+
+
+def xml_text(text):
+    """Text content escaped as lxml would, with python-pptx's control-char escapes"""
+    text = _CTRL_CHARS.sub(lambda m: '_x%04X_' % ord(m.group()), text)
+    return text.replace('&', '&amp;').replace('>', '&gt;').replace('<', '&lt;')
+
+
+def xml_attr(value):
+    """Attribute value escaped as lxml would"""
+    value = value.replace('&', '&amp;').replace('>', '&gt;').replace('<', '&lt;')
+    for char, entity in _ATTR_ENTITIES.items():
+        value = value.replace(char, entity)
+    return value
+
+
+def run_xml(text, bold=False, italic=False, font=None, rid=None):
+    """An a:r element, as python-pptx writes a run with these font settings"""
+    attrs = (' b="1"' if bold else '') + (' i="1"' if italic else '')
+    children = (f'<a:latin typeface="{xml_attr(font)}"/>' if font else '') + \
+               (f'<a:hlinkClick r:id="{rid}"/>' if rid else '')
+    if children:
+        rpr = f'<a:rPr{attrs}>{children}</a:rPr>'
+    elif attrs:
+        rpr = f'<a:rPr{attrs}/>'
+    else:
+        rpr = ''
+    return f'<a:r>{rpr}<a:t>{xml_text(text)}</a:t></a:r>'
+
+
+def paragraph_xml(content, level=0, size_pt=None, color=None, bold=False, font=None):
+    """An a:p element whose paragraph font is set through python-pptx's proxies"""
+    lvl = f' lvl="{level}"' if level else ''
+    attrs = (f' sz="{int(size_pt * 100)}"' if size_pt else '') + (' b="1"' if bold else '')
+    children = (f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>' if color else '') + \
+               (f'<a:latin typeface="{xml_attr(font)}"/>' if font else '')
+    if children:
+        pPr = f'<a:pPr{lvl}><a:defRPr{attrs}>{children}</a:defRPr></a:pPr>'
+    elif attrs:
+        pPr = f'<a:pPr{lvl}><a:defRPr{attrs}/></a:pPr>'
+    elif lvl:
+        pPr = f'<a:pPr{lvl}/>'
+    else:
+        pPr = ''
+    if not (pPr or content):
+        return '<a:p/>'
+    return f'<a:p>{pPr}{content}</a:p>'
+
+
+def textbox_xml(shape_id, left, top, width, height, paragraphs, list_style='<a:lstStyle/>'):
+    """A p:sp text box, as python-pptx's add_textbox writes one with word wrap on
+
+    Positions are in EMU; paragraphs are a:p strings and list_style the
+    box's a:lstStyle (see copy_list_style).
+    """
+    return (
+        f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {shape_id - 1}"/>'
+        '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr><p:spPr><a:xfrm>'
+        f'<a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr><p:txBody>'
+        f'<a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr>{list_style}{paragraphs}'
+        '</p:txBody></p:sp>'
+    )
+
+
+def copy_list_style(txBody, layout):
+    """Give a text body the list levels (bullets, margins) of the layout master's body text"""
+    import copy
+
+    from pptx.oxml.ns import qn
+
+    body_style = layout.slide_master._element.find('.//' + qn('p:bodyStyle'))
+    lstStyle = txBody.find(qn('a:lstStyle'))
+    for level in body_style if body_style is not None else ():
+        if isinstance(level.tag, str):
+            lstStyle.append(copy.deepcopy(level))
+
+
+def rels_xml(rels):
+    """A .rels part for (rId, type, target, external) tuples, in rId order"""
+    def number(rel):
+        rid = rel[0]
+        return int(rid[3:]) if rid.startswith('rId') and rid[3:].isdigit() else 0
+
+    items = []
+    for rid, reltype, target, external in sorted(rels, key=number):
+        mode = ' TargetMode="External"' if external else ''
+        items.append(f'<Relationship Id="{rid}" Type="{reltype}" '
+                     f'Target="{xml_attr(target)}"{mode}/>')
+    return f'{XML_HEADER}<Relationships xmlns="{RELS_NS}">{"".join(items)}</Relationships>'.encode()
+
+
+def reproducible_date_time():
+    """The fixed zip timestamp of reproducible output
+
+    SOURCE_DATE_EPOCH (seconds since 1970, UTC) when it is set, as
+    reproducible-builds.org specifies, otherwise ZIP_EPOCH.
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if not epoch:
+        return ZIP_EPOCH
+    return max(time.gmtime(int(epoch))[:6], ZIP_EPOCH)
+
+
+def zip_info(name, date_time=None):
+    """ZipInfo for a deflated member, as ZipFile.writestr makes it; None dates it now"""
+    info = zipfile.ZipInfo(name, date_time=date_time or time.localtime(time.time())[:6])
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16  # As ZipFile.writestr sets for a name
+    return info
+
+
+class SlideLinks:
+    """External hyperlink relationships of one slide, numbered like python-pptx"""
+
+    def __init__(self):
+        self.targets = {}
+
+    def rid(self, url):
+        """rId for a hyperlink target; rId1 is always the slide layout"""
+        if url not in self.targets:
+            self.targets[url] = f'rId{len(self.targets) + 2}'
+        return self.targets[url]
+
+
+def _lexicographic(count):
+    """1..count in the order their decimal strings sort, without a list"""
+    current = 1
+    for _ in range(count):
+        yield current
+        if current * 10 <= count:
+            current *= 10
+        else:
+            while current % 10 == 9 or current >= count:
+                current //= 10
+            current += 1
+
+
+def rels_member(partname):
+    """Zip member holding a part's relationships ('' is the package itself)"""
+    directory, name = posixpath.split(partname)
+    return posixpath.join(directory, '_rels', name + '.rels')
+
+
+def read_rels(members, partname):
+    """(rId, type, target, external) tuples of a part, in file order"""
+    from lxml import etree
+
+    data = members.get(rels_member(partname))
+    if data is None:
+        return []
+    return [
+        (rel.get('Id'), rel.get('Type'), rel.get('Target'), rel.get('TargetMode') == 'External')
+        for rel in etree.fromstring(data)
+    ]
+
+
+def resolve_target(partname, target):
+    """Zip member name of an internal relationship target"""
+    if target.startswith('/'):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(posixpath.dirname(partname), target))
+
+
+class _BasePackage:
+    """A template snapshot taken apart for direct writing
+
+    Holds the template's zip members, the order python-pptx writes them
+    in (a depth-first walk of the relationship graph), the serialized
+    slide skeleton the layout produces, split where the title text, body
+    text and extra shapes go, and the a:lstStyle of text boxes styled
+    like the body (see copy_list_style). Built with python-pptx and lxml,
+    but holds only strings and bytes, so it is pickled with the snapshot
+    and later runs write decks without importing either.
+    """
+
+    def __init__(self, snapshot, layout_name):
+        from lxml import etree
+
+        with zipfile.ZipFile(io.BytesIO(snapshot.data)) as zf:
+            self.members = {name: zf.read(name) for name in zf.namelist()}
+
+        self.presentation = next(
+            resolve_target('', target) for _, reltype, target, _ in read_rels(self.members, '')
+            if reltype == RT_OFFICE_DOCUMENT
+        )
+        self.presentation_rels = read_rels(self.members, self.presentation)
+        self.order = self._walk()
+
+        types = etree.fromstring(self.members['[Content_Types].xml'])
+        self.defaults = {el.get('Extension'): el.get('ContentType')
+                         for el in types if el.tag == f'{{{TYPES_NS}}}Default'}
+        self.overrides = {el.get('PartName'): el.get('ContentType')
+                          for el in types if el.tag == f'{{{TYPES_NS}}}Override'}
+
+        self._compile_skeleton(snapshot, layout_name)
+        self._compile_presentation()
+
+    def template_members(self):
+        """(name, bytes) of every template part, in python-pptx's write order
+
+        Leaves out the parts that list the slides, which DirectDeck writes
+        last.
+        """
+        if '_rels/.rels' in self.members:
+            yield '_rels/.rels', self.members['_rels/.rels']
+        for part in self.order:
+            if part is None or part == self.presentation:
+                continue
+            yield part, self.members[part]
+            rels = rels_member(part)
+            if rels in self.members:
+                yield rels, self.members[rels]
+
+    def _compile_presentation(self):
+        """Split the serialized presentation part where slide ids go"""
+        from lxml import etree
+        from pptx.opc.oxml import serialize_part_xml
+        from pptx.oxml import parse_xml
+
+        presentation = parse_xml(self.members[self.presentation])
+        sldIdLst = presentation.get_or_add_sldIdLst()
+        self.first_slide_id = sldIdLst._next_id
+        self.empty_presentation = serialize_part_xml(presentation)
+        sldIdLst.append(etree.Comment('SLIDES'))
+        self.presentation_head, self.presentation_tail = \
+            serialize_part_xml(presentation).split(b'<!--SLIDES-->')
+
+    def slide_rids(self):
+        """rId numbers of new slide relationships, in slide order
+
+        Reproduces python-pptx's choice (the highest free number up to
+        len + 1) while only remembering numbers within the template's range.
+        """
+        used = {int(rid[3:]) for rid, _, _, _ in self.presentation_rels
+                if rid.startswith('rId') and rid[3:].isdigit()}
+        top = max(used, default=0)
+        size = len(self.presentation_rels)
+        while True:
+            size += 1
+            if size > top:
+                yield size
+                continue
+            number = next(n for n in range(size, 0, -1) if n not in used)
+            used.add(number)
+            yield number
+
+    def presentation_chunks(self, count):
+        """The presentation part listing count slides, in pieces"""
+        if not count:
+            yield self.empty_presentation
+            return
+        yield self.presentation_head
+        rids = self.slide_rids()
+        for slide_id in range(self.first_slide_id, self.first_slide_id + count):
+            yield f'<p:sldId id="{slide_id}" r:id="rId{next(rids)}"/>'
+        yield self.presentation_tail
+
+    def presentation_rels_chunks(self, count):
+        """The presentation part's rels with count slides, in pieces"""
+        def number(rid):
+            return int(rid[3:]) if rid.startswith('rId') and rid[3:].isdigit() else 0
+
+        def slide_rel(rid, n):
+            target = posixpath.relpath(f'ppt/slides/slide{n}.xml', directory)
+            return rid, (f'rId{rid}', RT_SLIDE, target, False)
+
+        directory = posixpath.dirname(self.presentation)
+        existing = sorted((number(rel[0]), rel) for rel in self.presentation_rels)
+
+        # New numbers only come out of order while they fill gaps in the
+        # template's range; after that they run upwards one by one
+        top = max((n for n, _ in existing), default=0)
+        early_count = min(count, max(0, top - len(existing)))
+        rids = self.slide_rids()
+        early = sorted(slide_rel(next(rids), n) for n in range(1, early_count + 1))
+        later = (slide_rel(next(rids), n) for n in range(early_count + 1, count + 1))
+
+        yield f'{XML_HEADER}<Relationships xmlns="{RELS_NS}">'
+        for _, (rid, reltype, target, external) in heapq.merge(existing, early, later):
+            mode = ' TargetMode="External"' if external else ''
+            yield (f'<Relationship Id="{rid}" Type="{reltype}" '
+                   f'Target="{xml_attr(target)}"{mode}/>')
+        yield '</Relationships>'
+
+    def content_types_chunks(self, count):
+        """[Content_Types].xml with count slides, in pieces"""
+        slides = (f'/ppt/slides/slide{n}.xml' for n in _lexicographic(count))
+        overrides = heapq.merge(
+            sorted(self.overrides.items()),
+            ((name, SLIDE_CONTENT_TYPE) for name in slides),
+        )
+        yield f'{XML_HEADER}<Types xmlns="{TYPES_NS}">'
+        for ext, ct in sorted(self.defaults.items()):
+            yield f'<Default Extension="{ext}" ContentType="{ct}"/>'
+        for name, ct in overrides:
+            yield f'<Override PartName="{name}" ContentType="{ct}"/>'
+        yield '</Types>'
+
+    def _walk(self):
+        """Part names in python-pptx's write order, with None where new slides go"""
+        order = []
+        visited = set()
+
+        def walk(partname):
+            for _, _, target, external in read_rels(self.members, partname):
+                if external:
+                    continue
+                part = resolve_target(partname, target)
+                if part in visited:
+                    continue
+                visited.add(part)
+                order.append(part)
+                walk(part)
+            if partname == self.presentation:
+                order.append(None)  # New slide relationships come last
+
+        walk('')
+        return order
+
+    def _compile_skeleton(self, snapshot, layout_name):
+        """Serialize one empty slide from the layout, as python-pptx builds it"""
+        from lxml import etree
+        from pptx.opc.oxml import serialize_part_xml
+
+        prs = snapshot.new_presentation()
+        layout = prs.slide_layouts[snapshot.layout_index(layout_name)]
+        self.layout_target = layout.part.partname.relative_ref('/ppt/slides/')
+        slide = prs.slides.add_slide(layout)
+        spTree = slide.shapes._spTree
+        self.float_shape_id = spTree.max_shape_id + 1
+
+        title = slide.shapes.title._element
+        body = next(ph for ph in slide.placeholders if ph.placeholder_format.idx == 1)._element
+        for shape, mark in ((title, 'TITLE'), (body, 'BODY')):
+            txBody = shape.txBody
+            for p in txBody.p_lst:
+                txBody.remove(p)
+            txBody.append(etree.Comment(mark))
+        spTree.append(etree.Comment('FLOATS'))
+
+        def split(xml):
+            parts = re.split(r'<!--(?:TITLE|BODY|FLOATS)-->', xml.decode('utf-8'))
+            return [part.encode('utf-8') for part in parts]
+
+        self.with_body = split(serialize_part_xml(slide._element))
+        body.getparent().remove(body)
+        self.without_body = split(serialize_part_xml(slide._element))
+
+        box = prs.slides.add_slide(layout).shapes.add_textbox(0, 0, 0, 0)
+        copy_list_style(box.text_frame._txBody, layout)
+        xml = serialize_part_xml(box._element).decode('utf-8')
+        self.body_list_style = re.search(r'<a:lstStyle/>|<a:lstStyle>.*?</a:lstStyle>', xml).group()
+
+
+def base_package(snapshot, layout_name):
+    """The compiled base package for a template snapshot, built on first use"""
+    return snapshot.artifact(f'direct:{layout_name}', lambda s: _BasePackage(s, layout_name))
+
+
+class DirectDeck:
+    """A deck streamed straight into its .pptx as XML strings, skipping python-pptx
+
+    Slides come from the layout's skeleton with the title paragraph, body
+    paragraphs and extra shapes (tables) filled in by the caller, so a
+    slide costs a few string joins instead of hundreds of proxy and lxml
+    calls. Each slide is compressed into the zip as soon as it is added
+    and nothing of it is kept, so memory stays flat however long the deck
+    is. Template parts go in first and are copied verbatim; the parts that
+    list the slides ([Content_Types].xml, the presentation part and its
+    rels) are generated incrementally on close(). Every part matches what
+    Presentation.save would write byte for byte; the members are in
+    canonical order (see canonical_members) rather than python-pptx's.
+    With a fixed date_time for every member the file is reproducible.
+    """
+
+    def __init__(self, snapshot, layout_name, output_file, profiler=NO_PROFILER, date_time=None):
+        self._base = base_package(snapshot, layout_name)
+        self._profiler = profiler
+        self._date_time = date_time
+        self._count = 0
+        self._zip = zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False)
+        with profiler.phase('zip write'):
+            for name, blob in self._base.template_members():
+                self._write(name, blob)
+
+    @property
+    def float_shape_id(self):
+        """Shape id python-pptx gives the first shape added after the placeholders"""
+        return self._base.float_shape_id
+
+    @property
+    def body_list_style(self):
+        """a:lstStyle of text boxes styled like the body placeholder"""
+        return self._base.body_list_style
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
+
+    def add_slide(self, title_xml, body_xml, floats_xml='', links=None):
+        """Write a slide; body_xml None drops the body placeholder"""
+        if body_xml is None:
+            head, middle, tail = self._base.without_body
+            xml = b''.join((head, title_xml.encode(), middle, floats_xml.encode(), tail))
+        else:
+            head, middle, after_body, tail = self._base.with_body
+            xml = b''.join((head, title_xml.encode(), middle, body_xml.encode(),
+                            after_body, floats_xml.encode(), tail))
+
+        rels = [('rId1', RT_SLIDE_LAYOUT, self._base.layout_target, False)]
+        if links is not None:
+            rels.extend((rid, RT_HYPERLINK, url, True) for url, rid in links.targets.items())
+
+        self._count += 1
+        partname = f'ppt/slides/slide{self._count}.xml'
+        with self._profiler.phase('zip write'):
+            self._write(partname, xml)
+            self._write(rels_member(partname), rels_xml(rels))
+
+    def close(self):
+        """Write the slide-listing parts and finish the zip"""
+        base = self._base
+        count = self._count
+        with self._profiler.phase('xml serialize'):
+            self._stream(base.presentation, base.presentation_chunks(count))
+            self._stream(rels_member(base.presentation), base.presentation_rels_chunks(count))
+            self._stream('[Content_Types].xml', base.content_types_chunks(count))
+        self._zip.close()
+
+    def _write(self, name, blob):
+        self._zip.writestr(zip_info(name, self._date_time), blob)
+
+    def _stream(self, name, chunks):
+        with self._zip.open(zip_info(name, self._date_time), 'w') as member:
+            for chunk in chunks:
+                member.write(chunk.encode() if isinstance(chunk, str) else chunk)
+
+
+class SlideRecorder:
+    """Stands in for a DirectDeck where slides are rendered apart from the zip
+
+    Keeps each add_slide call's arguments (plain strings and a SlideLinks),
+    so a worker process can send them back for DirectDeck.add_slide to
+    replay in order.
+    """
+
+    def __init__(self, float_shape_id, body_list_style):
+        self.float_shape_id = float_shape_id
+        self.body_list_style = body_list_style
+        self.slides = []
+
+    def __len__(self):
+        return len(self.slides)
+
+    def add_slide(self, title_xml, body_xml, floats_xml='', links=None):
+        self.slides.append((title_xml, body_xml, floats_xml, links))
+
+
+def canonical_members(prs):
+    """(member name, blob) of a python-pptx presentation, in canonical order
+
+    The order DirectDeck streams a deck in: the package rels, then every
+    part reachable without going through a slide (depth first, in
+    relationship order, each followed by its rels), then each slide in
+    deck order with the parts it brings in (notes, media), and last the
+    parts that list the slides: the presentation part, its rels and
+    [Content_Types].xml.
+    """
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.serialized import _ContentTypesItem
+
+    package = prs.part.package
+    presentation = prs.part
+    order = []
+    visited = set()
+
+    def walk(rels):
+        for rel in rels.values():
+            if rel.is_external or rel.reltype == RT_SLIDE:
+                continue
+            part = rel.target_part
+            if part not in visited:
+                visited.add(part)
+                order.append(part)
+                walk(part.rels)
+
+    walk(package._rels)
+    for slide in prs.slides:
+        if slide.part not in visited:
+            visited.add(slide.part)
+            order.append(slide.part)
+            walk(slide.part.rels)
+    order.remove(presentation)
+    order.append(presentation)
+
+    yield '_rels/.rels', package._rels.xml
+    for part in order:
+        yield part.partname.membername, part.blob
+        if part._rels:
+            yield part.partname.rels_uri.membername, part.rels.xml
+    yield '[Content_Types].xml', serialize_part_xml(_ContentTypesItem.xml_for(order))
+
+
+def save_canonical(prs, output_file, date_time=None, profiler=NO_PROFILER):
+    """Save a python-pptx presentation in canonical member order
+
+    With a fixed date_time the output depends only on the deck, and is
+    byte-identical to what DirectDeck writes for the same slides.
+    """
+    with profiler.phase('xml serialize'):
+        members = list(canonical_members(prs))
+    with profiler.phase('zip write'):
+        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED, strict_timestamps=False) as zf:
+            for name, blob in members:
+                zf.writestr(zip_info(name, date_time), blob)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Render slides in worker processes and merge them into one deck
+
+Each worker builds a few slides into a presentation of its own, from the
+same template, and sends them back as SlideFragments: serialized slide
+XML plus the relationships and parts the slide owns (pictures, speaker
+notes). The parent grafts the fragments onto its deck in order, making
+the same python-pptx calls a serial build makes, so part names, rIds and
+slide ids come out exactly as if the slides had been built in place.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import re
+from collections import namedtuple
+from itertools import islice
+
+from ooxml_writer import RT_SLIDE
+
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NOTES_SLIDE_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.notesSlide+xml'
+
+SLIDES_PER_TASK = 16  # Source slides sent to a worker at a time
+
+# A slide as worker output: its XML and its relationships, in the order
+# they were made (so re-relating them hands out the same rIds)
+SlideFragment = namedtuple('SlideFragment', 'blob rels')
+
+# target is the URL of an external relationship or the partname of a
+# template part (the layout); part is the FragmentPart a slide owns, or None
+FragmentRel = namedtuple('FragmentRel', 'rid reltype target external part')
+FragmentPart = namedtuple('FragmentPart', 'partname content_type blob rels')
+
+
+def _shared_parts(prs):
+    """Every part reachable without going through a slide: the template's"""
+    shared = set()
+
+    def walk(rels):
+        for rel in rels.values():
+            if rel.is_external or rel.reltype == RT_SLIDE or rel.target_part in shared:
+                continue
+            shared.add(rel.target_part)
+            walk(rel.target_part.rels)
+
+    walk(prs.part.package._rels)
+    return shared
+
+
+def _fragment_rels(part, shared, owner):
+    """FragmentRels of a part; owner is the slide, which a notes slide points back to"""
+    rels = []
+    for rel in part.rels.values():
+        if rel.is_external:
+            rels.append(FragmentRel(rel.rId, rel.reltype, rel.target_ref, True, None))
+            continue
+        target = rel.target_part
+        if target in shared or target is owner:
+            rels.append(FragmentRel(rel.rId, rel.reltype, str(target.partname), False, None))
+            continue
+        child = FragmentPart(str(target.partname), target.content_type, target.blob,
+                             _fragment_rels(target, shared, owner))
+        rels.append(FragmentRel(rel.rId, rel.reltype, None, False, child))
+    return tuple(rels)
+
+
+def slide_fragments(prs):
+    """The slides of a presentation as SlideFragments, in deck order"""
+    shared = _shared_parts(prs)
+    return [
+        SlideFragment(slide.part.blob, _fragment_rels(slide.part, shared, slide.part))
+        for slide in prs.slides
+    ]
+
+
+def _renumber(element, rids):
+    """Rewrite r:id-style attributes for the rIds that changed"""
+    prefix = f'{{{R_NS}}}'
+    for el in element.iter():
+        for name, value in el.attrib.items():
+            if name.startswith(prefix) and value in rids:
+                el.set(name, rids[value])
+
+
+def _graft_part(package, fragment_part):
+    """A copy of a slide-owned part in package, named like its first free slot"""
+    from pptx.opc.package import PartFactory
+
+    template = re.sub(r'\d+(\.\w+)$', r'%d\1', fragment_part.partname)
+    return PartFactory(package.next_partname(template), fragment_part.content_type, package,
+                       fragment_part.blob)
+
+
+def _graft_rels(part, rels, template_parts):
+    """Relate part to everything its fragment did; returns {old rId: new rId}"""
+    from pptx.oxml import parse_xml
+    from pptx.parts.slide import NotesSlidePart
+
+    package = part.package
+    renamed = {}
+    for rel in rels:
+        if rel.external:
+            rid = part.relate_to(rel.target, rel.reltype, is_external=True)
+        elif rel.part is None:
+            rid = part.relate_to(template_parts[rel.target], rel.reltype)
+        elif rel.part.content_type == NOTES_SLIDE_TYPE:
+            # Made the way SlidePart.notes_slide makes it, against this
+            # deck's notes master, then filled with the worker's notes
+            notes_part = NotesSlidePart._add_notes_slide_part(
+                package, part, package.presentation_part.notes_master_part)
+            notes_part._element = parse_xml(rel.part.blob)
+            rid = part.relate_to(notes_part, rel.reltype)
+        elif rel.part.content_type.startswith('image/'):
+            # Through the package so identical pictures share one part
+            _, rid = part.get_or_add_image_part(io.BytesIO(rel.part.blob))
+        else:
+            child = _graft_part(package, rel.part)
+            child_renamed = _graft_rels(child, rel.part.rels, template_parts)
+            if child_renamed:
+                _renumber(child._element, child_renamed)
+            rid = part.relate_to(child, rel.reltype)
+        if rid != rel.rid:
+            renamed[rel.rid] = rid
+    return renamed
+
+
+def graft_slides(prs, fragments):
+    """Append SlideFragments to prs, in order; returns the number added
+
+    prs must come from the template the fragments were rendered with, so
+    their layouts are found by partname.
+    """
+    from pptx.opc.constants import CONTENT_TYPE as CT
+    from pptx.parts.slide import SlidePart
+
+    presentation = prs.part
+    package = presentation.package
+    template_parts = {str(part.partname): part for part in _shared_parts(prs)}
+    sldIdLst = presentation._element.get_or_add_sldIdLst()
+    count = 0
+    for fragment in fragments:
+        slide_part = SlidePart.load(presentation._next_slide_partname, CT.PML_SLIDE, package,
+                                    fragment.blob)
+        rid = presentation.relate_to(slide_part, RT_SLIDE)
+        sldIdLst.add_sldId(rid)
+        renamed = _graft_rels(slide_part, fragment.rels, template_parts)
+        if renamed:
+            _renumber(slide_part._element, renamed)
+        count += 1
+    return count
+
+
+def batches(iterable, size=SLIDES_PER_TASK):
+    """Consecutive lists of up to size items"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _quiet_call(job):
+    """Pool entry point: run func(*args) with progress output silenced"""
+    func, args = job
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def map_ordered(func, tasks, jobs):
+    """func(*args) for each args tuple in tasks, in a pool of jobs processes
+
+    Yields the results in task order as they arrive, so the caller can
+    merge early slides while later ones still render. func must be a
+    module-level function and its arguments picklable. An exception in a
+    worker is raised here, and the pool is torn down with the generator.
+    """
+    with multiprocessing.Pool(jobs) as pool:
+        yield from pool.imap(_quiet_call, ((func, args) for args in tasks))
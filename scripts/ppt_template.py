@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Compiled presentation templates shared by both deck generators
+"""
+
+import hashlib
+import importlib.util
+import io
+import os
+import pickle
+import tempfile
+import zipfile
+
+from slide_cache import DEFAULT_CACHE_DIR
+
+# Bump when TemplateSnapshot or anything stored in its artifacts changes
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUBDIR = 'templates'  # Under the cache directory
+
+BODY_LEVELS = 9  # a:lvl1pPr .. a:lvl9pPr in a master's p:bodyStyle
+
+# Snapshots compiled in this process, keyed by source identity, slide size and cache dir
+_snapshots = {}
+
+
+class TemplateSnapshot:
+    """A template compiled once into ready-to-open .pptx bytes
+
+    The snapshot has its sample slides stripped and the slide size applied,
+    so each deck starts from a clean copy with no per-deck restyling.
+    layout_bodies maps each layout name to its body placeholder's
+    (left, top, width, height) in EMU, or None, and the master's bullet
+    margins (marL per level, None where unset). Snapshots are pickled to
+    the cache directory's SNAPSHOT_SUBDIR, so later runs start without
+    python-pptx parsing the template again.
+    """
+
+    def __init__(self, data, digest, layout_names, layout_bodies=None):
+        self.data = data
+        self.digest = digest
+        self.layout_names = layout_names
+        self.layout_bodies = layout_bodies or {}
+        self.artifacts = {}
+        self.cache_path = None
+
+    def new_presentation(self):
+        """Open a fresh, independent presentation from the snapshot"""
+        from pptx import Presentation
+
+        return Presentation(io.BytesIO(self.data))
+
+    def layout_index(self, name):
+        """Index of the slide layout with the given name"""
+        try:
+            return self.layout_names.index(name)
+        except ValueError:
+            raise ValueError(f"Template has no '{name}' slide layout "
+                             f"(available: {', '.join(self.layout_names)})") from None
+
+    def artifact(self, name, build):
+        """Something compiled from this snapshot by build(snapshot), built once
+
+        Artifacts are pickled along with the snapshot, so they must not
+        hold python-pptx objects.
+        """
+        value = self.artifacts.get(name)
+        if value is None:
+            value = build(self)
+            self.artifacts[name] = value
+            _save_snapshot(self)
+        return value
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['cache_path'] = None
+        return state
+
+
+def _as_presentation_package(data):
+    """Relabel a .potx package as a .pptx so python-pptx will open it"""
+    from pptx.opc.constants import CONTENT_TYPE as CT
+
+    with zipfile.ZipFile(io.BytesIO(data)) as src:
+        content_types = src.read('[Content_Types].xml')
+        if CT.PML_TEMPLATE_MAIN.encode() not in content_types:
+            return data
+
+        out = io.BytesIO()
+        with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as dst:
+            for item in src.infolist():
+                payload = src.read(item.filename)
+                if item.filename == '[Content_Types].xml':
+                    payload = payload.replace(CT.PML_TEMPLATE_MAIN.encode(),
+                                              CT.PML_PRESENTATION_MAIN.encode())
+                dst.writestr(item, payload)
+        return out.getvalue()
+
+
+def _layout_body(layout):
+    """(body box, master bullet margins) of a slide layout, as layout_bodies holds"""
+    from pptx.oxml.ns import qn
+
+    body = next((ph for ph in layout.placeholders if ph.placeholder_format.idx == 1), None)
+    # Plain ints, not pptx.util.Length, so unpickling never imports python-pptx
+    box = None if body is None else (int(body.left), int(body.top), int(body.width), int(body.height))
+
+    margins = [None] * BODY_LEVELS
+    body_style = layout.slide_master._element.find('.//' + qn('p:bodyStyle'))
+    if body_style is not None:
+        for level in range(BODY_LEVELS):
+            pPr = body_style.find(qn(f'a:lvl{level + 1}pPr'))
+            if pPr is not None and pPr.get('marL') is not None:
+                margins[level] = int(pPr.get('marL'))
+    return box, tuple(margins)
+
+
+def _source_digest(template_path):
+    """sha256 of a template file, or a fixed digest for the python-pptx default"""
+    if template_path is None:
+        return hashlib.sha256(b'python-pptx default').hexdigest(), None
+    with open(template_path, 'rb') as f:
+        data = f.read()
+    return hashlib.sha256(data).hexdigest(), data
+
+
+def compile_template(template_path, width, height, required_layouts=(), source=None):
+    """Parse and validate a template and compile it into a snapshot
+
+    source is the (digest, data) _source_digest returns, if already read.
+    """
+    from pptx import Presentation
+
+    digest, data = source or _source_digest(template_path)
+    if template_path is None:
+        prs = Presentation()
+    else:
+        prs = Presentation(io.BytesIO(_as_presentation_package(data)))
+
+    # Drop any sample slides that ship with the template
+    sldIdLst = prs.slides._sldIdLst
+    for sldId in list(sldIdLst):
+        prs.part.drop_rel(sldId.rId)
+        sldIdLst.remove(sldId)
+
+    prs.slide_width = width
+    prs.slide_height = height
+
+    snapshot_data = io.BytesIO()
+    prs.save(snapshot_data)
+    snapshot = TemplateSnapshot(
+        snapshot_data.getvalue(),
+        hashlib.sha256(f"{digest}:{width}x{height}".encode()).hexdigest(),
+        [layout.name for layout in prs.slide_layouts],
+        {layout.name: _layout_body(layout) for layout in prs.slide_layouts},
+    )
+    for name in required_layouts:
+        snapshot.layout_index(name)
+    return snapshot
+
+
+def _pptx_stamp():
+    """Identifies the installed python-pptx without importing it"""
+    spec = importlib.util.find_spec('pptx')
+    if spec is None or not spec.origin:
+        return None
+    st = os.stat(spec.origin)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _snapshot_path(cache_dir, source_digest, width, height):
+    """Where the pickled snapshot for a template and slide size is kept"""
+    key = f"{SNAPSHOT_VERSION}:{_pptx_stamp()}:{source_digest}:{width}x{height}"
+    return os.path.join(cache_dir, SNAPSHOT_SUBDIR,
+                        hashlib.sha256(key.encode()).hexdigest() + '.pickle')
+
+
+def _load_snapshot(path):
+    """A pickled snapshot, or None if it is missing or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception:  # Missing, truncated or from an older layout: recompile
+        return None
+    if not isinstance(snapshot, TemplateSnapshot):
+        return None
+    snapshot.cache_path = path
+    return snapshot
+
+
+def _save_snapshot(snapshot):
+    """Pickle a snapshot to its cache_path, atomically; best effort"""
+    if snapshot.cache_path is None:
+        return
+    directory = os.path.dirname(snapshot.cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, snapshot.cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # A read-only cache only costs the next run a recompile
+
+
+def load_template(template_path, width, height, required_layouts=(),
+                  cache_dir=DEFAULT_CACHE_DIR):
+    """Return the compiled snapshot for a template, compiling it on first use
+
+    template_path may be a .pptx or .potx file, or None for the python-pptx
+    default template. Snapshots are reused for the life of the process and
+    recompiled if the template file changes. Across processes they are
+    loaded from cache_dir's SNAPSHOT_SUBDIR, keyed by the template's
+    content, the slide size and the python-pptx install; with cache_dir
+    None nothing is read from or written to disk.
+    """
+    if template_path is None:
+        key = (None, width, height, cache_dir)
+    else:
+        st = os.stat(template_path)
+        key = (os.path.abspath(template_path), st.st_mtime_ns, st.st_size, width, height,
+               cache_dir)
+
+    snapshot = _snapshots.get(key)
+    if snapshot is None:
+        source = _source_digest(template_path)
+        path = None if cache_dir is None else _snapshot_path(cache_dir, source[0], width, height)
+        snapshot = None if path is None else _load_snapshot(path)
+        if snapshot is None:
+            snapshot = compile_template(template_path, width, height, required_layouts, source)
+            snapshot.cache_path = path
+            _save_snapshot(snapshot)
+        _snapshots[key] = snapshot
+    for name in required_layouts:
+        snapshot.layout_index(name)
+    return snapshot
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Warm local HTTP render service for both deck generators
+
+    POST /render/markdown   markdown body         -> .pptx (.html with ?backend=html)
+    POST /render/deck       slide_ir JSON body    -> .pptx (.html with ?backend=html)
+    GET|POST /render/exec                         -> executive .pptx
+    GET  /health                                  -> JSON counters
+
+/render/markdown and /render/deck take ?overflow= and ?backend= like
+convert_to_ppt.py, and every render route takes ?reproducible=1. Decks
+are built in memory (BytesIO) by a pool of worker processes that import
+python-pptx and compile the template once, so a request pays only the
+render itself. A request is handed to the pool only when a worker is
+free; until then it waits in a queue of at most --queue requests (more
+get 503 with Retry-After), and it is dropped from the queue if its
+client disconnects or the timeout passes.
+
+A slide_ir body is parsed and checked before it reaches a worker, so a
+deck of the wrong shape is answered 400 with what is wrong with it.
+Image paths, in markdown and slide_ir decks alike, are resolved against
+--base-dir and must stay inside it; a request with any other image path
+is answered 400. Keep the service on localhost all the same.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import slide_ir
+from convert_to_ppt import (BACKENDS, OVERFLOW_MODES, SLIDE_HEIGHT, SLIDE_LAYOUT, SLIDE_WIDTH,
+                            create_presentation, iter_slides)
+from create_exec_ppt import create_exec_presentation
+from ppt_template import load_template
+from slide_cache import SlideCache
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_QUEUE = 16     # Requests allowed to wait for a busy pool
+DEFAULT_TIMEOUT = 60   # Seconds before a request is answered 504
+MAX_BODY_BYTES = 8 * 1024 * 1024
+POLL_INTERVAL = 0.05   # How often a waiting request checks its client
+
+PPTX_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+HTML_TYPE = 'text/html; charset=utf-8'
+ROUTES = {'/render/markdown': 'markdown', '/render/deck': 'deck', '/render/exec': 'exec'}
+FILENAMES = {'markdown': 'deck.pptx', 'deck': 'deck.pptx',
+             'exec': 'BankApp_Executive_Presentation.pptx'}
+# Field types of the slide blocks a posted deck may hold (tables are checked apart)
+BLOCK_FIELDS = {'heading': (str,), 'paragraph': (str,), 'bullet': (str, int), 'code': (str, str),
+                'image': (str, str)}
+
+
+class BadRequest(Exception):
+    """The request body could not be parsed"""
+
+
+# Per-worker state, set up by _init_worker
+_base_dir = None
+_cache = None
+
+
+def _init_worker(template, base_dir):
+    """Compile the templates and run each code path once before the first request"""
+    global _base_dir, _cache
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is the server's to handle
+    _base_dir = base_dir
+    _cache = SlideCache(cache_dir=None)  # Memory-only, kept warm across requests
+    load_template(template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], _cache.cache_dir)
+    render('exec', b'', {'template': template})
+
+
+def _ready():
+    """No-op task used to start and warm a worker"""
+    return os.getpid()
+
+
+def confine_images(deck, base_dir):
+    """deck with its image paths resolved against base_dir
+
+    Raises BadRequest for a path that resolves (following symlinks) to
+    somewhere outside base_dir, so a request cannot read other files.
+    """
+    base = os.path.realpath(base_dir)
+    slides = []
+    for slide in deck:
+        blocks = []
+        for block in slide.blocks:
+            if block.kind == 'image':
+                path = os.path.realpath(os.path.join(base, block.path))
+                if os.path.commonpath([base, path]) != base:
+                    raise BadRequest(f"image path outside the base directory: {block.path}")
+                block = block.replace(path=path)
+            blocks.append(block)
+        slides.append(slide.replace(blocks=blocks))
+    return slide_ir.Deck(slides)
+
+
+def _check_block(block, where):
+    """Raise BadRequest unless block is a slide block of the right shape"""
+    values = block.values()
+    if block.kind == 'table':
+        rows, alignments = values
+        ok = (bool(rows) and bool(rows[0]) and all(len(row) == len(rows[0]) for row in rows)
+              and all(isinstance(cell, str) for row in rows for cell in row)
+              and isinstance(alignments, str) and set(alignments) <= set('lcr'))
+    elif block.kind in BLOCK_FIELDS:
+        ok = all(isinstance(value, field_type) and not isinstance(value, bool)
+                 for value, field_type in zip(values, BLOCK_FIELDS[block.kind]))
+        ok = ok and (block.kind != 'bullet' or block.depth >= 0)
+    else:
+        raise BadRequest(f"{where} is a {block.kind}, which cannot go on a slide")
+    if not ok:
+        raise BadRequest(f"{where} is a malformed {block.kind}: {block!r}")
+
+
+def parse_deck(body):
+    """The slide_ir Deck in a request body, checked down to every block
+
+    Raises BadRequest for anything that is not JSON, not a deck, or holds
+    a node the renderers cannot take, such as a title that is not text.
+    """
+    try:
+        deck = slide_ir.loads(body)
+    except (ValueError, KeyError, TypeError, RecursionError) as e:
+        raise BadRequest(f"not a slide_ir deck: {e}")
+    if not isinstance(deck, slide_ir.Deck):
+        raise BadRequest('not a slide_ir deck: top-level node must be a deck')
+    for n, slide in enumerate(deck, 1):
+        if not isinstance(slide, slide_ir.Slide):
+            raise BadRequest(f"slide {n} is a {slide.kind}, not a slide")
+        if not isinstance(slide.title, str) or not isinstance(slide.notes, (str, type(None))):
+            raise BadRequest(f"slide {n}: title and notes must be text")
+        for m, block in enumerate(slide.blocks, 1):
+            _check_block(block, f"slide {n} block {m}")
+    return deck
+
+
+def render(kind, body, options):
+    """Build one deck in a worker process; returns the .pptx (or preview) bytes
+
+    body is the request body, or for 'deck' the Deck parse_deck made of it.
+    """
+    if kind == 'markdown':
+        try:
+            slides = slide_ir.Deck(iter_slides(body.decode('utf-8').splitlines(), _base_dir))
+        except UnicodeDecodeError as e:
+            raise BadRequest(f"markdown is not UTF-8: {e}")
+    elif kind == 'deck':
+        slides = body
+    if kind != 'exec':
+        slides = confine_images(slides, _base_dir)
+
+    buffer = io.BytesIO()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if kind == 'exec':
+            create_exec_presentation(buffer, template=options['template'],
+                                     reproducible=options.get('reproducible', False))
+        else:
+            create_presentation(slides, buffer, cache=_cache, **options)
+    return buffer.getvalue()
+
+
+class RenderServer(ThreadingHTTPServer):
+    """HTTP front end that hands renders to a bounded pool of warm workers"""
+
+    daemon_threads = True
+
+    def __init__(self, address, workers=DEFAULT_WORKERS, queue=DEFAULT_QUEUE,
+                 timeout=DEFAULT_TIMEOUT, template=None, base_dir=None, quiet=False):
+        self.workers = workers
+        self.capacity = workers + queue
+        self.timeout = timeout
+        self.template = template
+        self.base_dir = base_dir or os.getcwd()
+        self.quiet = quiet
+        self.started = time.monotonic()
+        self.counts = dict.fromkeys(
+            ('completed', 'failed', 'rejected', 'cancelled', 'abandoned', 'timed_out'), 0)
+        self._slots = threading.BoundedSemaphore(self.capacity)  # Queued plus rendering
+        self._idle = threading.BoundedSemaphore(workers)         # Free workers
+        self._lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._rendering = 0
+        self.pool = self._start_pool()
+        super().__init__(address, RenderHandler)
+
+    def _start_pool(self):
+        # Spawned rather than forked: forking a threaded server is unsafe,
+        # and a spawned pool can be replaced if a worker dies
+        pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_init_worker,
+                                   initargs=(self.template, self.base_dir))
+        # One task per worker starts them all and waits until each is warm
+        for future in [pool.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+        return pool
+
+    def count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    def admit(self):
+        """Take a place in the queue; False if it is full"""
+        if self._slots.acquire(blocking=False):
+            return True
+        self.count('rejected')
+        return False
+
+    def leave(self):
+        self._slots.release()
+
+    def wait_for_worker(self, timeout):
+        """Claim a free worker, waiting at most timeout seconds"""
+        return self._idle.acquire(timeout=timeout)
+
+    def dispatch(self, kind, body, options):
+        """Start a render on a claimed worker; the worker is freed when it finishes
+
+        If the render cannot be started the worker is freed here, and the
+        error raised.
+        """
+        pool = self.pool
+        try:
+            try:
+                future = pool.submit(render, kind, body, options)
+            except BrokenProcessPool:
+                self.restart_pool(pool)
+                future = self.pool.submit(render, kind, body, options)
+        except BaseException:
+            self._idle.release()
+            raise
+        with self._lock:
+            self._rendering += 1
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, future):
+        with self._lock:
+            self._rendering -= 1
+        self._idle.release()
+
+    def restart_pool(self, broken):
+        """Replace the pool after a worker died, unless another request already did"""
+        with self._pool_lock:
+            if self.pool is not broken:
+                return
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = self._start_pool()
+        print("♻️  Worker pool restarted", file=sys.stderr)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts, workers=self.workers, capacity=self.capacity,
+                        rendering=self._rendering,
+                        uptime_s=round(time.monotonic() - self.started, 1))
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = 'DeckRender/1.0'
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so clients can reuse connections
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+    def _options(self, query):
+        """Query parameters and the render options every route shares"""
+        params = {name: values[-1] for name, values in parse_qs(query).items()}
+        return params, {'template': self.server.template,
+                        'reproducible': params.get('reproducible', '0') not in ('', '0', 'false')}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/health':
+            self._send(HTTPStatus.OK, json.dumps(self.server.stats()).encode(), 'application/json')
+        elif ROUTES.get(url.path) == 'exec':
+            self._render('exec', b'', self._options(url.query)[1])
+        else:
+            self._error(HTTPStatus.NOT_FOUND, f"no route {url.path}")
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        kind = ROUTES.get(url.path)
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE if length > 0 else HTTPStatus.BAD_REQUEST,
+                        f"body must be 0-{MAX_BODY_BYTES} bytes with a Content-Length")
+            return
+        body = self.rfile.read(length)
+        if kind is None:
+            self._error(HTTPStatus.NOT_FOUND, f"no route {url.path}")
+            return
+
+        params, options = self._options(url.query)
+        if kind != 'exec':
+            options['overflow'] = params.get('overflow', 'paginate')
+            options['backend'] = params.get('backend', 'pptx')
+            if options['overflow'] not in OVERFLOW_MODES or options['backend'] not in BACKENDS:
+                self._error(HTTPStatus.BAD_REQUEST,
+                            f"overflow must be one of {OVERFLOW_MODES}, backend one of {BACKENDS}")
+                return
+        if kind == 'deck':
+            try:
+                body = parse_deck(body)
+            except BadRequest as e:
+                self._error(HTTPStatus.BAD_REQUEST, str(e))
+                return
+        self._render(kind, body, options)
+
+    def _render(self, kind, body, options):
+        started = time.perf_counter()
+        if not self.server.admit():
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, 'render queue is full',
+                        {'Retry-After': '1'})
+            return
+        try:
+            self._render_admitted(kind, body, options, started)
+        finally:
+            self.server.leave()
+
+    def _render_admitted(self, kind, body, options, started):
+        deadline = time.monotonic() + self.server.timeout
+        # Queued: nothing has reached the pool yet, so giving up is free
+        while not self.server.wait_for_worker(POLL_INTERVAL):
+            if self._give_up(deadline, 'cancelled'):
+                return
+
+        try:
+            future = self.server.dispatch(kind, body, options)
+        except Exception as e:
+            self.server.count('failed')
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, f"render pool unavailable: {e}")
+            return
+        pool = self.server.pool
+        while True:
+            try:
+                data = future.result(timeout=POLL_INTERVAL)
+                break
+            except FutureTimeout:
+                # A running render can't be interrupted; it finishes and its
+                # result is dropped
+                if self._give_up(deadline, 'abandoned'):
+                    return
+            except CancelledError:
+                self.server.count('cancelled')
+                self._error(HTTPStatus.SERVICE_UNAVAILABLE, 'render was cancelled')
+                return
+            except BadRequest as e:
+                self.server.count('failed')
+                self._error(HTTPStatus.BAD_REQUEST, str(e))
+                return
+            except BrokenProcessPool:
+                self.server.count('failed')
+                self.server.restart_pool(pool)
+                self._error(HTTPStatus.INTERNAL_SERVER_ERROR, 'render worker died')
+                return
+            except Exception as e:
+                self.server.count('failed')
+                self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(e).__name__}: {e}")
+                return
+
+        self.server.count('completed')
+        elapsed = (time.perf_counter() - started) * 1000
+        disposition = f'attachment; filename="{FILENAMES[kind]}"'
+        content_type = PPTX_TYPE
+        if options.get('backend') == 'html':
+            # Previews open in the browser rather than downloading
+            disposition = f'inline; filename="{os.path.splitext(FILENAMES[kind])[0]}.html"'
+            content_type = HTML_TYPE
+        self._send(HTTPStatus.OK, data, content_type, {
+            'Content-Disposition': disposition,
+            'X-Render-Ms': f"{elapsed:.1f}",
+        })
+
+    def _give_up(self, deadline, outcome):
+        """Stop waiting if the client left (counted as outcome) or the deadline passed"""
+        if self._client_gone():
+            self.server.count(outcome)
+            self.close_connection = True
+            return True
+        if time.monotonic() > deadline:
+            self.server.count('timed_out')
+            self._error(HTTPStatus.GATEWAY_TIMEOUT,
+                        f"no result within {self.server.timeout:g}s")
+            return True
+        return False
+
+    def _client_gone(self):
+        """True once the client has closed its end of the connection"""
+        try:
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            return bool(readable) and not self.connection.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+    def _send(self, status, data, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status, message, headers=None):
+        self._send(status, json.dumps({'error': message}).encode(), 'application/json', headers)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0],
+                                     epilog='Routes: POST /render/markdown, POST /render/deck, '
+                                            'GET|POST /render/exec, GET /health')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='address to bind (default: %(default)s)')
+    parser.add_argument('-p', '--port', type=int, default=DEFAULT_PORT,
+                        help='port to listen on (default: %(default)s)')
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help='render worker processes (default: %(default)s)')
+    parser.add_argument('--queue', type=int, default=DEFAULT_QUEUE,
+                        help='requests that may wait for a free worker (default: %(default)s)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='seconds before a request gets 504 (default: %(default)s)')
+    parser.add_argument('-t', '--template',
+                        help='.pptx/.potx design template to build every deck from')
+    parser.add_argument('--base-dir',
+                        help='directory image paths are resolved against and confined to '
+                             '(default: current directory)')
+    parser.add_argument('-q', '--quiet', action='store_true', help="don't log each request")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.queue < 0:
+        parser.error('--workers must be at least 1 and --queue at least 0')
+    if args.template:
+        try:
+            load_template(args.template, SLIDE_WIDTH, SLIDE_HEIGHT, [SLIDE_LAYOUT], None)
+        except Exception as e:
+            print(f"❌ Template {args.template}: {e}", file=sys.stderr)
+            return 2
+
+    print(f"🔥 Starting {args.workers} render worker(s)...")
+    server = RenderServer((args.host, args.port), args.workers, args.queue, args.timeout,
+                          args.template, args.base_dir, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"🚀 Render server listening on http://{host}:{port}/ "
+          f"({args.workers} workers, queue {args.queue})")
+    # Process managers stop services with SIGTERM; shut the pool down cleanly then too
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping render server")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of rendered slide XML
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'PPTX_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'bankapp-pptx'))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+DEFAULT_MEMORY_ENTRIES = 4096
+
+R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'  # r:id
+
+
+class SlideCache:
+    """Store rendered slide shape trees on disk, keyed by a content hash
+
+    Entries are JSON files named after the hash. A hit refreshes the file's
+    mtime, and once the cache grows past max_bytes the least recently used
+    entries are deleted.
+
+    Up to memory_entries recently used entries are also kept in memory, so
+    long-running processes (watch mode) skip the disk entirely. With
+    cache_dir=None the cache is memory-only.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 memory_entries=DEFAULT_MEMORY_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._sizes = {}
+        self._total = 0
+        if cache_dir is None:
+            return
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Scan once; afterwards the size index is kept up to date in memory
+        for name in os.listdir(cache_dir):
+            if name.endswith('.json'):
+                path = os.path.join(cache_dir, name)
+                try:
+                    self._sizes[path] = os.path.getsize(path)
+                except OSError:
+                    pass
+        self._total = sum(self._sizes.values())
+
+    @staticmethod
+    def key(*parts):
+        """Hash the slide source and render settings into a cache key"""
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def load(self, key):
+        """Return the cached entry for key, or None on a miss"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.cache_dir is None:
+            self.misses += 1
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, entry)
+        return entry
+
+    def store(self, key, slide):
+        """Serialize a rendered slide's shape tree, external links and notes"""
+        from lxml import etree
+
+        links = [
+            (rId, rel.target_ref)
+            for rId, rel in slide.part.rels.items()
+            if rel.is_external
+        ]
+        entry = {
+            'xml': etree.tostring(slide._element.cSld, encoding='unicode'),
+            'links': links,
+            'notes': slide.notes_slide.notes_text_frame.text if slide.has_notes_slide else None,
+        }
+
+        self._remember(key, entry)
+        if self.cache_dir is None:
+            return
+        data = json.dumps(entry).encode('utf-8')
+
+        # Write then rename, so concurrent builds never see a partial entry
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        size = len(data)
+        self._total += size - self._sizes.get(path, 0)
+        self._sizes[path] = size
+        if self._total > self.max_bytes:
+            self.evict()
+
+    def apply(self, slide, entry):
+        """Replace a fresh slide's shape tree with a cached one"""
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        from pptx.oxml import parse_xml
+
+        cSld = parse_xml(entry['xml'])
+
+        # Hyperlinks are relationships of the slide part; recreate them and
+        # point the cached r:id references at the new ids
+        rid_map = {
+            old: slide.part.relate_to(url, RT.HYPERLINK, is_external=True)
+            for old, url in entry['links']
+        }
+        if rid_map:
+            for el in cSld.iter():
+                rId = el.get(R_ID)
+                if rId in rid_map:
+                    el.set(R_ID, rid_map[rId])
+
+        slide._element.replace(slide._element.cSld, cSld)
+        if entry.get('notes'):
+            slide.notes_slide.notes_text_frame.text = entry['notes']
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        by_age = []
+        for path in self._sizes:
+            try:
+                by_age.append((os.path.getmtime(path), path))
+            except OSError:
+                by_age.append((0, path))
+        by_age.sort()
+
+        for _, path in by_age:
+            if self._total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._total -= self._sizes.pop(path)
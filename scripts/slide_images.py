@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Image loading for slides: threaded decode/downscale with content-hash dedup
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+IMAGE_DPI = 150  # Pixels per inch kept when downscaling to the display size
+JPEG_QUALITY = 85
+# Formats PowerPoint displays as they are; anything else is re-encoded
+NATIVE_FORMATS = {'BMP', 'GIF', 'JPEG', 'PNG', 'TIFF', 'WMF'}
+# Modes PNG stores as they are; anything else becomes RGB or RGBA
+PNG_MODES = {'1', 'L', 'LA', 'RGB', 'RGBA'}
+
+# Prepared images, keyed by (sha256 of the source bytes, target pixel box).
+# Identical files share one entry no matter how many paths point at them.
+_prepared = OrderedDict()
+_PREPARED_LIMIT = 256
+_prepared_lock = threading.Lock()
+
+
+def prepare_image(path, width_pt, height_pt):
+    """Load an image, downscaled to fit width_pt x height_pt at IMAGE_DPI
+
+    Returns (image bytes, pixel width, pixel height). Images that are
+    already small enough are returned byte-for-byte, so python-pptx (which
+    stores each distinct blob once, by SHA1) dedupes them across slides;
+    formats outside NATIVE_FORMATS are always re-encoded as PNG or JPEG.
+    """
+    from PIL import Image
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    box = (max(1, round(width_pt / 72 * IMAGE_DPI)), max(1, round(height_pt / 72 * IMAGE_DPI)))
+    key = (hashlib.sha256(data).hexdigest(), box)
+    with _prepared_lock:
+        prepared = _prepared.get(key)
+    if prepared is not None:
+        return prepared
+
+    with Image.open(io.BytesIO(data)) as img:
+        size = img.size
+        source_format = img.format
+        too_big = size[0] > box[0] or size[1] > box[1]
+        if too_big or source_format not in NATIVE_FORMATS:
+            if img.mode not in PNG_MODES:
+                alpha = 'A' in img.mode or 'transparency' in img.info
+                img = img.convert('RGBA' if alpha else 'RGB')
+            if too_big:
+                img.thumbnail(box, Image.LANCZOS)
+            out = io.BytesIO()
+            if source_format == 'JPEG' or (img.mode == 'RGB'
+                                           and source_format not in ('PNG', 'GIF')):
+                img.convert('RGB').save(out, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+            else:
+                img.save(out, 'PNG', optimize=True)
+            data = out.getvalue()
+            size = img.size
+
+    prepared = (data, size[0], size[1])
+    with _prepared_lock:
+        _prepared[key] = prepared
+        if len(_prepared) > _PREPARED_LIMIT:
+            _prepared.popitem(last=False)
+    return prepared
+
+
+class ImagePipeline:
+    """Thread pool that prepares slide images ahead of rendering
+
+    Decoding and resampling in Pillow release the GIL, so a few threads
+    overlap the image work with slide building. Requests for the same
+    path and box share one future.
+    """
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = {}
+
+    def submit(self, path, width_pt, height_pt):
+        key = (path, round(width_pt), round(height_pt))
+        future = self._futures.get(key)
+        if future is None:
+            future = self._executor.submit(prepare_image, path, width_pt, height_pt)
+            self._futures[key] = future
+        return future
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Slide intermediate representation shared by the deck generators
+
+Parsers produce these nodes and every backend consumes them. Nodes use
+__slots__ (no per-instance dict), are immutable by convention, compare
+and hash by value, and round-trip through pickle and JSON (to_data /
+from_data), so a parsed deck can be cached or sent to another process.
+"""
+
+import json
+import sys
+
+# Run style keys: one interned string per combination of bold ('b'),
+# italic ('i') and inline code ('c'). Every run with the same style shares
+# the key, so caches keyed on it hash a short string once.
+STYLE_KEYS = {
+    (bold, italic, code): sys.intern(('b' if bold else '') + ('i' if italic else '') +
+                                     ('c' if code else ''))
+    for bold in (False, True) for italic in (False, True) for code in (False, True)
+}
+_CANONICAL_STYLES = {key: key for key in STYLE_KEYS.values()}
+
+
+def style_key(bold=False, italic=False, code=False):
+    """The interned style key for a run"""
+    return STYLE_KEYS[bool(bold), bool(italic), bool(code)]
+
+
+class Node:
+    """Base of all IR nodes
+
+    Subclasses list their fields in __slots__ and set kind, the tag the
+    renderers dispatch on and the serialized form starts with.
+    """
+
+    __slots__ = ()
+    kind = None
+    depth = 0  # Only bullets nest
+
+    def values(self):
+        """Field values, in __slots__ order"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def replace(self, **changes):
+        """A copy with some fields changed"""
+        fields = dict(zip(self.__slots__, self.values()))
+        fields.update(changes)
+        return type(self)(**fields)
+
+    def to_data(self):
+        """JSON-compatible form: [kind, field, ...]"""
+        return [self.kind, *self.values()]
+
+    @classmethod
+    def from_values(cls, values):
+        return cls(*values)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.values() == other.values()
+
+    def __hash__(self):
+        return hash((self.kind, self.values()))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.values()))})"
+
+    def __reduce__(self):
+        return type(self), self.values()
+
+
+class Run(Node):
+    """A styled span of inline text; link is the hyperlink target or None"""
+
+    __slots__ = ('text', 'style', 'link')
+    kind = 'run'
+
+    def __init__(self, text, style='', link=None):
+        self.text = text
+        self.style = style
+        self.link = link
+
+    def values(self):
+        return self.text, self.style, self.link
+
+    @classmethod
+    def from_values(cls, values):
+        text, style, link = values
+        return cls(text, _CANONICAL_STYLES[style], link)
+
+    @property
+    def bold(self):
+        return 'b' in self.style
+
+    @property
+    def italic(self):
+        return 'i' in self.style
+
+    @property
+    def code(self):
+        return 'c' in self.style
+
+
+class Heading(Node):
+    """A heading inside a slide body (the first one is the slide title)"""
+
+    __slots__ = ('text',)
+    kind = 'heading'
+
+    def __init__(self, text):
+        self.text = text
+
+    def values(self):
+        return (self.text,)
+
+
+class Paragraph(Node):
+    """A plain paragraph of inline-formatted text"""
+
+    __slots__ = ('text',)
+    kind = 'paragraph'
+
+    def __init__(self, text):
+        self.text = text
+
+    def values(self):
+        return (self.text,)
+
+
+class Bullet(Node):
+    """A bullet point; depth is its nesting level"""
+
+    __slots__ = ('text', 'depth')
+    kind = 'bullet'
+
+    def __init__(self, text, depth=0):
+        self.text = text
+        self.depth = depth
+
+    def values(self):
+        return self.text, self.depth
+
+
+class CodeBlock(Node):
+    """A fenced code block; lang is the fence's language tag"""
+
+    __slots__ = ('code', 'lang')
+    kind = 'code'
+
+    def __init__(self, code, lang=''):
+        self.code = code
+        self.lang = lang
+
+    def values(self):
+        return self.code, self.lang
+
+
+class Table(Node):
+    """A pipe table: rows of cell strings, header row first, and one
+    alignment ('l', 'c' or 'r') per column
+    """
+
+    __slots__ = ('rows', 'alignments')
+    kind = 'table'
+
+    def __init__(self, rows, alignments):
+        self.rows = rows
+        self.alignments = alignments
+
+    def values(self):
+        return self.rows, self.alignments
+
+    @classmethod
+    def from_values(cls, values):
+        rows, alignments = values
+        return cls(tuple(tuple(row) for row in rows), alignments)
+
+
+class Image(Node):
+    """An image on a line of its own; path is resolved, alt may be empty"""
+
+    __slots__ = ('path', 'alt')
+    kind = 'image'
+
+    def __init__(self, path, alt=''):
+        self.path = path
+        self.alt = alt
+
+    def values(self):
+        return self.path, self.alt
+
+
+class MetricCard(Node):
+    """A coloured tile with a headline value, its label and an optional caption
+
+    color is a hex string ('0284C7'), so the node stays backend-neutral.
+    """
+
+    __slots__ = ('label', 'value', 'caption', 'color')
+    kind = 'metric'
+
+    def __init__(self, label, value, caption='', color='000000'):
+        self.label = label
+        self.value = value
+        self.caption = caption
+        self.color = color
+
+    def values(self):
+        return self.label, self.value, self.caption, self.color
+
+
+class Slide(Node):
+    """A titled slide; notes are speaker notes or None"""
+
+    __slots__ = ('title', 'blocks', 'notes')
+    kind = 'slide'
+
+    def __init__(self, title, blocks=(), notes=None):
+        self.title = title
+        self.blocks = tuple(blocks)
+        self.notes = notes
+
+    def values(self):
+        return self.title, self.blocks, self.notes
+
+    def to_data(self):
+        return [self.kind, self.title, [block.to_data() for block in self.blocks], self.notes]
+
+    @classmethod
+    def from_values(cls, values):
+        title, blocks, notes = values
+        return cls(title, [from_data(block) for block in blocks], notes)
+
+
+class Deck(Node):
+    """An ordered list of slides"""
+
+    __slots__ = ('slides',)
+    kind = 'deck'
+
+    def __init__(self, slides=()):
+        self.slides = list(slides)
+
+    def __iter__(self):
+        return iter(self.slides)
+
+    def __len__(self):
+        return len(self.slides)
+
+    def values(self):
+        return (tuple(self.slides),)
+
+    def to_data(self):
+        return [self.kind, [slide.to_data() for slide in self.slides]]
+
+    @classmethod
+    def from_values(cls, values):
+        slides, = values
+        return cls(from_data(slide) for slide in slides)
+
+
+NODE_TYPES = {cls.kind: cls for cls in (Run, Heading, Paragraph, Bullet, CodeBlock, Table, Image,
+                                        MetricCard, Slide, Deck)}
+
+
+def from_data(data):
+    """Rebuild a node from its to_data form"""
+    kind, *values = data
+    return NODE_TYPES[kind].from_values(values)
+
+
+def dumps(node):
+    """A node as compact JSON"""
+    return json.dumps(node.to_data(), ensure_ascii=False, separators=(',', ':'))
+
+
+def loads(text):
+    """The node dumps wrote"""
+    return from_data(json.loads(text))
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Markdown pipe tables as native PowerPoint tables
+"""
+
+import copy
+from functools import lru_cache
+
+from ooxml_writer import xml_text
+from text_metrics import EMU_PER_PT, LINE_SPACING, count_lines, word_width
+
+TABLE_SIZE = 12
+CELL_MARGIN_X = 7.2  # python-pptx default cell insets, in points
+CELL_MARGIN_Y = 3.6
+MIN_COLUMN_WIDTH = 36
+
+_ALIGN = {'l': 'l', 'c': 'ctr', 'r': 'r'}
+
+
+def split_row(line):
+    """Split a '| a | b |' row into stripped cell strings
+
+    A single scan that honours backslash-escaped pipes and pipes inside
+    inline code spans.
+    """
+    cells = []
+    cell = []
+    in_code = False
+    i = 0
+    n = len(line)
+    while i < n:
+        ch = line[i]
+        if ch == '\\' and i + 1 < n and line[i + 1] == '|':
+            cell.append('|')
+            i += 2
+            continue
+        if ch == '`':
+            in_code = not in_code
+        elif ch == '|' and not in_code:
+            cells.append(''.join(cell).strip())
+            cell = []
+            i += 1
+            continue
+        cell.append(ch)
+        i += 1
+    cells.append(''.join(cell).strip())
+
+    # Drop the empty cells outside the leading and trailing pipes
+    if cells and not cells[0] and line.lstrip().startswith('|'):
+        cells.pop(0)
+    if cells and not cells[-1] and line.rstrip().endswith('|'):
+        cells.pop()
+    return cells
+
+
+def parse_alignments(line):
+    """Column alignments ('l', 'c' or 'r') from a |---|:---:| separator row
+
+    Returns None if the line is not a separator row.
+    """
+    alignments = []
+    for cell in split_row(line):
+        marks = cell.replace(' ', '')
+        if not marks or marks.strip(':-') or '-' not in marks:
+            return None
+        if marks.startswith(':') and marks.endswith(':'):
+            alignments.append('c')
+        elif marks.endswith(':'):
+            alignments.append('r')
+        else:
+            alignments.append('l')
+    return ''.join(alignments)
+
+
+@lru_cache(maxsize=256)
+def column_widths(rows, total_width):
+    """Column widths in points, in one pass over the cells
+
+    Each column gets its minimum width, and the rest of total_width is
+    shared in proportion to the column's longest cell.
+    """
+    cols = len(rows[0])
+    longest = [0] * cols
+    for row in rows:
+        for c, cell in enumerate(row):
+            w = word_width(cell) * TABLE_SIZE / 1000 + 2 * CELL_MARGIN_X
+            if w > longest[c]:
+                longest[c] = w
+
+    floor = min(MIN_COLUMN_WIDTH, total_width / cols)
+    spare = total_width - floor * cols
+    weight = sum(longest) or 1
+    return tuple(floor + spare * w / weight for w in longest)
+
+
+def row_height(row, widths, bold=False):
+    """Estimated height of a table row in points"""
+    lines = max(
+        count_lines(cell, TABLE_SIZE, width - 2 * CELL_MARGIN_X, bold=bold)
+        for cell, width in zip(row, widths)
+    )
+    return lines * TABLE_SIZE * LINE_SPACING + 2 * CELL_MARGIN_Y
+
+
+@lru_cache(maxsize=16)
+def _rpr_xml(style, decls=''):
+    """Serialized a:rPr for one cell run style key"""
+    attrs = (' b="1"' if 'b' in style else '') + (' i="1"' if 'i' in style else '')
+    if 'c' in style:
+        return f'<a:rPr{decls} lang="en-US" sz="{TABLE_SIZE * 100}"{attrs}>' \
+               f'<a:latin typeface="Courier New"/></a:rPr>'
+    return f'<a:rPr{decls} lang="en-US" sz="{TABLE_SIZE * 100}"{attrs}/>'
+
+
+def _cell_rpr_xml(run, links):
+    """Serialized a:rPr for a cell run, with its hyperlink if it has one and links is given"""
+    rpr = _rpr_xml(run.style)
+    if not run.link or links is None:
+        return rpr
+    link = f'<a:hlinkClick r:id="{links.rid(run.link)}"/>'
+    if rpr.endswith('/>'):
+        return f'{rpr[:-2]}>{link}</a:rPr>'
+    return rpr.replace('</a:rPr>', f'{link}</a:rPr>')
+
+
+@lru_cache(maxsize=16)
+def _rpr_prototype(style):
+    """Pre-built a:rPr shared by every cell run of one style"""
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+
+    return parse_xml(_rpr_xml(style, ' ' + nsdecls('a')))
+
+
+def add_table(slide, rows, alignments, left, top, width, runs_for):
+    """Add rows (header first) as a native table shape; positions in points
+
+    Cell text is written straight into each a:tc with cloned a:rPr
+    prototypes rather than through python-pptx's per-cell text proxies.
+    runs_for(text) returns the inline runs for a cell; a run's link becomes
+    a hyperlink relationship of the slide, as for body text. The table keeps
+    python-pptx's default style, so the header row and banding come from
+    the theme.
+    """
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.util import Pt
+
+    widths = column_widths(rows, width)
+    heights = [row_height(row, widths, bold=(r == 0)) for r, row in enumerate(rows)]
+    shape = slide.shapes.add_table(len(rows), len(widths), Pt(left), Pt(top),
+                                   Pt(sum(widths)), Pt(sum(heights)))
+    table = shape.table
+    for c, w in enumerate(widths):
+        table.columns[c].width = Pt(w)
+    for r, h in enumerate(heights):
+        table.rows[r].height = Pt(h)
+
+    tbl = table._tbl
+    for r, row in enumerate(rows):
+        for c, text in enumerate(row):
+            p = tbl.tc(r, c).txBody.p_lst[0]
+            align = _ALIGN.get(alignments[c:c + 1])
+            if align:
+                p.get_or_add_pPr().set('algn', align)
+            for run in runs_for(text):
+                r_el = p.add_r()
+                r_el.insert(0, copy.deepcopy(_rpr_prototype(run.style)))
+                r_el.text = run.text  # Escapes control characters, as _Run.text does
+                if run.link:
+                    rid = slide.part.relate_to(run.link, RT.HYPERLINK, is_external=True)
+                    r_el.rPr.add_hlinkClick(rid)
+    return shape
+
+
+def table_xml(shape_id, rows, alignments, left, top, width, runs_for, links=None):
+    """The graphicFrame add_table would produce, as an XML string
+
+    shape_id is the id python-pptx would assign (the table is named after
+    it the same way). links is the slide's ooxml_writer.SlideLinks, which
+    numbers the hyperlinks of linked cell runs; without it links are dropped.
+    """
+    col_widths = column_widths(rows, width)
+    widths = [int(w * EMU_PER_PT) for w in col_widths]  # As pptx.util.Pt rounds
+    heights = [int(row_height(row, col_widths, bold=(r == 0)) * EMU_PER_PT)
+               for r, row in enumerate(rows)]
+
+    parts = [
+        f'<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{shape_id}" name="Table {shape_id - 1}"/>'
+        '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/>'
+        f'</p:nvGraphicFramePr><p:xfrm><a:off x="{int(left * EMU_PER_PT)}" y="{int(top * EMU_PER_PT)}"/>'
+        f'<a:ext cx="{sum(widths)}" cy="{sum(heights)}"/></p:xfrm><a:graphic>'
+        '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table"><a:tbl>'
+        '<a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
+        '</a:tableStyleId></a:tblPr><a:tblGrid>'
+    ]
+    parts.extend(f'<a:gridCol w="{w}"/>' for w in widths)
+    parts.append('</a:tblGrid>')
+    for row, h in zip(rows, heights):
+        parts.append(f'<a:tr h="{h}">')
+        for c, text in enumerate(row):
+            align = _ALIGN.get(alignments[c:c + 1])
+            parts.append('<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>')
+            content = (f'<a:pPr algn="{align}"/>' if align else '') + ''.join(
+                f'<a:r>{_cell_rpr_xml(run, links)}'
+                f'<a:t>{xml_text(run.text)}</a:t></a:r>'
+                for run in runs_for(text)
+            )
+            parts.append(f'<a:p>{content}</a:p>' if content else '<a:p/>')
+            parts.append('</a:txBody><a:tcPr/></a:tc>')
+        parts.append('</a:tr>')
+    parts.append('</a:tbl></a:graphicData></a:graphic></p:graphicFrame>')
+    return ''.join(parts)
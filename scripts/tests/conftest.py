@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the deck generator tests
+
+The scripts import each other as top-level modules, so their directory
+goes on the path the way running one of them puts it there.
+"""
+
+import os
+import sys
+
+import pytest
+
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS)
+
+
+@pytest.fixture(scope='session')
+def geometry():
+    """Body geometry of the default template's content layout"""
+    import convert_to_ppt
+    from ppt_template import load_template
+
+    snapshot = load_template(None, convert_to_ppt.SLIDE_WIDTH, convert_to_ppt.SLIDE_HEIGHT,
+                             [convert_to_ppt.SLIDE_LAYOUT], cache_dir=None)
+    return convert_to_ppt.body_geometry(snapshot, convert_to_ppt.SLIDE_LAYOUT)
@@ -0,0 +1,86 @@
+"""The python-pptx and direct OOXML backends writing the same deck"""
+
+import io
+import zipfile
+
+from convert_to_ppt import create_presentation, iter_slides
+
+# No images or speaker notes, which only the python-pptx backend renders; control
+# characters are escaped as _xHHHH_ by both
+DECK = """\
+## Overview
+
+- **Bold** and *italic* bullets with `inline code`
+- A [link](https://example.com) to follow
+  - A nested bullet
+
+1. First step
+2. Second step
+
+---
+
+## Code
+
+Set it up:
+
+```python
+def greet(name):
+    return f"Hello, {name}"
+```
+
+Then call it from anywhere.
+
+---
+
+## Table
+
+| Service | Cost |
+|---------|------|
+| ECS     | $120 |
+| RDS     | $310 |
+
+---
+
+## Terminal output
+
+- A bell \x07 in a bullet
+
+```
+\x1b[32mok\x1b[0m deployed
+```
+
+| Step | Output |
+|------|--------|
+| ring | ding\x07 |
+
+---
+
+## Long slide
+
+""" + ''.join(f"- bullet {i} with enough words to wrap onto a second line\n" for i in range(30))
+
+
+def _write(backend, capsys, **options):
+    out = io.BytesIO()
+    create_presentation(list(iter_slides(io.StringIO(DECK))), out, backend=backend,
+                        reproducible=True, **options)
+    assert 'instead' not in capsys.readouterr().out  # No fallback to python-pptx
+    return out.getvalue()
+
+
+def test_backends_write_identical_bytes(capsys):
+    assert _write('direct', capsys) == _write('pptx', capsys)
+
+
+def test_parallel_direct_deck_matches(capsys):
+    assert _write('direct', capsys, slide_jobs=2) == _write('pptx', capsys)
+
+
+def test_control_characters_leave_valid_xml(capsys):
+    from lxml import etree
+
+    with zipfile.ZipFile(io.BytesIO(_write('direct', capsys))) as zf:
+        xml = zf.read('ppt/slides/slide4.xml')
+    etree.fromstring(xml)
+    assert b'_x001B_[32mok_x001B_[0m deployed' in xml
+    assert b'ding_x0007_' in xml and b'A bell _x0007_ in a bullet' in xml
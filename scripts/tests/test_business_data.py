@@ -0,0 +1,72 @@
+"""Loading and checking the executive deck's business data"""
+
+import copy
+import json
+
+import pytest
+
+import business_data
+from business_data import load_business_data, project, returns
+
+
+@pytest.fixture(scope='module')
+def data():
+    with open(business_data.EXEC_DATA, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write(tmp_path, data):
+    path = tmp_path / 'data.json'
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_numbers_become_floats(tmp_path, data):
+    loaded = load_business_data(_write(tmp_path, data))
+    assert loaded['investment']['years'] == 3.0
+    assert isinstance(loaded['investment']['years'], float)
+
+
+@pytest.mark.parametrize('change, message', [
+    (lambda d: d['unit_economics'].update(cac=0), 'unit_economics cac must be above zero'),
+    (lambda d: d['investment'].update(amount=0), 'investment amount must be above zero'),
+    (lambda d: d['investment'].update(years=0), 'investment years must be above zero'),
+    (lambda d: d['investment'].update(stake=-5), 'investment stake must not be negative'),
+    (lambda d: d['projections'][1].update(revenue=0),
+     'projections entry 2 revenue must be above zero'),
+    (lambda d: d['projections'][0].update(users='many'),
+     'projections entry 1 users is not a number'),
+    (lambda d: d['projections'][0].update(year=1), 'projections entry 1 year is not text'),
+    (lambda d: d['revenue_streams'].append(7), 'revenue_streams entry 5 is not an object'),
+    (lambda d: d.update(investment=[15]), 'investment is not an object'),
+    (lambda d: d.update(projections={}), 'projections is not a list'),
+    (lambda d: d['unit_economics'].pop('ltv'), 'unit_economics has no ltv'),
+    (lambda d: d['revenue_streams'][0].update(description=3),
+     'revenue_streams entry 1 description is not text'),
+    (lambda d: d['investment'].update(irr='high'), 'investment irr is not a number'),
+])
+def test_bad_data_raises_value_error(tmp_path, data, change, message):
+    data = copy.deepcopy(data)
+    change(data)
+    with pytest.raises(ValueError, match=message):
+        load_business_data(_write(tmp_path, data))
+
+
+def test_top_level_must_be_an_object(tmp_path):
+    with pytest.raises(ValueError, match='expected an object of sections'):
+        load_business_data(_write(tmp_path, [1, 2]))
+
+
+def test_derived_series_are_rounded(tmp_path, data):
+    projection = project(load_business_data(_write(tmp_path, data)))
+    assert projection.profit == (2.6, 20.0, 86.8)
+    assert projection.cumulative_profit == (2.6, 22.6, 109.4)
+    assert projection.growth[0] is None
+
+
+def test_irr_is_quoted_if_given_and_worked_out_if_not(tmp_path, data):
+    assert round(returns(load_business_data(_write(tmp_path, data))).irr, 2) == 1.42
+    data = copy.deepcopy(data)
+    del data['investment']['irr']
+    del data['revenue_streams'][0]['description']
+    assert round(returns(load_business_data(_write(tmp_path, data))).irr, 2) == 0.8
@@ -0,0 +1,29 @@
+"""Fenced code blocks split into coloured runs"""
+
+import pytest
+
+from code_highlight import HAVE_PYGMENTS, add_code_runs, highlight_lines
+
+
+def test_plain_code_is_one_run_per_line():
+    assert highlight_lines('a = 1\n\nb', '', '586E75') == [
+        [('a = 1', ('586E75', False, False))], [], [('b', ('586E75', False, False))]]
+
+
+@pytest.mark.skipif(not HAVE_PYGMENTS, reason='needs Pygments')
+def test_whitespace_keeps_the_style_of_the_run_it_joins():
+    lines = highlight_lines('def f():\n    return 1', 'python', '586E75')
+    keyword = lines[0][0][1]
+    assert keyword != ('586E75', False, False)
+    assert lines[0][0] == ('def ', keyword)
+    assert ('return ', keyword) in lines[1]
+
+
+def test_control_characters_are_escaped():
+    from pptx import Presentation
+
+    prs = Presentation()
+    box = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_textbox(0, 0, 100, 100)
+    paragraph = box.text_frame.paragraphs[0]
+    add_code_runs(paragraph, '\x1b[31mred\x1b[0m', '', 12, '586E75')
+    assert '_x001B_[31mred_x001B_[0m' in box._element.xml
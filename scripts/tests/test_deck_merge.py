@@ -0,0 +1,87 @@
+"""Merging decks at the zip-member level"""
+
+import io
+import zipfile
+
+import pytest
+
+from deck_merge import SourceDeck, merge_decks, parse_input
+
+DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def _deck(path, titles):
+    from pptx import Presentation
+
+    prs = Presentation()
+    for title in titles:
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = title
+    prs.save(path)
+    return str(path)
+
+
+def _titles(data):
+    from pptx import Presentation
+
+    return [slide.shapes.title.text for slide in Presentation(io.BytesIO(data)).slides]
+
+
+def test_merge_appends_the_picked_slides(tmp_path):
+    base = _deck(tmp_path / 'base.pptx', ['Base 1', 'Base 2'])
+    other = _deck(tmp_path / 'other.pptx', ['Other 1', 'Other 2', 'Other 3'])
+    out = io.BytesIO()
+    assert merge_decks([(base, None), (other, [3, 1])], out, DATE_TIME) == 4
+
+    data = out.getvalue()
+    assert _titles(data) == ['Base 1', 'Base 2', 'Other 3', 'Other 1']
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.testzip() is None
+        assert {info.date_time for info in zf.infolist()} == {DATE_TIME}
+
+
+def test_media_is_copied_still_compressed(tmp_path):
+    from PIL import Image
+    from pptx import Presentation
+
+    picture = tmp_path / 'noise.png'
+    Image.effect_noise((64, 64), 40).save(picture)
+    prs = Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(str(picture), 0, 0)
+    prs.save(tmp_path / 'pictures.pptx')
+    base = _deck(tmp_path / 'base.pptx', ['Base'])
+    merged = tmp_path / 'merged.pptx'
+    merge_decks([(base, None), (str(tmp_path / 'pictures.pptx'), None)], str(merged))
+
+    source, output = SourceDeck(str(tmp_path / 'pictures.pptx')), SourceDeck(str(merged))
+    try:
+        media = 'ppt/media/image1.png'
+        assert source.infos[media].compress_type == zipfile.ZIP_DEFLATED
+        assert output.infos[media].compress_type == zipfile.ZIP_DEFLATED
+        assert b''.join(output.raw(media)) == b''.join(source.raw(media))
+        assert output.zip.testzip() is None
+    finally:
+        source.close()
+        output.close()
+
+
+def test_merge_is_reproducible(tmp_path):
+    base = _deck(tmp_path / 'base.pptx', ['Base'])
+    other = _deck(tmp_path / 'other.pptx', ['Other'])
+    outputs = []
+    for _ in range(2):
+        out = io.BytesIO()
+        merge_decks([(base, None), (other, None)], out, DATE_TIME)
+        outputs.append(out.getvalue())
+    assert outputs[0] == outputs[1]
+
+
+def test_base_deck_is_kept_whole(tmp_path):
+    base = _deck(tmp_path / 'base.pptx', ['Base'])
+    with pytest.raises(ValueError, match='kept whole'):
+        merge_decks([(base, [1])], io.BytesIO())
+
+
+def test_parse_input():
+    assert parse_input('tech.pptx:3-5,1') == ('tech.pptx', [3, 4, 5, 1])
+    assert parse_input('C:/decks/tech.pptx') == ('C:/decks/tech.pptx', None)
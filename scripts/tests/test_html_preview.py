@@ -0,0 +1,21 @@
+"""The static HTML preview backend"""
+
+from html_preview import image_html
+
+
+def test_embeds_real_images(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / 'dot.png'
+    Image.new('RGB', (4, 4), 'red').save(path)
+    assert image_html(str(path), 'dot').startswith('<figure><img src="data:image/png;base64,')
+
+
+def test_other_files_render_as_missing(tmp_path):
+    secret = tmp_path / 'secret.txt'
+    secret.write_text('password')
+    fake = tmp_path / 'fake.png'
+    fake.write_bytes(b'password')
+    for path in (secret, fake, tmp_path / 'absent.png', '/etc/passwd'):
+        html = image_html(str(path), 'x')
+        assert html == '<p class="missing">🖼 x (missing)</p>'
@@ -0,0 +1,109 @@
+"""Pagination of overflowing slides, and tables split across pages"""
+
+import io
+
+import pytest
+
+from convert_to_ppt import (block_height, flow_layout, iter_slides, paginate, split_table,
+                            split_text)
+from slide_ir import Bullet, Table
+
+
+def slide_from(markdown):
+    slides = list(iter_slides(io.StringIO(markdown)))
+    assert len(slides) == 1
+    return slides[0]
+
+
+def bullets(n):
+    return ''.join(f"- bullet {i}\n" for i in range(n))
+
+
+def test_short_slide_stays_one_page(geometry):
+    pages = paginate(slide_from("## T\n\n" + bullets(3)), geometry)
+    assert [p.title for p in pages] == ['T']
+
+
+def test_overflow_goes_onto_numbered_pages(geometry):
+    pages = paginate(slide_from("## T\n\n" + bullets(40)), geometry)
+    assert len(pages) > 1
+    assert pages[0].title == f"T (1/{len(pages)})"
+    assert sum(len(p.blocks) for p in pages) == 40
+
+
+def test_overflow_into_notes(geometry):
+    pages = paginate(slide_from("## T\n\n" + bullets(40)), geometry, 'notes')
+    assert len(pages) == 1
+    assert 'bullet 39' in pages[0].notes
+
+
+def test_header_only_table_after_full_page(geometry):
+    # A table with no body rows cannot be split; it moves to a page of its own
+    pages = paginate(slide_from("## T\n\n" + bullets(30) + "| Name | Value |\n|---|---|\n"),
+                     geometry)
+    tables = [b for p in pages for b in p.blocks if b.kind == 'table']
+    assert len(tables) == 1
+    assert tables[0].rows == (('Name', 'Value'),)
+    assert list(pages[-1].blocks) == [tables[0]]
+
+
+def test_long_table_splits_with_header_on_each_page(geometry):
+    rows = ''.join(f"| row {i} | {i} |\n" for i in range(60))
+    pages = paginate(slide_from("## T\n\n| Name | Value |\n|---|---|\n" + rows), geometry)
+    tables = [b for p in pages for b in p.blocks if b.kind == 'table']
+    assert len(tables) > 1
+    assert all(t.rows[0] == ('Name', 'Value') for t in tables)
+    assert [r for t in tables for r in t.rows[1:]] == [(f"row {i}", str(i)) for i in range(60)]
+
+
+def test_split_table_without_body_is_unsplittable(geometry):
+    table = Table((('Name', 'Value'),), 'll')
+    assert split_table(table, geometry, 1) == (None, table)
+
+
+def test_split_table_that_fits_has_no_rest(geometry):
+    table = Table((('Name', 'Value'), ('a', '1')), 'll')
+    assert split_table(table, geometry, geometry.height) == (table, None)
+
+
+def fits(page, geometry):
+    return sum(block_height(b, geometry) for b in page.blocks) <= geometry.height
+
+
+@pytest.mark.parametrize('before', ['', '- a bullet\n\n'])
+def test_oversized_code_block_splits_onto_pages_that_fit(geometry, before):
+    code = '\n'.join(f"line {i}" for i in range(200))
+    pages = paginate(slide_from(f"## T\n\n{before}```\n{code}\n```\n"), geometry)
+    assert len(pages) > 2
+    assert all(fits(page, geometry) for page in pages)
+    assert '\n'.join(b.code for p in pages for b in p.blocks if b.kind == 'code') == code
+
+
+def test_oversized_bullet_splits_between_words(geometry):
+    text = ' '.join(f"word{i}" for i in range(2000))
+    pages = paginate(slide_from(f"## T\n\n- {text}\n"), geometry)
+    assert len(pages) > 1
+    assert all(fits(page, geometry) for page in pages)
+    assert ' '.join(b.text for p in pages for b in p.blocks) == text
+    assert {b.kind for p in pages for b in p.blocks} == {'bullet'}
+
+
+def test_split_text_keeps_inline_markup_whole(geometry):
+    bold = Bullet('**' + ' '.join(['bold'] * 400) + '**', 1)
+    bullet = bold.replace(text=bold.text + ' plain')
+    assert split_text(bullet, geometry, 50) == (None, bullet)
+    assert split_text(bullet, geometry, block_height(bold, geometry)) == (bold,
+                                                                          Bullet('plain', 1))
+
+
+def test_code_and_the_text_after_it_get_boxes_of_their_own(geometry):
+    slide = slide_from("## T\n\nIntro\n\n```\ncode\n```\n\n- after 1\n- after 2\n\n"
+                       "```\nmore\n```\n")
+    body, boxes = flow_layout(geometry, slide.blocks)
+    assert [b.text for b in body] == ['Intro']
+    assert [[b.kind for b in box.blocks] for box in boxes] == [['code'], ['bullet', 'bullet'],
+                                                               ['code']]
+    heights = [block_height(b, geometry) for b in slide.blocks]
+    assert [box.top for box in boxes] == pytest.approx([geometry.top + sum(heights[:i])
+                                                        for i in (1, 2, 4)])
+    assert boxes[1].height == pytest.approx(heights[2] + heights[3])
@@ -0,0 +1,67 @@
+"""Inline markdown parsed into styled runs"""
+
+import pytest
+
+from convert_to_ppt import clean_markdown, parse_inline
+
+
+def styled(text):
+    return [(run.text, run.style, run.link) for run in parse_inline(text)]
+
+
+@pytest.mark.parametrize('text', [
+    'run test_*.py now',
+    'a_*b',
+    'use *_private',
+    'C:\\path\\x',
+    'x `` y',
+    '*unclosed',
+    'snake_case_name',
+    '2 * 3 * 4',
+])
+def test_text_without_markup_survives(text):
+    assert clean_markdown(text) == text
+
+
+def test_emphasis():
+    assert styled('**b** *i* _u_ __s__ ***bi***') == [
+        ('b', 'b', None), (' ', '', None), ('i', 'i', None), (' ', '', None),
+        ('u', 'i', None), (' ', '', None), ('s', 'b', None), (' ', '', None),
+        ('bi', 'bi', None)]
+
+
+def test_nested_emphasis():
+    assert styled('**bold *it* bold**') == [
+        ('bold ', 'b', None), ('it', 'bi', None), (' bold', 'b', None)]
+
+
+def test_emphasis_closes_only_with_its_own_marker():
+    assert styled('_a*b_') == [('a*b', 'i', None)]
+    assert all(style == '' for _, style, _ in styled('use *_private'))
+
+
+def test_backslash_escapes_punctuation_only():
+    assert clean_markdown('\\*lit\\* \\_x\\_ \\`y\\`') == '*lit* _x_ `y`'
+    assert clean_markdown('C:\\path\\x') == 'C:\\path\\x'
+    assert all(style == '' for _, style, _ in styled('\\*lit\\*'))
+
+
+def test_code_spans():
+    assert styled('`a` and `b`') == [('a', 'c', None), (' and ', '', None), ('b', 'c', None)]
+    assert styled('``a``') == [('a', 'c', None)]
+    assert styled('`x``y`') == [('x``y', 'c', None)]
+    assert styled('`` `a` ``') == [('`a`', 'c', None)]
+    assert styled('`**not bold**`') == [('**not bold**', 'c', None)]
+
+
+def test_links():
+    assert styled('see [the **docs**](https://example.com) now') == [
+        ('see ', '', None), ('the ', '', 'https://example.com'),
+        ('docs', 'b', 'https://example.com'), (' now', '', None)]
+    assert clean_markdown('[unclosed](link') == '[unclosed](link'
+
+
+def test_unbalanced_markers_stay_linear():
+    # Each failed search is remembered, so this returns promptly
+    text = '`' * 2000 + '[' * 2000 + '*' * 2000
+    assert clean_markdown(text) == text
@@ -0,0 +1,84 @@
+"""Request handling in the render server, without starting its workers"""
+
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import slide_ir
+from render_server import BadRequest, RenderServer, confine_images, parse_deck
+
+
+def deck_of(*paths):
+    return slide_ir.Deck([slide_ir.Slide('T', [slide_ir.Image(path, 'x') for path in paths])])
+
+
+def test_image_paths_resolve_inside_base_dir(tmp_path):
+    (tmp_path / 'img').mkdir()
+    deck = confine_images(deck_of('img/a.png', 'img/../b.png'), str(tmp_path))
+    assert [b.path for b in deck.slides[0].blocks] == [
+        str(tmp_path / 'img' / 'a.png'), str(tmp_path / 'b.png')]
+
+
+@pytest.mark.parametrize('path', ['/etc/passwd', '../secret.png', 'img/../../secret.png'])
+def test_image_paths_outside_base_dir_are_rejected(tmp_path, path):
+    base = tmp_path / 'base'
+    base.mkdir()
+    with pytest.raises(BadRequest, match='outside the base directory'):
+        confine_images(deck_of(path), str(base))
+
+
+def test_symlinks_out_of_base_dir_are_rejected(tmp_path):
+    base = tmp_path / 'base'
+    base.mkdir()
+    (base / 'link.png').symlink_to(tmp_path / 'outside.png')
+    with pytest.raises(BadRequest):
+        confine_images(deck_of('link.png'), str(base))
+
+
+def slide_json(*blocks, title='"T"'):
+    return f'["deck",[["slide",{title},[{",".join(blocks)}],null]]]'.encode()
+
+
+def test_well_formed_deck_is_parsed():
+    deck = parse_deck(slide_json('["bullet","b",1]', '["table",[["a","b"],["1","2"]],"lr"]'))
+    assert deck.slides[0].blocks[1].rows == (('a', 'b'), ('1', '2'))
+
+
+@pytest.mark.parametrize('body', [b'{not json', b'["nope"]', b'["deck",5]', b'[]'])
+def test_bad_json_is_a_bad_request(body):
+    with pytest.raises(BadRequest, match='not a slide_ir deck'):
+        parse_deck(body)
+
+
+@pytest.mark.parametrize('body, message', [
+    (slide_json(title='5'), 'title and notes must be text'),
+    (b'["deck",[["paragraph","x"]]]', 'slide 1 is a paragraph, not a slide'),
+    (slide_json('["paragraph",5]'), 'block 1 is a malformed paragraph'),
+    (slide_json('["bullet","b",-1]'), 'malformed bullet'),
+    (slide_json('["bullet","b",true]'), 'malformed bullet'),
+    (slide_json('["table",[],"l"]'), 'malformed table'),
+    (slide_json('["table",[["a","b"],["1"]],"ll"]'), 'malformed table'),
+    (slide_json('["run","x","",null]'), 'a run, which cannot go on a slide'),
+])
+def test_wrong_shape_is_a_bad_request(body, message):
+    with pytest.raises(BadRequest, match=message):
+        parse_deck(body)
+
+
+class BrokenPool:
+    def submit(self, *args):
+        raise BrokenProcessPool('worker died')
+
+
+def test_failed_dispatch_frees_its_worker():
+    server = RenderServer.__new__(RenderServer)
+    server._idle = threading.BoundedSemaphore(1)
+    server._lock = threading.Lock()
+    server.pool = BrokenPool()
+    server.restart_pool = lambda broken: None  # The "restarted" pool is broken too
+
+    assert server.wait_for_worker(0)
+    with pytest.raises(BrokenProcessPool):
+        server.dispatch('exec', b'', {})
+    assert server.wait_for_worker(0)
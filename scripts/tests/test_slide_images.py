@@ -0,0 +1,47 @@
+"""Image preparation for slides"""
+
+import io
+
+from slide_images import prepare_image
+
+
+def _open(data):
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    return img
+
+
+def test_small_native_images_are_kept_as_they_are(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / 'dot.png'
+    Image.new('RGB', (4, 4), 'red').save(path)
+    assert prepare_image(str(path), 72, 72) == (path.read_bytes(), 4, 4)
+
+
+def test_small_webp_is_reencoded(tmp_path):
+    from PIL import Image
+
+    path = tmp_path / 'dot.webp'
+    Image.new('RGBA', (4, 4), (255, 0, 0, 128)).save(path, 'WEBP')
+    data, width, height = prepare_image(str(path), 72, 72)
+    img = _open(data)
+    assert (img.format, img.mode, width, height) == ('PNG', 'RGBA', 4, 4)
+
+
+def test_cmyk_and_transparent_palette_images_are_converted(tmp_path):
+    from PIL import Image
+
+    cmyk = tmp_path / 'cmyk.tiff'
+    Image.new('CMYK', (400, 200), (0, 255, 0, 0)).save(cmyk)
+    palette = tmp_path / 'palette.gif'
+    img = Image.new('P', (400, 200), 1)
+    img.paste(0, (0, 0, 200, 200))
+    img.save(palette, transparency=0)
+
+    img = _open(prepare_image(str(cmyk), 72, 72)[0])
+    assert (img.format, img.mode, img.size) == ('JPEG', 'RGB', (150, 75))
+    img = _open(prepare_image(str(palette), 72, 72)[0])
+    assert (img.format, img.mode, img.size) == ('PNG', 'RGBA', (150, 75))
@@ -0,0 +1,39 @@
+"""Markdown pipe tables rendered by both .pptx backends"""
+
+from convert_to_ppt import parse_inline
+from ooxml_writer import SlideLinks
+from slide_tables import table_xml
+
+ROWS = (('Name', 'Link'), ('docs', '[the docs](https://example.com/docs)'),
+        ('both', '[**bold**](https://example.com/b) and [again](https://example.com/b)'))
+
+
+def test_table_xml_keeps_cell_links():
+    links = SlideLinks()
+    xml = table_xml(4, ROWS, 'll', 0, 0, 400, parse_inline, links)
+    assert links.targets == {'https://example.com/docs': 'rId2', 'https://example.com/b': 'rId3'}
+    assert xml.count('<a:hlinkClick r:id="rId2"/>') == 1
+    assert xml.count('<a:hlinkClick r:id="rId3"/>') == 2
+    assert '<a:rPr lang="en-US" sz="1200" b="1"><a:hlinkClick r:id="rId3"/></a:rPr>' in xml
+
+
+def test_add_table_keeps_cell_links():
+    from pptx import Presentation
+    from slide_tables import add_table
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_table(slide, ROWS, 'll', 0, 0, 400, parse_inline)
+    targets = sorted(rel.target_ref for rel in slide.part.rels.values() if rel.is_external)
+    assert targets == ['https://example.com/b', 'https://example.com/docs']
+    assert slide.shapes[0]._element.xml.count('a:hlinkClick') == 3
+
+
+def test_add_table_escapes_control_characters():
+    from pptx import Presentation
+    from slide_tables import add_table
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_table(slide, (('Code', 'Output'), ('bell', 'ding\x07')), 'll', 0, 0, 400, parse_inline)
+    assert '<a:t>ding_x0007_</a:t>' in slide.shapes[0]._element.xml
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Fast text layout estimates for fitting text into slide boxes
+"""
+
+import unicodedata
+from functools import lru_cache
+
+EMU_PER_PT = 12700
+
+# Helvetica advance widths for ASCII 32-126, in 1/1000 em. Slightly wider
+# than Calibri, so estimates err on the side of predicting overflow.
+_ASCII_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,  # space-/
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,  # 0-?
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,  # @-O
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,  # P-_
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,  # `-o
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,       # p-~
+)
+MONO_WIDTH = 600
+AVERAGE_WIDTH = 556
+WIDE_WIDTH = 1000
+BOLD_FACTOR = 1.05
+SPACE_WIDTH = _ASCII_WIDTHS[0]
+
+# Line pitch and default paragraph spacing as multiples of the font size
+LINE_SPACING = 1.2
+PARAGRAPH_SPACING = 0.2
+
+# Font sizes fit_sizes tries, in points: half-point steps down to a floor
+FIT_STEP = 0.5
+MIN_FIT_SIZE = 8
+
+
+@lru_cache(maxsize=4096)
+def char_width(ch, monospace=False):
+    """Advance width of one character in 1/1000 em"""
+    code = ord(ch)
+    if unicodedata.category(ch) in ('Mn', 'Me', 'Cf') or 0xFE00 <= code <= 0xFE0F:
+        return 0  # Combining marks, zero-width joiners, variation selectors
+    if unicodedata.east_asian_width(ch) in ('W', 'F') or code >= 0x1F000:
+        return WIDE_WIDTH  # CJK and emoji
+    if monospace:
+        return MONO_WIDTH
+    if 32 <= code <= 126:
+        return _ASCII_WIDTHS[code - 32]
+    return AVERAGE_WIDTH
+
+
+@lru_cache(maxsize=65536)
+def word_width(word, monospace=False):
+    """Advance width of a word in 1/1000 em"""
+    return sum(char_width(ch, monospace) for ch in word)
+
+
+def count_lines(text, size_pt, width_pt, bold=False, monospace=False):
+    """Number of lines text wraps to in a box width_pt wide (greedy word wrap)"""
+    scale = size_pt / 1000 * (BOLD_FACTOR if bold else 1)
+    limit = width_pt / scale if scale else 0
+    if limit <= 0:
+        return 1
+
+    space = MONO_WIDTH if monospace else SPACE_WIDTH
+    lines = 0
+    for line in text.split('\n'):
+        lines += 1
+        used = 0
+        for word in line.split(' '):
+            w = word_width(word, monospace)
+            if used and used + space + w <= limit:
+                used += space + w
+            elif used:
+                lines += 1
+                used = w
+            else:
+                used = w
+            if used > limit:
+                # A word longer than the line breaks across several lines
+                extra = int(used // limit)
+                lines += extra
+                used -= extra * limit
+    return lines
+
+
+def text_height(text, size_pt, width_pt, bold=False, monospace=False):
+    """Estimated height in points of a paragraph, including its spacing"""
+    lines = count_lines(text, size_pt, width_pt, bold, monospace)
+    return size_pt * (lines * LINE_SPACING + PARAGRAPH_SPACING)
+
+
+def _box_height(paragraphs, sizes, width_pt):
+    """Height in points of paragraphs at sizes, wrapped to width_pt (None: unwrapped)"""
+    height = 0
+    for (text, _, bold, space_after), size in zip(paragraphs, sizes):
+        lines = count_lines(text, size, width_pt, bold) if width_pt else text.count('\n') + 1
+        height += lines * size * LINE_SPACING + space_after
+    return height
+
+
+@lru_cache(maxsize=4096)
+def fit_sizes(paragraphs, width_pt, height_pt, wrap=True):
+    """The largest font sizes, at most those asked for, at which paragraphs fit a box
+
+    paragraphs is a tuple of (text, size_pt, bold, space_after_pt), and a
+    tuple of sizes comes back, one per paragraph, all shrunk by the same
+    factor (rounded down to FIT_STEP). Without wrap every line must fit
+    width_pt. With it the wrapped text must fit height_pt, or, in a box
+    drawn smaller than that, the height the paragraphs take unwrapped at
+    the sizes asked for. Sizes search by bisection, never below
+    MIN_FIT_SIZE, so no text is ever rendered to find them.
+    """
+    asked = tuple(size for _, size, _, _ in paragraphs)
+    largest = max(asked)
+    if wrap:
+        budget = max(height_pt, _box_height(paragraphs, asked, None))
+
+    def scaled(steps):
+        size = steps * FIT_STEP
+        return tuple(min(s, max(MIN_FIT_SIZE, (s * size / largest) // FIT_STEP * FIT_STEP))
+                     for s in asked)
+
+    def fits(sizes):
+        if wrap:
+            return _box_height(paragraphs, sizes, width_pt) <= budget
+        return all(count_lines(line, size, width_pt, bold) == 1
+                   for (text, _, bold, _), size in zip(paragraphs, sizes)
+                   for line in text.split('\n'))
+
+    if fits(asked):
+        return asked
+    low = int(-(-min(MIN_FIT_SIZE, largest) // FIT_STEP))  # Smallest step tried
+    high = int(-(-largest // FIT_STEP)) - 1                  # Largest step below largest
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(scaled(middle)):
+            low = middle
+        else:
+            high = middle - 1
+    return scaled(low)